@@ -0,0 +1,62 @@
+"""add edit_jobs table for asynchronous image edits
+
+Revision ID: 5b1f0c2d7a91
+Revises: 8bd8d4f73c6f
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "5b1f0c2d7a91"
+down_revision = "8bd8d4f73c6f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "edit_jobs",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("job_type", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("image_data", sa.LargeBinary(), nullable=True),
+        sa.Column("audio_data", sa.LargeBinary(), nullable=True),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("error_status_code", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_edit_jobs_id"), "edit_jobs", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_edit_jobs_user_id"), "edit_jobs", ["user_id"], unique=False
+    )
+    op.create_index(op.f("ix_edit_jobs_status"), "edit_jobs", ["status"], unique=False)
+    # Workers claim the oldest claimable job first
+    op.create_index(
+        "ix_edit_jobs_status_created_at",
+        "edit_jobs",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_edit_jobs_status_created_at", table_name="edit_jobs")
+    op.drop_index(op.f("ix_edit_jobs_status"), table_name="edit_jobs")
+    op.drop_index(op.f("ix_edit_jobs_user_id"), table_name="edit_jobs")
+    op.drop_index(op.f("ix_edit_jobs_id"), table_name="edit_jobs")
+    op.drop_table("edit_jobs")
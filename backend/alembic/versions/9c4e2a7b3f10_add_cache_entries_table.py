@@ -0,0 +1,40 @@
+"""add cache_entries table for the persistent result cache
+
+Revision ID: 9c4e2a7b3f10
+Revises: 5b1f0c2d7a91
+Create Date: 2026-10-16 11:03:27.540913
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9c4e2a7b3f10"
+down_revision = "5b1f0c2d7a91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_entries",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("namespace", sa.String(length=50), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("value", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "namespace", "cache_key", name="uq_cache_entries_namespace_cache_key"
+        ),
+    )
+    op.create_index(op.f("ix_cache_entries_id"), "cache_entries", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_cache_entries_id"), table_name="cache_entries")
+    op.drop_table("cache_entries")
@@ -0,0 +1,48 @@
+"""add unique index on stories (drawing_id, image_url) for story upserts
+
+Revision ID: d4a7e1c93b52
+Revises: 9c4e2a7b3f10
+Create Date: 2026-10-16 23:05:12.184305
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d4a7e1c93b52"
+down_revision = "9c4e2a7b3f10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Concurrent create-story requests could store a stored image's story twice;
+    # keep one per image (a favorite first, then the newest) before the index
+    # makes that impossible. Stories of uploads without a URL (image_url '')
+    # are separate images and are neither touched nor indexed.
+    op.execute("""
+        DELETE FROM stories
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY drawing_id, image_url
+                    ORDER BY is_favorite DESC NULLS LAST, created_at DESC, id DESC
+                ) AS position
+                FROM stories
+                WHERE drawing_id IS NOT NULL AND image_url <> ''
+            ) ranked
+            WHERE ranked.position > 1
+        )
+        """)
+    op.create_index(
+        "uq_stories_drawing_id_image_url",
+        "stories",
+        ["drawing_id", "image_url"],
+        unique=True,
+        postgresql_where=sa.text("image_url <> ''"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_stories_drawing_id_image_url", table_name="stories")
@@ -1,15 +1,44 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from src.core.config import settings
-from src.endpoints import auth, health, tutorial, image, story, edit_option, drawing
+from src.endpoints import (
+    auth,
+    health,
+    tutorial,
+    image,
+    story,
+    edit_option,
+    drawing,
+    edit_job,
+)
+from src.services.registry import services
+from src.services.story_pregeneration import story_pregenerator
+from src.utils.executor import shutdown_upstream_executor
+from src.utils.upload_ingest import UploadSizeLimitMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # Create the shared services (and their clients) before the first request
+    services.startup()
+    yield
+    # Background stories are speculative: drop them instead of waiting
+    await story_pregenerator.shutdown()
+    # Let in-flight upstream calls finish before the worker exits
+    shutdown_upstream_executor()
+    services.close()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Nova Draw AI API",
     description="Backend API for Nova Draw AI - Step-by-step drawing tutorials with AI",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for Flutter app
@@ -22,6 +51,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized multipart uploads while they are received
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(auth.router)  # Authentication endpoints
@@ -30,6 +62,7 @@ app.include_router(image.router)
 app.include_router(story.router)
 app.include_router(edit_option.router)
 app.include_router(drawing.router)  # Drawing gallery endpoints
+app.include_router(edit_job.router)  # Async edit job status
 
 
 # Run the application
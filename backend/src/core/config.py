@@ -16,6 +16,80 @@ Environment variables:
 - JWT_ALGORITHM: JWT signing algorithm (default: HS256)
 - ACCESS_TOKEN_EXPIRE_MINUTES: Access token expiry in minutes (default: 10080 = 7 days)
 - REFRESH_TOKEN_EXPIRE_DAYS: Refresh token expiry in days (default: 30)
+- UPSTREAM_EXECUTOR_MAX_WORKERS: Threads for blocking Gemini/OpenAI/Spaces calls (default: 32)
+- UPSTREAM_LIMITER_ENABLED: Adapt per-upstream concurrency to latency and 429s (default: True)
+- UPSTREAM_GEMINI_MAX_CONCURRENCY: Highest concurrency for Gemini edits (default: 16)
+- UPSTREAM_OPENAI_MAX_CONCURRENCY: Highest concurrency for OpenAI chat calls (default: 16)
+- UPSTREAM_WHISPER_MAX_CONCURRENCY: Highest concurrency for Whisper transcriptions (default: 8)
+- UPSTREAM_SPACES_MAX_CONCURRENCY: Highest concurrency for Spaces uploads/downloads (default: 32)
+- UPSTREAM_QUEUE_MAX: Calls allowed to wait for a slot per upstream (default: 64)
+- UPSTREAM_QUEUE_TIMEOUT_SECONDS: Longest wait for an upstream slot (default: 30)
+- UPSTREAM_GEMINI_TIMEOUT_SECONDS: Deadline of one Gemini edit attempt (default: 120)
+- UPSTREAM_OPENAI_TIMEOUT_SECONDS: Deadline of one OpenAI chat attempt (default: 60)
+- UPSTREAM_WHISPER_TIMEOUT_SECONDS: Deadline of one Whisper transcription attempt (default: 60)
+- UPSTREAM_SPACES_TIMEOUT_SECONDS: Deadline of one Spaces upload/download attempt (default: 20)
+- UPSTREAM_DEFAULT_TIMEOUT_SECONDS: Deadline for any other upstream (default: 60)
+- UPSTREAM_RETRY_MAX_ATTEMPTS: Attempts per upstream call, including the first (default: 3)
+- UPSTREAM_RETRY_BASE_DELAY_SECONDS: Backoff scale between retries (default: 0.5)
+- UPSTREAM_RETRY_MAX_DELAY_SECONDS: Longest backoff between retries (default: 8)
+- UPSTREAM_RETRY_BUDGET_RATIO: Retries allowed per first attempt, per upstream (default: 0.1)
+- UPSTREAM_BREAKER_FAILURE_RATE: Transient failure rate that opens a circuit (default: 0.5)
+- UPSTREAM_BREAKER_MIN_CALLS: Recent calls needed before a circuit may open (default: 10)
+- UPSTREAM_BREAKER_OPEN_SECONDS: Time a circuit stays open before a probe (default: 30)
+- UPSTREAM_HEDGE_DELAY_SECONDS: Delay before a slow download is hedged, 0 disables (default: 1.0)
+- EDIT_JOB_WORKER_CONCURRENCY: Edit jobs one worker process runs at a time (default: 4)
+- EDIT_JOB_POLL_INTERVAL_SECONDS: Worker poll interval when the queue is empty (default: 1.0)
+- EDIT_JOB_STALE_AFTER_SECONDS: Age of a job lock after which it is reclaimed (default: 300)
+- EDIT_JOB_MAX_ATTEMPTS: Attempts per edit job before it is marked failed (default: 3)
+- EDIT_CACHE_ENABLED: Reuse results of identical Gemini edits (default: True)
+- EDIT_CACHE_LOCAL_MAX_ENTRIES: Per-process LRU size of the edit cache (default: 1024)
+- EDIT_CACHE_LOCAL_TTL_SECONDS: Lifetime of local edit cache entries (default: 600)
+- EDIT_CACHE_TTL_SECONDS: Lifetime of persistent edit cache entries (default: 2592000 = 30 days)
+- IMAGE_NORMALIZATION_ENABLED: Downsize/re-encode drawings before Gemini (default: True)
+- IMAGE_NORMALIZATION_MAX_EDGE: Longest edge in pixels sent to Gemini (default: 1024)
+- IMAGE_NORMALIZATION_JPEG_QUALITY: JPEG quality of the normalized image (default: 85)
+- EDIT_BATCH_MAX_OPTIONS: Edit options accepted by one batch edit request (default: 8)
+- EDIT_BATCH_CONCURRENCY: Gemini edits of one batch request running at a time (default: 3)
+- AUDIO_TRANSCODE_MAX_CONCURRENCY: ffmpeg conversions one worker runs at a time (default: 4)
+- AUDIO_TRANSCODE_TIMEOUT_SECONDS: Longest ffmpeg conversion before it is killed (default: 30)
+- AUDIO_PREPROCESSING_ENABLED: Trim silence and re-encode voice prompts as 16 kHz mono Opus (default: True)
+- AUDIO_SILENCE_THRESHOLD_DB: Level below which leading/trailing audio is trimmed (default: -45)
+- AUDIO_SPEECH_BITRATE_KBPS: Opus bitrate of pre-processed voice prompts (default: 24)
+- TRANSCRIPTION_CACHE_ENABLED: Reuse Whisper results for identical audio clips (default: True)
+- TRANSCRIPTION_CACHE_LOCAL_MAX_ENTRIES: Per-process LRU size of the transcription cache (default: 512)
+- TRANSCRIPTION_CACHE_PERSISTENT: Also keep transcriptions in cache_entries (default: True)
+- TRANSCRIPTION_CACHE_TTL_SECONDS: Lifetime of cached transcriptions (default: 604800 = 7 days)
+- STORY_CACHE_ENABLED: Reuse stories for identical or near-identical images (default: True)
+- STORY_CACHE_LOCAL_MAX_ENTRIES: Per-process LRU size of the story cache (default: 512)
+- STORY_CACHE_PERSISTENT: Also keep stories in cache_entries (default: True)
+- STORY_CACHE_TTL_SECONDS: Lifetime of cached stories (default: 2592000 = 30 days)
+- STORY_CACHE_PHASH_MAX_DISTANCE: Max differing bits (of 256) for a near-duplicate image (default: 8, -1 = exact only)
+- SPEECH_TO_TEXT_BACKEND: Transcription backend, 'openai' (Whisper) or 'scripted' (offline stand-in) (default: openai)
+- SPEECH_TO_TEXT_SCRIPTED_DELAY_SECONDS: Simulated latency of the scripted backend (default: 1.0)
+- SPEECH_TO_TEXT_SCRIPTED_TRANSCRIPTS: '|'-separated transcripts the scripted backend returns (default: built-in)
+- STREAMING_TRANSCRIPTION_MIN_SEGMENT_SECONDS: Shortest live-recording segment sent for transcription (default: 2.0)
+- STREAMING_TRANSCRIPTION_MAX_SEGMENT_SECONDS: Segment length at which a live recording is cut without a pause (default: 6.0)
+- STREAMING_TRANSCRIPTION_MAX_SECONDS: Longest live recording (default: 60)
+- UPLOAD_MAX_IMAGE_BYTES: Largest accepted image upload (default: 16777216 = 16 MB)
+- UPLOAD_MAX_AUDIO_BYTES: Largest accepted audio upload (default: 26214400 = 25 MB, Whisper's limit)
+- UPLOAD_MAX_REQUEST_BYTES: Largest multipart request body, rejected while it is received (default: 44040192 = 42 MB)
+- UPLOAD_CHUNK_BYTES: Chunk size uploads are validated and hashed in (default: 65536)
+- STORY_GENERATION_MODE: 'combined' (one bilingual JSON call), 'parallel' (EN and DE vision calls at once) or 'translate' (EN, then a cheap DE translation) (default: combined)
+- STORY_TRANSLATION_MODEL: Model translating the English story in 'translate' mode (default: gpt-4o-mini)
+- STORY_PART_MAX_ATTEMPTS: Attempts per language when its answer cannot be parsed, in 'parallel'/'translate' mode (default: 2)
+- STORY_STREAM_TIMEOUT_SECONDS: Deadline of a whole streamed story answer, after the stream is opened (default: 180)
+- STORY_VISION_INPUT_ENABLED: Downsize/re-encode images before story generation (default: True)
+- STORY_VISION_MAX_EDGE: Longest edge in pixels of the image sent to the story model (default: 512)
+- STORY_VISION_FORMAT: Encoding of that image, 'jpeg' or 'webp' (default: jpeg)
+- STORY_VISION_QUALITY: JPEG/WebP quality of that image (default: 80)
+- STORY_VISION_DETAIL: OpenAI image detail level, 'low', 'high' or 'auto' (default: low)
+- STORY_PREGENERATION_ENABLED: Generate the story of every edited image in the background (default: False)
+- STORY_PREGENERATION_MAX_CONCURRENCY: Background stories generated at a time per process (default: 1)
+- STORY_PREGENERATION_MAX_PENDING: Background stories scheduled at most per process (default: 20)
+- STORY_PREGENERATION_USER_BUDGET: Background stories per user per budget window (default: 10)
+- STORY_PREGENERATION_BUDGET_WINDOW_SECONDS: Length of the per-user budget window (default: 3600)
+- STORY_PREGENERATION_LOAD_THRESHOLD: Share of the OpenAI chat limit used by interactive calls above which background stories wait or are cancelled (default: 0.5)
+- STORY_PREGENERATION_MAX_WAIT_SECONDS: How long a background story waits for low load before it is dropped (default: 120)
 
 Usage:
     from core.config import settings
@@ -95,6 +169,260 @@ class Settings(BaseSettings):
     USE_CREDENTIALS: bool = os.getenv("USE_CREDENTIALS", "True").lower() == "true"
     VALIDATE_CERTS: bool = os.getenv("VALIDATE_CERTS", "True").lower() == "true"
 
+    # Upstream Execution
+    # Blocking SDK calls (Gemini, OpenAI, Spaces) run in this many worker threads,
+    # so one API worker can keep many edits in flight without blocking the event loop
+    UPSTREAM_EXECUTOR_MAX_WORKERS: int = int(
+        os.getenv("UPSTREAM_EXECUTOR_MAX_WORKERS", "32")
+    )
+
+    # Upstream Concurrency Limits
+    # Each upstream's concurrency adapts between 1 and its maximum (AIMD on 429s
+    # and latency); callers beyond the limit wait in a bounded queue
+    UPSTREAM_LIMITER_ENABLED: bool = (
+        os.getenv("UPSTREAM_LIMITER_ENABLED", "True").lower() == "true"
+    )
+    UPSTREAM_GEMINI_MAX_CONCURRENCY: int = int(
+        os.getenv("UPSTREAM_GEMINI_MAX_CONCURRENCY", "16")
+    )
+    UPSTREAM_OPENAI_MAX_CONCURRENCY: int = int(
+        os.getenv("UPSTREAM_OPENAI_MAX_CONCURRENCY", "16")
+    )
+    UPSTREAM_WHISPER_MAX_CONCURRENCY: int = int(
+        os.getenv("UPSTREAM_WHISPER_MAX_CONCURRENCY", "8")
+    )
+    UPSTREAM_SPACES_MAX_CONCURRENCY: int = int(
+        os.getenv("UPSTREAM_SPACES_MAX_CONCURRENCY", "32")
+    )
+    UPSTREAM_QUEUE_MAX: int = int(os.getenv("UPSTREAM_QUEUE_MAX", "64"))
+    UPSTREAM_QUEUE_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_QUEUE_TIMEOUT_SECONDS", "30")
+    )
+
+    # Upstream Resilience
+    # Every attempt has a deadline (also set on the SDK clients, whose own retries
+    # are disabled); transient failures are retried within a per-upstream budget
+    # and a circuit breaker fails calls fast while an upstream keeps failing
+    UPSTREAM_GEMINI_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_GEMINI_TIMEOUT_SECONDS", "120")
+    )
+    UPSTREAM_OPENAI_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_OPENAI_TIMEOUT_SECONDS", "60")
+    )
+    UPSTREAM_WHISPER_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_WHISPER_TIMEOUT_SECONDS", "60")
+    )
+    UPSTREAM_SPACES_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_SPACES_TIMEOUT_SECONDS", "20")
+    )
+    UPSTREAM_DEFAULT_TIMEOUT_SECONDS: float = float(
+        os.getenv("UPSTREAM_DEFAULT_TIMEOUT_SECONDS", "60")
+    )
+    UPSTREAM_RETRY_MAX_ATTEMPTS: int = int(
+        os.getenv("UPSTREAM_RETRY_MAX_ATTEMPTS", "3")
+    )
+    UPSTREAM_RETRY_BASE_DELAY_SECONDS: float = float(
+        os.getenv("UPSTREAM_RETRY_BASE_DELAY_SECONDS", "0.5")
+    )
+    UPSTREAM_RETRY_MAX_DELAY_SECONDS: float = float(
+        os.getenv("UPSTREAM_RETRY_MAX_DELAY_SECONDS", "8")
+    )
+    UPSTREAM_RETRY_BUDGET_RATIO: float = float(
+        os.getenv("UPSTREAM_RETRY_BUDGET_RATIO", "0.1")
+    )
+    UPSTREAM_BREAKER_FAILURE_RATE: float = float(
+        os.getenv("UPSTREAM_BREAKER_FAILURE_RATE", "0.5")
+    )
+    UPSTREAM_BREAKER_MIN_CALLS: int = int(os.getenv("UPSTREAM_BREAKER_MIN_CALLS", "10"))
+    UPSTREAM_BREAKER_OPEN_SECONDS: float = float(
+        os.getenv("UPSTREAM_BREAKER_OPEN_SECONDS", "30")
+    )
+    # Slow Spaces downloads get a second request after this delay (budget permitting)
+    UPSTREAM_HEDGE_DELAY_SECONDS: float = float(
+        os.getenv("UPSTREAM_HEDGE_DELAY_SECONDS", "1.0")
+    )
+
+    # Edit Job Queue
+    # Async-mode edits are stored in the edit_jobs table and processed by worker.py
+    EDIT_JOB_WORKER_CONCURRENCY: int = int(
+        os.getenv("EDIT_JOB_WORKER_CONCURRENCY", "4")
+    )
+    EDIT_JOB_POLL_INTERVAL_SECONDS: float = float(
+        os.getenv("EDIT_JOB_POLL_INTERVAL_SECONDS", "1.0")
+    )
+    # A running job whose worker stopped heartbeating for this long is claimed again
+    EDIT_JOB_STALE_AFTER_SECONDS: int = int(
+        os.getenv("EDIT_JOB_STALE_AFTER_SECONDS", "300")
+    )
+    EDIT_JOB_MAX_ATTEMPTS: int = int(os.getenv("EDIT_JOB_MAX_ATTEMPTS", "3"))
+
+    # Edit Result Cache
+    # Identical edits (same image bytes, prompt, subject, language, model and user)
+    # reuse the edited image already stored in Spaces instead of calling Gemini
+    EDIT_CACHE_ENABLED: bool = os.getenv("EDIT_CACHE_ENABLED", "True").lower() == "true"
+    EDIT_CACHE_LOCAL_MAX_ENTRIES: int = int(
+        os.getenv("EDIT_CACHE_LOCAL_MAX_ENTRIES", "1024")
+    )
+    # Bounds how long another process can serve a URL whose image was deleted
+    EDIT_CACHE_LOCAL_TTL_SECONDS: int = int(
+        os.getenv("EDIT_CACHE_LOCAL_TTL_SECONDS", "600")
+    )
+    EDIT_CACHE_TTL_SECONDS: int = int(os.getenv("EDIT_CACHE_TTL_SECONDS", "2592000"))
+
+    # Image Normalization
+    # Drawings are EXIF-rotated, stripped of metadata, capped to this edge length
+    # and re-encoded as JPEG before they are sent to Gemini
+    IMAGE_NORMALIZATION_ENABLED: bool = (
+        os.getenv("IMAGE_NORMALIZATION_ENABLED", "True").lower() == "true"
+    )
+    IMAGE_NORMALIZATION_MAX_EDGE: int = int(
+        os.getenv("IMAGE_NORMALIZATION_MAX_EDGE", "1024")
+    )
+    IMAGE_NORMALIZATION_JPEG_QUALITY: int = int(
+        os.getenv("IMAGE_NORMALIZATION_JPEG_QUALITY", "85")
+    )
+
+    # Batch Edits
+    # One drawing edited with several edit options; the fan-out to Gemini is
+    # bounded per request so a single batch cannot take over the upstream executor
+    EDIT_BATCH_MAX_OPTIONS: int = int(os.getenv("EDIT_BATCH_MAX_OPTIONS", "8"))
+    EDIT_BATCH_CONCURRENCY: int = int(os.getenv("EDIT_BATCH_CONCURRENCY", "3"))
+
+    # Audio Transcoding
+    # Voice prompts Whisper cannot read (AAC) are piped through ffmpeg in memory;
+    # each conversion is a CPU-bound subprocess, so their number is capped
+    AUDIO_TRANSCODE_MAX_CONCURRENCY: int = int(
+        os.getenv("AUDIO_TRANSCODE_MAX_CONCURRENCY", "4")
+    )
+    AUDIO_TRANSCODE_TIMEOUT_SECONDS: float = float(
+        os.getenv("AUDIO_TRANSCODE_TIMEOUT_SECONDS", "30")
+    )
+    # Voice prompts are cut to the spoken part and sent to Whisper at its own
+    # 16 kHz mono input rate as low-bitrate Opus, instead of 44.1 kHz stereo
+    AUDIO_PREPROCESSING_ENABLED: bool = (
+        os.getenv("AUDIO_PREPROCESSING_ENABLED", "True").lower() == "true"
+    )
+    AUDIO_SILENCE_THRESHOLD_DB: float = float(
+        os.getenv("AUDIO_SILENCE_THRESHOLD_DB", "-45")
+    )
+    AUDIO_SPEECH_BITRATE_KBPS: int = int(os.getenv("AUDIO_SPEECH_BITRATE_KBPS", "24"))
+
+    # Transcription Cache
+    # Identical voice clips (same bytes, language and Whisper model) are only
+    # transcribed once; the persistent tier shares results across processes
+    TRANSCRIPTION_CACHE_ENABLED: bool = (
+        os.getenv("TRANSCRIPTION_CACHE_ENABLED", "True").lower() == "true"
+    )
+    TRANSCRIPTION_CACHE_LOCAL_MAX_ENTRIES: int = int(
+        os.getenv("TRANSCRIPTION_CACHE_LOCAL_MAX_ENTRIES", "512")
+    )
+    TRANSCRIPTION_CACHE_PERSISTENT: bool = (
+        os.getenv("TRANSCRIPTION_CACHE_PERSISTENT", "True").lower() == "true"
+    )
+    TRANSCRIPTION_CACHE_TTL_SECONDS: int = int(
+        os.getenv("TRANSCRIPTION_CACHE_TTL_SECONDS", "604800")
+    )
+
+    # Story Cache
+    # Identical images (same bytes and story model) and near-duplicates (close
+    # perceptual hash) reuse an earlier story instead of calling GPT-4o again
+    STORY_CACHE_ENABLED: bool = (
+        os.getenv("STORY_CACHE_ENABLED", "True").lower() == "true"
+    )
+    STORY_CACHE_LOCAL_MAX_ENTRIES: int = int(
+        os.getenv("STORY_CACHE_LOCAL_MAX_ENTRIES", "512")
+    )
+    STORY_CACHE_PERSISTENT: bool = (
+        os.getenv("STORY_CACHE_PERSISTENT", "True").lower() == "true"
+    )
+    STORY_CACHE_TTL_SECONDS: int = int(os.getenv("STORY_CACHE_TTL_SECONDS", "2592000"))
+    STORY_CACHE_PHASH_MAX_DISTANCE: int = int(
+        os.getenv("STORY_CACHE_PHASH_MAX_DISTANCE", "8")
+    )
+
+    # Speech-to-Text
+    # 'scripted' returns canned transcripts after a fixed delay, so voice flows
+    # can be load-tested offline (see scripts/benchmark_voice_flows.py)
+    SPEECH_TO_TEXT_BACKEND: str = os.getenv("SPEECH_TO_TEXT_BACKEND", "openai")
+    SPEECH_TO_TEXT_SCRIPTED_DELAY_SECONDS: float = float(
+        os.getenv("SPEECH_TO_TEXT_SCRIPTED_DELAY_SECONDS", "1.0")
+    )
+    SPEECH_TO_TEXT_SCRIPTED_TRANSCRIPTS: str = os.getenv(
+        "SPEECH_TO_TEXT_SCRIPTED_TRANSCRIPTS", ""
+    )
+
+    # Streaming Transcription
+    # Live recordings (WebSocket) are cut at pauses into segments that are
+    # transcribed while the child is still speaking
+    STREAMING_TRANSCRIPTION_MIN_SEGMENT_SECONDS: float = float(
+        os.getenv("STREAMING_TRANSCRIPTION_MIN_SEGMENT_SECONDS", "2.0")
+    )
+    STREAMING_TRANSCRIPTION_MAX_SEGMENT_SECONDS: float = float(
+        os.getenv("STREAMING_TRANSCRIPTION_MAX_SEGMENT_SECONDS", "6.0")
+    )
+    STREAMING_TRANSCRIPTION_MAX_SECONDS: float = float(
+        os.getenv("STREAMING_TRANSCRIPTION_MAX_SECONDS", "60")
+    )
+
+    # Uploads
+    # Files are validated (magic number, size, image dimensions) chunk by chunk
+    # and only read into memory once they passed; bigger bodies are cut off early
+    UPLOAD_MAX_IMAGE_BYTES: int = int(os.getenv("UPLOAD_MAX_IMAGE_BYTES", "16777216"))
+    UPLOAD_MAX_AUDIO_BYTES: int = int(os.getenv("UPLOAD_MAX_AUDIO_BYTES", "26214400"))
+    UPLOAD_MAX_REQUEST_BYTES: int = int(
+        os.getenv("UPLOAD_MAX_REQUEST_BYTES", "44040192")
+    )
+    UPLOAD_CHUNK_BYTES: int = int(os.getenv("UPLOAD_CHUNK_BYTES", "65536"))
+
+    # Story Generation
+    # 'parallel' and 'translate' generate each language in its own call, so the
+    # English story is ready sooner and a malformed answer only repeats one half
+    STORY_GENERATION_MODE: str = os.getenv("STORY_GENERATION_MODE", "combined")
+    STORY_TRANSLATION_MODEL: str = os.getenv("STORY_TRANSLATION_MODEL", "gpt-4o-mini")
+    STORY_PART_MAX_ATTEMPTS: int = int(os.getenv("STORY_PART_MAX_ATTEMPTS", "2"))
+    # UPSTREAM_OPENAI_TIMEOUT_SECONDS covers opening a streamed answer; reading
+    # all of its tokens gets this longer deadline
+    STORY_STREAM_TIMEOUT_SECONDS: float = float(
+        os.getenv("STORY_STREAM_TIMEOUT_SECONDS", "180")
+    )
+
+    # Story Vision Input
+    # A story needs the subject and mood of a drawing, not 2048 px of detail: the
+    # image is downsized and re-encoded, and 'low' detail is a flat 85 tokens
+    # (see scripts/benchmark_story_vision_input.py)
+    STORY_VISION_INPUT_ENABLED: bool = (
+        os.getenv("STORY_VISION_INPUT_ENABLED", "True").lower() == "true"
+    )
+    STORY_VISION_MAX_EDGE: int = int(os.getenv("STORY_VISION_MAX_EDGE", "512"))
+    STORY_VISION_FORMAT: str = os.getenv("STORY_VISION_FORMAT", "jpeg")
+    STORY_VISION_QUALITY: int = int(os.getenv("STORY_VISION_QUALITY", "80"))
+    STORY_VISION_DETAIL: str = os.getenv("STORY_VISION_DETAIL", "low")
+
+    # Story Pre-generation
+    # Opt-in: stories of edited images are generated speculatively in the
+    # background, within a per-user budget and only while interactive load is low
+    STORY_PREGENERATION_ENABLED: bool = (
+        os.getenv("STORY_PREGENERATION_ENABLED", "False").lower() == "true"
+    )
+    STORY_PREGENERATION_MAX_CONCURRENCY: int = int(
+        os.getenv("STORY_PREGENERATION_MAX_CONCURRENCY", "1")
+    )
+    STORY_PREGENERATION_MAX_PENDING: int = int(
+        os.getenv("STORY_PREGENERATION_MAX_PENDING", "20")
+    )
+    STORY_PREGENERATION_USER_BUDGET: int = int(
+        os.getenv("STORY_PREGENERATION_USER_BUDGET", "10")
+    )
+    STORY_PREGENERATION_BUDGET_WINDOW_SECONDS: float = float(
+        os.getenv("STORY_PREGENERATION_BUDGET_WINDOW_SECONDS", "3600")
+    )
+    STORY_PREGENERATION_LOAD_THRESHOLD: float = float(
+        os.getenv("STORY_PREGENERATION_LOAD_THRESHOLD", "0.5")
+    )
+    STORY_PREGENERATION_MAX_WAIT_SECONDS: float = float(
+        os.getenv("STORY_PREGENERATION_MAX_WAIT_SECONDS", "120")
+    )
+
     class Config:
         """Pydantic configuration"""
 
@@ -0,0 +1,70 @@
+"""
+In-process metrics for the entire backend application.
+
+A small registry of counters, gauges and observations (count/sum/min/max) that
+services update on their hot paths and GET /metrics exposes as JSON. Values are
+per process (each uvicorn or edit worker keeps its own registry).
+
+Usage:
+    from src.core.metrics import metrics
+
+    metrics.increment("edit_cache.misses")
+    metrics.set_gauge("edit_cache.local_size", 42)
+    metrics.observe("gemini.edit_seconds", 12.4)
+"""
+
+import threading
+from typing import Dict, Any
+
+
+class MetricsRegistry:
+    """Thread-safe registry of named counters, gauges and observations"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._observations: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Add `amount` to a counter (created at 0 on first use)."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to its current value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record one observation (e.g. a duration in seconds)."""
+        with self._lock:
+            stats = self._observations.get(name)
+            if stats is None:
+                self._observations[name] = {
+                    "count": 1,
+                    "sum": value,
+                    "min": value,
+                    "max": value,
+                }
+                return
+            stats["count"] += 1
+            stats["sum"] += value
+            stats["min"] = min(stats["min"], value)
+            stats["max"] = max(stats["max"], value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of all metrics."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "observations": {
+                    name: dict(stats) for name, stats in self._observations.items()
+                },
+            }
+
+
+# Global metrics registry
+# Import this in your modules to record metrics
+metrics = MetricsRegistry()
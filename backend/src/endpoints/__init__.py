@@ -11,6 +11,7 @@ from . import image
 from . import story
 from . import edit_option
 from . import drawing
+from . import edit_job
 
 __all__ = [
     "auth",
@@ -20,4 +21,5 @@ __all__ = [
     "story",
     "edit_option",
     "drawing",
+    "edit_job",
 ]
@@ -14,6 +14,7 @@ from src.database import get_db
 from src.models import User
 from src.services import AuthService
 from src.services.drawing_gallery_service import DrawingGalleryService
+from src.services.registry import get_drawing_gallery_service
 from src.schemas import DrawingResponse, DrawingListResponse
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,9 @@ async def get_user_gallery(
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    drawing_gallery_service: DrawingGalleryService = Depends(
+        get_drawing_gallery_service
+    ),
 ):
     """
     Get user's drawing gallery with pagination.
@@ -46,9 +50,6 @@ async def get_user_gallery(
     try:
         logger.info(f"📸 Fetching gallery for user: {current_user.id}")
 
-        # Initialize service
-        drawing_gallery_service = DrawingGalleryService()
-
         # Delegate to service layer
         result = await drawing_gallery_service.get_user_gallery(
             db=db,
@@ -89,6 +90,9 @@ async def get_drawing(
     drawing_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    drawing_gallery_service: DrawingGalleryService = Depends(
+        get_drawing_gallery_service
+    ),
 ):
     """
     Get a specific drawing by ID.
@@ -107,9 +111,6 @@ async def get_drawing(
     try:
         logger.info(f"📸 Fetching drawing: {drawing_id}")
 
-        # Initialize service
-        drawing_gallery_service = DrawingGalleryService()
-
         # Delegate to service layer
         drawing = await drawing_gallery_service.get_drawing(
             db=db,
@@ -139,6 +140,9 @@ async def delete_drawing(
     drawing_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    drawing_gallery_service: DrawingGalleryService = Depends(
+        get_drawing_gallery_service
+    ),
 ):
     """
     Delete a drawing by ID.
@@ -158,9 +162,6 @@ async def delete_drawing(
     try:
         logger.info(f"🗑️  Deleting drawing: {drawing_id}")
 
-        # Initialize service
-        drawing_gallery_service = DrawingGalleryService()
-
         # Delegate to service layer
         result = await drawing_gallery_service.delete_drawing(
             db=db,
@@ -191,6 +192,9 @@ async def delete_drawing_image(
     image_url: str,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    drawing_gallery_service: DrawingGalleryService = Depends(
+        get_drawing_gallery_service
+    ),
 ):
     """
     Delete a specific image from a drawing by URL.
@@ -213,9 +217,6 @@ async def delete_drawing_image(
     try:
         logger.info(f"🗑️  Deleting image from drawing: {drawing_id}")
 
-        # Initialize service
-        drawing_gallery_service = DrawingGalleryService()
-
         # Delegate to service layer
         result = await drawing_gallery_service.delete_drawing_image(
             db=db,
@@ -243,6 +244,9 @@ async def delete_drawing_image(
 async def get_gallery_stats(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    drawing_gallery_service: DrawingGalleryService = Depends(
+        get_drawing_gallery_service
+    ),
 ):
     """
     Get summary statistics about user's drawings.
@@ -258,9 +262,6 @@ async def get_gallery_stats(
     try:
         logger.info(f"📊 Fetching gallery stats for user: {current_user.id}")
 
-        # Initialize service
-        drawing_gallery_service = DrawingGalleryService()
-
         # Delegate to service layer
         result = await drawing_gallery_service.get_gallery_stats(
             db=db,
@@ -0,0 +1,45 @@
+"""
+Edit job endpoints for asynchronous image edits.
+
+Handles HTTP requests/responses for polling jobs created by the edit endpoints
+in async mode. Delegates business logic to EditJobService.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from src.database import get_db
+from src.models import User
+from src.services import AuthService, EditJobService
+from src.schemas import EditJobResponse
+from src.core.logger import logger
+
+router = APIRouter(prefix="/api", tags=["edit-jobs"])
+
+
+@router.get("/edit-jobs/{job_id}", response_model=EditJobResponse)
+async def get_edit_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user),
+):
+    """
+    Get the status of an asynchronous image edit.
+
+    Once the job has succeeded, `result` holds exactly what the synchronous
+    endpoint would have returned. Failed jobs carry `error` and the HTTP status
+    code the synchronous endpoint would have used.
+
+    **Authentication Required:** User must be logged in.
+    """
+
+    try:
+        job = await EditJobService.get_job_status(db, job_id, current_user.id)
+        return EditJobResponse(**job)
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get edit job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get edit job: {str(e)}")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
-from src.schemas import HealthResponse
+from src.schemas import HealthResponse, MetricsResponse
 from src.core.logger import logger
+from src.core.metrics import metrics
 
 router = APIRouter()
 
@@ -16,3 +17,9 @@ async def health_check():
     """Health check endpoint"""
     logger.info("Health check endpoint=============================")
     return {"status": "healthy", "message": "API is running"}
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics():
+    """In-process metrics of this API worker (cache hits/misses, ...)"""
+    return metrics.snapshot()
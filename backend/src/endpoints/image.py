@@ -1,28 +1,115 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
+import asyncio
+import base64
+import json
+import time
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    UploadFile,
+    File,
+    Form,
+    Depends,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional
-from src.schemas import ImageProcessResponse, EditImageWithAudioResponse
+from src.schemas import (
+    ImageProcessResponse,
+    EditImageWithAudioResponse,
+    EditJobResponse,
+    BatchEditResponse,
+    BatchEditOptionResult,
+)
 from src.services.image_processing_service import ImageProcessingService
-from src.services import AuthService
-from src.models import User
+from src.services.registry import get_image_processing_service, services
+from src.services import AuthService, EditJobService
+from src.services.streaming_transcription import StreamingTranscription
+from src.models import User, EditJob
+from src.database import async_session, get_db
 from src.core.config import settings
-from src.database import get_db
 from src.core.logger import logger
+from src.utils.progress import ProgressCallback, report_progress
+from src.utils.sse import stream_progress, terminal_event
+from src.utils.upload_ingest import ingest_upload
+from src.utils.upstream_limiter import UpstreamUnavailableError
 
 router = APIRouter(prefix="/api", tags=["images"])
 
-# Initialize services
-image_processing_service = None
-if settings.GOOGLE_API_KEY and settings.OPENAI_API_KEY:
-    try:
-        image_processing_service = ImageProcessingService()
-    except Exception as e:
-        logger.warning(f"Could not initialize image processing service: {e}")
+ASYNC_MODE_DESCRIPTION = (
+    "Return 202 with a job id immediately and process the edit in the background "
+    "(poll GET /api/edit-jobs/{job_id} for the result)"
+)
+
+STREAM_DESCRIPTION = (
+    "Respond with a text/event-stream of progress events (validated, "
+    "original_uploaded, transcribed, upstream_started, result_stored, db_saved) "
+    "followed by a final 'result' or 'error' event"
+)
+
+STREAM_RESPONSE = {
+    "description": "Progress events when stream=true",
+    "content": {"text/event-stream": {}},
+}
+
+# A live recording connection that stays silent this long is closed
+LIVE_RECORDING_IDLE_TIMEOUT_SECONDS = 30.0
+
+
+async def read_upload(upload: UploadFile, kind: str) -> bytes:
+    """
+    Read an uploaded image or audio file after it passed ingest_upload()'s checks.
+
+    The magic number, byte limit and (for images) pixel size are checked chunk
+    by chunk, so an invalid or oversized file is rejected before it is buffered.
+    """
 
+    ingested = await ingest_upload(upload, kind)
+    return await ingested.read()
 
-@router.post("/edit-image", response_model=ImageProcessResponse)
+
+def check_response_mode(async_mode: bool, stream: bool) -> None:
+    """Reject requests that ask for both a queued job and a progress stream."""
+
+    if async_mode and stream:
+        raise HTTPException(
+            status_code=400, detail="Use either 'async_mode' or 'stream', not both"
+        )
+
+
+async def enqueue_edit_job(
+    db: AsyncSession,
+    user_id: UUID,
+    job_type: str,
+    params: dict,
+    image_data: bytes = None,
+    audio_data: bytes = None,
+) -> JSONResponse:
+    """Queue an edit for the worker processes and return a 202 response."""
+
+    job = await EditJobService.enqueue_job(
+        db,
+        user_id=user_id,
+        job_type=job_type,
+        params=params,
+        image_data=image_data,
+        audio_data=audio_data,
+    )
+    return JSONResponse(
+        status_code=202, content=EditJobResponse(**job).model_dump(mode="json")
+    )
+
+
+@router.post(
+    "/edit-image",
+    response_model=ImageProcessResponse,
+    responses={202: {"model": EditJobResponse}, 200: STREAM_RESPONSE},
+)
 async def edit_image(
+    request: Request,
     prompt: str = Form(
         ..., description="Processing instruction (e.g., 'make it alive')"
     ),
@@ -44,8 +131,13 @@ async def edit_image(
         None,
         description="UUID of existing drawing to append edit to (optional for re-editing)",
     ),
+    async_mode: bool = Form(False, description=ASYNC_MODE_DESCRIPTION),
+    stream: bool = Form(False, description=STREAM_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    image_processing_service: ImageProcessingService = Depends(
+        get_image_processing_service
+    ),
 ):
     """
     Edit an image with AI using a text prompt.
@@ -56,16 +148,15 @@ async def edit_image(
     Supports prompts like 'make it alive', 'make it colorful', etc.
     Saves the edited image to the database.
 
+    Set stream=true to receive progress as Server-Sent Events instead of waiting
+    for the final JSON response.
+
     **Authentication Required:** User must be logged in.
     """
 
     try:
         # Check if image processing service is available
-        if not image_processing_service:
-            raise HTTPException(
-                status_code=503,
-                detail="Image processing service not available. Please configure both Google and OpenAI API keys.",
-            )
+        check_response_mode(async_mode, stream)
 
         # Validate that either image file or image_url is provided
         if not image and not image_url:
@@ -85,32 +176,57 @@ async def edit_image(
                 )
 
             # Read image data
-            image_data = await image.read()
+            image_data = await read_upload(image, "image")
 
         # Use authenticated user's ID
         user_id = current_user.id
 
-        # Delegate all business logic to the service layer
-        result = await image_processing_service.edit_image_with_prompt(
-            db=db,
-            prompt=prompt,
-            subject=subject,
-            user_id=user_id,
-            tutorial_id=UUID(tutorial_id) if tutorial_id else None,
-            drawing_id=UUID(drawing_id) if drawing_id else None,
-            image_data=image_data,
-            image_url=image_url,
-        )
+        if async_mode:
+            return await enqueue_edit_job(
+                db,
+                user_id=user_id,
+                job_type=EditJob.TYPE_EDIT_IMAGE,
+                params={
+                    "prompt": prompt,
+                    "subject": subject,
+                    "image_url": image_url,
+                    "tutorial_id": str(UUID(tutorial_id)) if tutorial_id else None,
+                    "drawing_id": str(UUID(drawing_id)) if drawing_id else None,
+                },
+                image_data=image_data,
+            )
 
-        return ImageProcessResponse(
-            success="true",
-            prompt=prompt,
-            original_image_url=result["original_image_url"],
-            edited_image_url=result["edited_image_url"],
-            processing_time=result["processing_time"],
-            drawing_id=result["drawing_id"],
-            user_id=str(user_id),
-        )
+        async def run_edit(on_progress: ProgressCallback = None):
+            # Delegate all business logic to the service layer
+            result = await image_processing_service.edit_image_with_prompt(
+                db=db,
+                prompt=prompt,
+                subject=subject,
+                user_id=user_id,
+                tutorial_id=UUID(tutorial_id) if tutorial_id else None,
+                drawing_id=UUID(drawing_id) if drawing_id else None,
+                image_data=image_data,
+                image_url=image_url,
+                on_progress=on_progress,
+            )
+
+            return ImageProcessResponse(
+                success="true",
+                prompt=prompt,
+                original_image_url=result["original_image_url"],
+                edited_image_url=result["edited_image_url"],
+                processing_time=result["processing_time"],
+                stage_timings=result["stage_timings"],
+                drawing_id=result["drawing_id"],
+                user_id=str(user_id),
+            )
+
+        if stream:
+            return stream_progress(
+                request, run_edit, error_prefix="Failed to edit image"
+            )
+
+        return await run_edit()
 
     except ValueError as e:
         logger.error(f"Failed to edit image: {str(e)}")
@@ -120,13 +236,145 @@ async def edit_image(
         logger.error(f"Failed to edit image: {str(e)}")
         # Re-raise HTTP exceptions
         raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to edit image: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to edit image: {str(e)}")
 
 
-@router.post("/edit-image-with-audio", response_model=EditImageWithAudioResponse)
+@router.post(
+    "/edit-image/batch",
+    response_model=BatchEditResponse,
+    responses={200: STREAM_RESPONSE},
+)
+async def batch_edit_image(
+    request: Request,
+    edit_option_ids: str = Form(
+        ..., description="Comma-separated UUIDs of the edit options to apply"
+    ),
+    image: UploadFile = File(
+        None, description="Image file to edit (optional if drawing_id is provided)"
+    ),
+    drawing_id: str = Form(
+        None,
+        description="UUID of existing drawing to edit and append the results to (optional if image is provided)",
+    ),
+    image_url: str = Form(
+        None,
+        description="URL of a specific image of the drawing to edit (defaults to the drawing's original)",
+    ),
+    language: str = Form("en", description="Prompt language: 'en' or 'de'"),
+    subject: str = Form(
+        None,
+        description="What the child drew (defaults to the subject of each edit option's tutorial)",
+    ),
+    tutorial_id: str = Form(
+        None, description="UUID of the tutorial associated with a new drawing"
+    ),
+    stream: bool = Form(
+        False,
+        description=(
+            "Respond with a text/event-stream that reports each option as soon as it "
+            "finishes ('option_result' events), followed by a final 'result' or 'error' event"
+        ),
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user),
+    image_processing_service: ImageProcessingService = Depends(
+        get_image_processing_service
+    ),
+):
+    """
+    Apply several edit options to one drawing in a single request.
+
+    The image (uploaded file or the drawing's stored image) is read and stored once,
+    the edits run in parallel with a bounded concurrency, and all edited images are
+    appended to the drawing in one database write. An option that fails is reported
+    in its result and does not fail the others.
+
+    Set stream=true to receive each option's result as soon as it is ready.
+
+    **Authentication Required:** User must be logged in.
+    """
+
+    try:
+        if not image and not drawing_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Either 'image' or 'drawing_id' must be provided",
+            )
+
+        option_ids = [
+            UUID(option_id.strip())
+            for option_id in edit_option_ids.split(",")
+            if option_id.strip()
+        ]
+
+        image_data = None
+        if image:
+            if not image.content_type or not image.content_type.startswith("image/"):
+                raise HTTPException(
+                    status_code=400, detail="File must be an image (JPEG, PNG, etc.)"
+                )
+            image_data = await read_upload(image, "image")
+
+        user_id = current_user.id
+
+        async def run_batch(on_progress: ProgressCallback = None):
+            result = await image_processing_service.batch_edit_with_options(
+                db=db,
+                user_id=user_id,
+                edit_option_ids=option_ids,
+                language=language,
+                subject=subject,
+                tutorial_id=UUID(tutorial_id) if tutorial_id else None,
+                drawing_id=UUID(drawing_id) if drawing_id else None,
+                image_data=image_data,
+                image_url=image_url,
+                on_progress=on_progress,
+            )
+
+            return BatchEditResponse(
+                success="true",
+                drawing_id=result["drawing_id"],
+                original_image_url=result["original_image_url"],
+                results=[BatchEditOptionResult(**r) for r in result["results"]],
+                processing_time=result["processing_time"],
+                stage_timings=result["stage_timings"],
+                user_id=str(user_id),
+            )
+
+        if stream:
+            return stream_progress(
+                request, run_batch, error_prefix="Failed to batch edit image"
+            )
+
+        return await run_batch()
+
+    except ValueError as e:
+        logger.error(f"Failed to batch edit image: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to batch edit image: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to batch edit image: {str(e)}"
+        )
+
+
+@router.post(
+    "/edit-image-with-audio",
+    response_model=EditImageWithAudioResponse,
+    responses={202: {"model": EditJobResponse}, 200: STREAM_RESPONSE},
+)
 async def edit_image_with_audio(
+    request: Request,
     audio: UploadFile = File(
         ...,
         description="Audio file (mp3, wav, m4a, aac, webm, ogg, flac) with editing instructions",
@@ -150,8 +398,13 @@ async def edit_image_with_audio(
         None,
         description="UUID of existing drawing to append edit to (optional for re-editing)",
     ),
+    async_mode: bool = Form(False, description=ASYNC_MODE_DESCRIPTION),
+    stream: bool = Form(False, description=STREAM_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    image_processing_service: ImageProcessingService = Depends(
+        get_image_processing_service
+    ),
 ):
     """
     Edit an image using voice instructions from an audio file.
@@ -169,16 +422,15 @@ async def edit_image_with_audio(
     Supports multiple audio formats: mp3, wav, m4a, aac, webm, ogg, flac
     Languages: English ('en') and German ('de')
 
+    Set stream=true to receive progress as Server-Sent Events instead of waiting
+    for the final JSON response.
+
     **Authentication Required:** User must be logged in.
     """
 
     try:
         # Check if image service are available
-        if not image_processing_service:
-            raise HTTPException(
-                status_code=503,
-                detail="Image processing service not available. Please configure both Google and OpenAI API keys.",
-            )
+        check_response_mode(async_mode, stream)
 
         # Validate that either image or image_url is provided
         if not image and not image_url:
@@ -205,37 +457,64 @@ async def edit_image_with_audio(
                 )
 
             # Read image data
-            image_data = await image.read()
+            image_data = await read_upload(image, "image")
 
         # Read audio data
-        audio_data = await audio.read()
+        audio_data = await read_upload(audio, "audio")
 
         # Use authenticated user's ID
         user_id = current_user.id
 
-        # Delegate all business logic to the service layer
-        result = await image_processing_service.edit_image_with_audio(
-            db=db,
-            audio_data=audio_data,
-            audio_filename=audio.filename or "audio.mp3",
-            language=language,
-            subject=subject,
-            user_id=user_id,
-            tutorial_id=UUID(tutorial_id) if tutorial_id else None,
-            drawing_id=UUID(drawing_id) if drawing_id else None,
-            image_data=image_data,
-            image_url=image_url,
-        )
+        if async_mode:
+            return await enqueue_edit_job(
+                db,
+                user_id=user_id,
+                job_type=EditJob.TYPE_EDIT_IMAGE_WITH_AUDIO,
+                params={
+                    "language": language,
+                    "subject": subject,
+                    "image_url": image_url,
+                    "audio_filename": audio.filename or "audio.mp3",
+                    "tutorial_id": str(UUID(tutorial_id)) if tutorial_id else None,
+                    "drawing_id": str(UUID(drawing_id)) if drawing_id else None,
+                },
+                image_data=image_data,
+                audio_data=audio_data,
+            )
 
-        return EditImageWithAudioResponse(
-            success="true",
-            transcribed_text=result["transcribed_text"],
-            original_image_url=result["original_image_url"],
-            edited_image_url=result["edited_image_url"],
-            processing_time=result["processing_time"],
-            drawing_id=result["drawing_id"],
-            user_id=str(user_id),
-        )
+        async def run_edit(on_progress: ProgressCallback = None):
+            # Delegate all business logic to the service layer
+            result = await image_processing_service.edit_image_with_audio(
+                db=db,
+                audio_data=audio_data,
+                audio_filename=audio.filename or "audio.mp3",
+                language=language,
+                subject=subject,
+                user_id=user_id,
+                tutorial_id=UUID(tutorial_id) if tutorial_id else None,
+                drawing_id=UUID(drawing_id) if drawing_id else None,
+                image_data=image_data,
+                image_url=image_url,
+                on_progress=on_progress,
+            )
+
+            return EditImageWithAudioResponse(
+                success="true",
+                transcribed_text=result["transcribed_text"],
+                original_image_url=result["original_image_url"],
+                edited_image_url=result["edited_image_url"],
+                processing_time=result["processing_time"],
+                stage_timings=result["stage_timings"],
+                drawing_id=result["drawing_id"],
+                user_id=str(user_id),
+            )
+
+        if stream:
+            return stream_progress(
+                request, run_edit, error_prefix="Failed to process audio and image"
+            )
+
+        return await run_edit()
 
     except ValueError as e:
         # Handle validation errors
@@ -243,6 +522,9 @@ async def edit_image_with_audio(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to process audio and image: {str(e)}")
         raise HTTPException(
@@ -250,8 +532,221 @@ async def edit_image_with_audio(
         )
 
 
-@router.post("/direct-upload", response_model=ImageProcessResponse)
+@router.websocket("/edit-image-with-audio/live")
+async def edit_image_with_live_audio(websocket: WebSocket):
+    """
+    Edit an image with a voice instruction that is transcribed while it is recorded.
+
+    The recording is cut at pauses and transcribed segment by segment while the
+    child speaks (see src/services/streaming_transcription.py), so the prompt is
+    ready right after recording stops and the Gemini edit starts at once.
+
+    Protocol (control messages are JSON text, audio is sent as binary messages):
+    1. Client: {"type": "start", "token": "<access token>", "language": "en",
+       "sample_rate": 16000, "subject": ..., "image_url" or "image_base64": ...,
+       "tutorial_id": ..., "drawing_id": ...}
+    2. Server: {"event": "ready", "data": {}}
+    3. Client: the recording as binary messages of 16-bit little-endian mono PCM.
+       Server: {"event": "partial_transcript", "data": {"text": ..., "segments": n}}
+       whenever the transcript grows
+    4. Client: {"type": "stop"} when recording ends ({"type": "cancel"} aborts)
+    5. Server: 'transcribed', the edit's progress events (original_uploaded,
+       upstream_started, result_stored, db_saved, ...) and finally 'result'
+       (EditImageWithAudioResponse) or 'error' ({"status_code": ..., "detail": ...}),
+       then closes the connection
+
+    **Authentication Required:** access token in the start message.
+    """
+
+    await websocket.accept()
+
+    async def send_event(event: str, data: dict) -> None:
+        await websocket.send_text(
+            json.dumps({"event": event, "data": data}, default=str)
+        )
+
+    async def fail(status_code: int, detail: str) -> None:
+        logger.warning(f"⚠️ Live recording failed ({status_code}): {detail}")
+        try:
+            await send_event("error", {"status_code": status_code, "detail": detail})
+            await websocket.close()
+        except Exception:
+            # The client is already gone
+            pass
+
+    async def receive_control() -> dict:
+        message = await asyncio.wait_for(
+            websocket.receive(), LIVE_RECORDING_IDLE_TIMEOUT_SECONDS
+        )
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        return message
+
+    transcription = None
+    try:
+        try:
+            image_processing_service = services.image_processing
+        except ValueError:
+            return await fail(
+                503,
+                "Image processing service not available. Please configure both Google and OpenAI API keys.",
+            )
+
+        message = await receive_control()
+        start = json.loads(message.get("text") or "{}")
+        if start.get("type") != "start":
+            return await fail(400, "The first message must be a 'start' message")
+
+        async with async_session() as db:
+            current_user = await AuthService.verify_user_token(
+                start.get("token") or "", db
+            )
+        if not current_user:
+            return await fail(401, "Invalid token. Please log in again.")
+        user_id = current_user.id
+
+        language = start.get("language") or "en"
+        subject = start.get("subject")
+        image_url = start.get("image_url")
+        image_base64 = start.get("image_base64") or ""
+        # Same limit as ingest_upload(), checked before anything is decoded
+        if len(image_base64) * 3 // 4 > settings.UPLOAD_MAX_IMAGE_BYTES:
+            return await fail(
+                413,
+                "Image too large "
+                f"(max {settings.UPLOAD_MAX_IMAGE_BYTES / (1024 * 1024):g}MB)",
+            )
+        image_data = base64.b64decode(image_base64) if image_base64 else None
+        tutorial_id = UUID(start["tutorial_id"]) if start.get("tutorial_id") else None
+        drawing_id = UUID(start["drawing_id"]) if start.get("drawing_id") else None
+
+        if not image_data and not image_url:
+            return await fail(
+                400, "Either 'image_base64' or 'image_url' must be provided"
+            )
+        # Reject a bad image before the child starts talking
+        if image_data and not image_processing_service.validate_image(image_data):
+            return await fail(400, "Invalid image or image too large (max 2048x2048)")
+
+        transcription = StreamingTranscription(
+            image_processing_service.audio_service,
+            language,
+            sample_rate=int(start.get("sample_rate") or 16000),
+            on_progress=send_event,
+        )
+        await send_event("ready", {})
+        logger.info(f"🎙️ Live recording started (user: {user_id})")
+
+        # Step 1: Receive the recording; segments are transcribed as they complete
+        while True:
+            message = await receive_control()
+            if message.get("bytes"):
+                transcription.feed(message["bytes"])
+                continue
+
+            control = json.loads(message.get("text") or "{}")
+            if control.get("type") == "stop":
+                break
+            if control.get("type") == "cancel":
+                logger.info("🛑 Live recording cancelled by the client")
+                transcription.cancel()
+                await websocket.close()
+                return
+
+        logger.info(
+            f"🎙️ Live recording stopped after {transcription.seconds_received:.1f}s"
+        )
+
+        async def run_edit(on_progress: ProgressCallback = None):
+            # Step 2: Only the last segment is usually still being transcribed
+            wait_start = time.time()
+            transcribed_text = await transcription.finish()
+            transcribe_wait = time.time() - wait_start
+            logger.info(
+                f"🎤 Transcribed Text: '{transcribed_text}' "
+                f"({transcribe_wait:.2f}s after recording stopped)"
+            )
+            await report_progress(
+                on_progress, "transcribed", transcribed_text=transcribed_text
+            )
+
+            # Step 3: The regular prompt edit (process_image, upload, save)
+            async with async_session() as db:
+                result = await image_processing_service.edit_image_with_prompt(
+                    db=db,
+                    prompt=transcribed_text,
+                    subject=subject,
+                    user_id=user_id,
+                    tutorial_id=tutorial_id,
+                    drawing_id=drawing_id,
+                    image_data=image_data,
+                    image_url=image_url,
+                    language=language,
+                    on_progress=on_progress,
+                )
+
+            stage_timings = {"transcribe": round(transcribe_wait, 3)}
+            stage_timings.update(result["stage_timings"])
+            if "total" in stage_timings:
+                stage_timings["total"] = round(
+                    stage_timings["total"] + transcribe_wait, 3
+                )
+
+            return EditImageWithAudioResponse(
+                success="true",
+                transcribed_text=transcribed_text,
+                original_image_url=result["original_image_url"],
+                edited_image_url=result["edited_image_url"],
+                processing_time=result["processing_time"] + transcribe_wait,
+                stage_timings=stage_timings,
+                drawing_id=result["drawing_id"],
+                user_id=str(user_id),
+            )
+
+        # Run the edit while watching for the client going away
+        task = asyncio.create_task(run_edit(send_event))
+        receiver = asyncio.create_task(websocket.receive())
+        try:
+            while not task.done():
+                done, _ = await asyncio.wait(
+                    {task, receiver}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if receiver in done:
+                    if receiver.result()["type"] == "websocket.disconnect":
+                        logger.info("🔌 Client disconnected, cancelling edit")
+                        return
+                    # Anything sent after 'stop' is ignored
+                    receiver = asyncio.create_task(websocket.receive())
+        finally:
+            receiver.cancel()
+            if not task.done():
+                task.cancel()
+
+        await send_event(*terminal_event(task, "Failed to process audio and image"))
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info("🔌 Client disconnected during live recording")
+    except asyncio.TimeoutError:
+        await fail(408, "No message received in time")
+    except ValueError as e:
+        # Invalid JSON, ids or base64, or a recording that is too long
+        await fail(400, str(e))
+    except Exception as e:
+        logger.error(f"Failed to process live audio: {str(e)}")
+        await fail(500, f"Failed to process audio and image: {str(e)}")
+    finally:
+        if transcription:
+            transcription.cancel()
+
+
+@router.post(
+    "/direct-upload",
+    response_model=ImageProcessResponse,
+    responses={202: {"model": EditJobResponse}, 200: STREAM_RESPONSE},
+)
 async def direct_upload(
+    request: Request,
     subject: str = Form(
         ..., description="What did you draw? (e.g., 'train', 'dog', 'flower')"
     ),
@@ -259,8 +754,13 @@ async def direct_upload(
         ..., description="What should we do with it? (e.g., 'make it fly')"
     ),
     image: UploadFile = File(..., description="The drawing image file"),
+    async_mode: bool = Form(False, description=ASYNC_MODE_DESCRIPTION),
+    stream: bool = Form(False, description=STREAM_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    image_processing_service: ImageProcessingService = Depends(
+        get_image_processing_service
+    ),
 ):
     """
     Direct upload with text prompt: Upload any drawing and tell us what to do with it.
@@ -273,14 +773,13 @@ async def direct_upload(
     2. Upload the drawing → image file
     3. "What should we do with it?" → prompt (text)
 
+    Set stream=true to receive progress as Server-Sent Events instead of waiting
+    for the final JSON response.
+
     **Authentication Required:** User must be logged in.
     """
     try:
-        if not image_processing_service:
-            raise HTTPException(
-                status_code=503,
-                detail="Image processing service not available. Please configure both Google and OpenAI API keys.",
-            )
+        check_response_mode(async_mode, stream)
 
         # Validate image file type
         if not image.content_type or not image.content_type.startswith("image/"):
@@ -288,32 +787,54 @@ async def direct_upload(
                 status_code=400, detail="File must be an image (JPEG, PNG, etc.)"
             )
 
-        image_data = await image.read()
+        image_data = await read_upload(image, "image")
         user_id = current_user.id
 
-        result = await image_processing_service.process_direct_upload(
-            db=db,
-            subject=subject,
-            user_id=user_id,
-            image_data=image_data,
-            prompt=prompt,
-        )
+        if async_mode:
+            return await enqueue_edit_job(
+                db,
+                user_id=user_id,
+                job_type=EditJob.TYPE_DIRECT_UPLOAD,
+                params={"subject": subject, "prompt": prompt},
+                image_data=image_data,
+            )
 
-        return ImageProcessResponse(
-            success="true",
-            prompt=result["prompt"],
-            original_image_url=result["original_image_url"],
-            edited_image_url=result["edited_image_url"],
-            processing_time=result["processing_time"],
-            drawing_id=result["drawing_id"],
-            user_id=str(user_id),
-        )
+        async def run_upload(on_progress: ProgressCallback = None):
+            result = await image_processing_service.process_direct_upload(
+                db=db,
+                subject=subject,
+                user_id=user_id,
+                image_data=image_data,
+                prompt=prompt,
+                on_progress=on_progress,
+            )
+
+            return ImageProcessResponse(
+                success="true",
+                prompt=result["prompt"],
+                original_image_url=result["original_image_url"],
+                edited_image_url=result["edited_image_url"],
+                processing_time=result["processing_time"],
+                stage_timings=result["stage_timings"],
+                drawing_id=result["drawing_id"],
+                user_id=str(user_id),
+            )
+
+        if stream:
+            return stream_progress(
+                request, run_upload, error_prefix="Failed to process direct upload"
+            )
+
+        return await run_upload()
 
     except ValueError as e:
         logger.error(f"Direct upload validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to process direct upload: {str(e)}")
         raise HTTPException(
@@ -321,8 +842,13 @@ async def direct_upload(
         )
 
 
-@router.post("/direct-upload-audio", response_model=ImageProcessResponse)
+@router.post(
+    "/direct-upload-audio",
+    response_model=ImageProcessResponse,
+    responses={202: {"model": EditJobResponse}, 200: STREAM_RESPONSE},
+)
 async def direct_upload_with_audio(
+    request: Request,
     subject: str = Form(
         ..., description="What did you draw? (e.g., 'train', 'dog', 'flower')"
     ),
@@ -333,8 +859,13 @@ async def direct_upload_with_audio(
     language: str = Form(
         "en", description="Language for audio transcription: 'en' or 'de'"
     ),
+    async_mode: bool = Form(False, description=ASYNC_MODE_DESCRIPTION),
+    stream: bool = Form(False, description=STREAM_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    image_processing_service: ImageProcessingService = Depends(
+        get_image_processing_service
+    ),
 ):
     """
     Direct upload with voice prompt: Upload any drawing and tell us what to do with it using voice.
@@ -347,14 +878,13 @@ async def direct_upload_with_audio(
     2. Upload the drawing → image file
     3. "What should we do with it?" → audio (voice recording)
 
+    Set stream=true to receive progress as Server-Sent Events instead of waiting
+    for the final JSON response.
+
     **Authentication Required:** User must be logged in.
     """
     try:
-        if not image_processing_service:
-            raise HTTPException(
-                status_code=503,
-                detail="Image processing service not available. Please configure both Google and OpenAI API keys.",
-            )
+        check_response_mode(async_mode, stream)
 
         # Validate image file type
         if not image.content_type or not image.content_type.startswith("image/"):
@@ -368,35 +898,62 @@ async def direct_upload_with_audio(
                 status_code=400, detail="Could not determine audio file type"
             )
 
-        image_data = await image.read()
-        audio_data = await audio.read()
+        image_data = await read_upload(image, "image")
+        audio_data = await read_upload(audio, "audio")
         user_id = current_user.id
 
-        result = await image_processing_service.process_direct_upload(
-            db=db,
-            subject=subject,
-            user_id=user_id,
-            image_data=image_data,
-            audio_data=audio_data,
-            audio_filename=audio.filename or "audio.mp3",
-            language=language,
-        )
+        if async_mode:
+            return await enqueue_edit_job(
+                db,
+                user_id=user_id,
+                job_type=EditJob.TYPE_DIRECT_UPLOAD_AUDIO,
+                params={
+                    "subject": subject,
+                    "language": language,
+                    "audio_filename": audio.filename or "audio.mp3",
+                },
+                image_data=image_data,
+                audio_data=audio_data,
+            )
 
-        return ImageProcessResponse(
-            success="true",
-            prompt=result["prompt"],
-            original_image_url=result["original_image_url"],
-            edited_image_url=result["edited_image_url"],
-            processing_time=result["processing_time"],
-            drawing_id=result["drawing_id"],
-            user_id=str(user_id),
-        )
+        async def run_upload(on_progress: ProgressCallback = None):
+            result = await image_processing_service.process_direct_upload(
+                db=db,
+                subject=subject,
+                user_id=user_id,
+                image_data=image_data,
+                audio_data=audio_data,
+                audio_filename=audio.filename or "audio.mp3",
+                language=language,
+                on_progress=on_progress,
+            )
+
+            return ImageProcessResponse(
+                success="true",
+                prompt=result["prompt"],
+                original_image_url=result["original_image_url"],
+                edited_image_url=result["edited_image_url"],
+                processing_time=result["processing_time"],
+                stage_timings=result["stage_timings"],
+                drawing_id=result["drawing_id"],
+                user_id=str(user_id),
+            )
+
+        if stream:
+            return stream_progress(
+                request, run_upload, error_prefix="Failed to process direct upload"
+            )
+
+        return await run_upload()
 
     except ValueError as e:
         logger.error(f"Direct upload audio validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to process direct upload with audio: {str(e)}")
         raise HTTPException(
@@ -1,68 +1,224 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import UploadFile
+from typing import Optional, Tuple
 from uuid import UUID
 from src.schemas import StoryRequest, StoryResponse
 from src.services.story_service import StoryService
+from src.services.registry import get_story_service
 from src.services import AuthService
 from src.models import User
 from src.core.config import settings
 from src.database import get_db
 from src.core.logger import logger
+from src.utils.progress import ProgressCallback
+from src.utils.sse import stream_progress
+from src.utils.upload_ingest import ingest_upload, read_body
+from src.utils.upstream_limiter import UpstreamUnavailableError
 
 router = APIRouter(prefix="/api", tags=["stories"])
 
+# Request bodies accepted by /create-story (documented by hand, since the body is
+# parsed according to its Content-Type)
+STORY_FORM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "image": {"type": "string", "format": "binary"},
+        "drawing_id": {"type": "string"},
+        "image_url": {"type": "string"},
+        "image_index": {"type": "integer", "minimum": 0},
+        "regenerate": {"type": "boolean"},
+    },
+}
+STORY_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {"schema": STORY_FORM_SCHEMA},
+        "image/png": {"schema": {"type": "string", "format": "binary"}},
+        "image/jpeg": {"schema": {"type": "string", "format": "binary"}},
+        "image/webp": {"schema": {"type": "string", "format": "binary"}},
+        "application/json": {"schema": StoryRequest.model_json_schema()},
+    },
+}
 
-@router.post("/create-story", response_model=StoryResponse)
+
+async def read_story_request(
+    http_request: Request,
+    drawing_id: Optional[str],
+    image_url: Optional[str],
+    image_index: Optional[int],
+    regenerate: bool = False,
+) -> Tuple[StoryRequest, Optional[bytes]]:
+    """
+    Parse a create-story request body according to its Content-Type.
+
+    - multipart/form-data: `image` file plus drawing_id, image_url, image_index
+      and regenerate fields
+    - image/* or application/octet-stream: the body is the image; the other
+      fields come from the query parameters
+    - anything else: JSON StoryRequest (base64 `image`), kept as a fallback
+
+    Returns:
+        Tuple of (request fields, raw image bytes or None)
+
+    Raises:
+        RequestValidationError: If the fields are invalid (422)
+        HTTPException: If the image is not valid (400) or too large (413)
+    """
+
+    content_type = http_request.headers.get("content-type", "").lower()
+    image_data = None
+
+    try:
+        if content_type.startswith("multipart/form-data"):
+            form = await http_request.form()
+            image = form.get("image")
+            if isinstance(image, UploadFile):
+                image_data = await (await ingest_upload(image, "image")).read()
+            fields = {
+                key: form.get(key)
+                for key in ("drawing_id", "image_url", "image_index", "regenerate")
+                if form.get(key)
+            }
+            request = StoryRequest(**fields)
+
+        elif content_type.startswith(("image/", "application/octet-stream")):
+            image_data = await read_body(http_request, "image")
+            request = StoryRequest(
+                drawing_id=drawing_id,
+                image_url=image_url,
+                image_index=image_index,
+                regenerate=regenerate,
+            )
+
+        else:
+            request = StoryRequest.model_validate_json(await http_request.body())
+
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    return request, image_data
+
+
+def story_response(result: dict) -> StoryResponse:
+    """Build the create-story response from StoryService.create_story's result."""
+
+    return StoryResponse(
+        success="true",
+        title_en=result["title_en"],
+        title_de=result["title_de"],
+        story_text_en=result["story_text_en"],
+        story_text_de=result["story_text_de"],
+        generation_time=result["generation_time"],
+        story_id=result["story_id"],
+        image_url=result["image_url"] or None,
+    )
+
+
+@router.post(
+    "/create-story",
+    response_model=StoryResponse,
+    responses={
+        200: {
+            "description": "Progress events when stream=true",
+            "content": {"text/event-stream": {}},
+        }
+    },
+    openapi_extra={"requestBody": STORY_REQUEST_BODY},
+)
 async def create_story(
-    request: StoryRequest,
+    http_request: Request,
+    stream: bool = Query(
+        False,
+        description=(
+            "Respond with a text/event-stream of progress events (validated, "
+            "upstream_started, story_generated, db_saved) followed by a final "
+            "'result' or 'error' event"
+        ),
+    ),
+    drawing_id: Optional[str] = Query(
+        None, description="UUID of the drawing (raw image bodies only)"
+    ),
+    image_url: Optional[str] = Query(
+        None, description="URL of the image in Spaces (raw image bodies only)"
+    ),
+    image_index: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Image of the drawing to use (raw image bodies only)",
+    ),
+    regenerate: bool = Query(
+        False,
+        description="Skip the story cache (raw image bodies only)",
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    story_service: StoryService = Depends(get_story_service),
 ):
     """
     Generate a children's story (ages 4-7) from an image in both English and German.
-    Supports two modes:
-    1. Upload image as base64 (request.image provided)
-    2. Use image URL from Spaces (request.image_url provided)
+    The image can be sent as:
+    1. A multipart `image` file, or the raw image as the body (Content-Type image/*)
+    2. An image of a stored drawing (drawing_id and image_index: 0 is the
+       original, 1 the first edit, ...), resolved and downloaded on the server
+    3. An image URL from Spaces (image_url)
+    4. Base64 in a JSON body (request.image), kept for older clients
+
+    Raw and multipart images reach the model without a base64 round trip.
 
     Saves the generated story to the database and links it to a drawing if drawing_id provided.
+    A story cached for the same image is returned unless regenerate is set.
+
+    Set stream=true to receive progress as Server-Sent Events instead of waiting
+    for the final JSON response.
 
     **Authentication Required:** User must be logged in.
     """
 
     try:
-        # Initialize story service
-        story_service = StoryService()
+        request, image_data = await read_story_request(
+            http_request, drawing_id, image_url, image_index, regenerate
+        )
 
         # Use authenticated user's ID instead of request user_id
         # This ensures users can only create stories for themselves
         user_id = current_user.id
 
-        # Delegate all business logic to the service layer
-        result = await story_service.create_story(
-            db=db,
-            image_base64=request.image,
-            user_id=user_id,
-            drawing_id=UUID(request.drawing_id) if request.drawing_id else None,
-            image_url=request.image_url or "",
-        )
+        async def run_story(on_progress: ProgressCallback = None):
+            # Delegate all business logic to the service layer
+            result = await story_service.create_story(
+                db=db,
+                image_base64=request.image,
+                user_id=user_id,
+                drawing_id=UUID(request.drawing_id) if request.drawing_id else None,
+                image_url=request.image_url or "",
+                on_progress=on_progress,
+                image_data=image_data,
+                image_index=request.image_index,
+                regenerate=request.regenerate,
+            )
 
-        return StoryResponse(
-            success="true",
-            title_en=result["title_en"],
-            title_de=result["title_de"],
-            story_text_en=result["story_text_en"],
-            story_text_de=result["story_text_de"],
-            generation_time=result["generation_time"],
-            story_id=result["story_id"],
-            image_url=request.image_url,
-        )
+            return story_response(result)
+
+        if stream:
+            return stream_progress(
+                http_request, run_story, error_prefix="Failed to generate story"
+            )
+
+        return await run_story()
 
     except ValueError as e:
         # Handle validation errors
         raise HTTPException(status_code=400, detail=str(e))
-    except HTTPException:
-        # Re-raise HTTP exceptions
+    except (HTTPException, RequestValidationError):
+        # Re-raise HTTP and request validation errors
         raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"⚠️ {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to generate story: {str(e)}")
         raise HTTPException(
@@ -70,12 +226,84 @@ async def create_story(
         )
 
 
+@router.post(
+    "/create-story/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Story tokens, titles, paragraphs and progress events",
+            "content": {"text/event-stream": {}},
+        }
+    },
+    openapi_extra={"requestBody": STORY_REQUEST_BODY},
+)
+async def create_story_stream(
+    http_request: Request,
+    drawing_id: Optional[str] = Query(
+        None, description="UUID of the drawing (raw image bodies only)"
+    ),
+    image_url: Optional[str] = Query(
+        None, description="URL of the image in Spaces (raw image bodies only)"
+    ),
+    image_index: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Image of the drawing to use (raw image bodies only)",
+    ),
+    regenerate: bool = Query(
+        False,
+        description="Skip the story cache (raw image bodies only)",
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user),
+    story_service: StoryService = Depends(get_story_service),
+):
+    """
+    Generate a story like /create-story, streaming it while it is written.
+
+    Accepts the same request bodies as /create-story. Responds with a
+    text/event-stream of:
+    - story_token: each piece of text as it arrives (language, text)
+    - story_title: a title as soon as it is complete (language, title)
+    - story_paragraph: a paragraph as soon as it is complete (language, index, text)
+    - the progress events of /create-story?stream=true (validated,
+      upstream_started, story_generated, db_saved, ...)
+    - a final 'result' event with the saved story, or an 'error' event
+
+    **Authentication Required:** User must be logged in.
+    """
+
+    request, image_data = await read_story_request(
+        http_request, drawing_id, image_url, image_index, regenerate
+    )
+
+    async def run_story(on_progress: ProgressCallback):
+        result = await story_service.create_story(
+            db=db,
+            image_base64=request.image,
+            user_id=current_user.id,
+            drawing_id=UUID(request.drawing_id) if request.drawing_id else None,
+            image_url=request.image_url or "",
+            on_progress=on_progress,
+            image_data=image_data,
+            image_index=request.image_index,
+            regenerate=request.regenerate,
+            stream_tokens=True,
+        )
+        return story_response(result)
+
+    return stream_progress(
+        http_request, run_story, error_prefix="Failed to generate story"
+    )
+
+
 @router.get("/drawings/{drawing_id}/stories")
 async def get_story_for_image(
     drawing_id: UUID,
     image_url: str = Query(..., description="URL of the image"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user),
+    story_service: StoryService = Depends(get_story_service),
 ):
     """
     Get a specific story for a drawing and image URL.
@@ -94,9 +322,6 @@ async def get_story_for_image(
     try:
         logger.info(f"📖 Fetching story for drawing {drawing_id} and image {image_url}")
 
-        # Initialize service
-        story_service = StoryService()
-
         # Delegate to service layer
         result = await story_service.get_story_for_image(
             db=db,
@@ -8,6 +8,8 @@ This module exports all database models:
 - Drawing: User-created drawings
 - Story: AI-generated stories from drawings
 - EditOption: AI editing options for subjects (e.g., "Make it colorful")
+- EditJob: Queued image edits processed asynchronously by worker processes
+- CacheEntry: Persistent cache tier for expensive upstream results
 
 All models use decorators for:
 - @auditable: Automatic timestamp tracking and soft delete
@@ -35,5 +37,16 @@ from .tutorial_step import TutorialStep
 from .drawing import Drawing
 from .story import Story
 from .edit_option import EditOption
+from .edit_job import EditJob
+from .cache_entry import CacheEntry
 
-__all__ = ["User", "Tutorial", "TutorialStep", "Drawing", "Story", "EditOption"]
+__all__ = [
+    "User",
+    "Tutorial",
+    "TutorialStep",
+    "Drawing",
+    "Story",
+    "EditOption",
+    "EditJob",
+    "CacheEntry",
+]
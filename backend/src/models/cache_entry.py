@@ -0,0 +1,61 @@
+"""
+CacheEntry model for Nova Draw AI application.
+
+Represents one entry of the persistent cache tier shared by all API and worker
+processes. Entries are grouped by namespace (e.g. "gemini_edit") and looked up by
+a content hash, so expensive upstream results can be reused across processes and
+restarts. Values are small JSON documents (typically pointers to objects already
+stored in Spaces), never the binary payloads themselves.
+"""
+
+from sqlalchemy import Column, String, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import uuid
+
+from src.database.db import Base
+from src.utils import auditable, crud_enabled
+
+
+@crud_enabled
+@auditable
+class CacheEntry(Base):
+    """
+    CacheEntry model representing one cached value.
+
+    Decorators:
+    - @auditable: Adds created_at, updated_at for audit trail
+    - @crud_enabled: Adds CRUD operations (create, get_by_id, get_all, get_paginated, update, delete, count, exists)
+    """
+
+    __tablename__ = "cache_entries"
+    __table_args__ = (
+        UniqueConstraint(
+            "namespace", "cache_key", name="uq_cache_entries_namespace_cache_key"
+        ),
+    )
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+
+    # Lookup
+    namespace = Column(String(50), nullable=False)  # e.g. "gemini_edit"
+    cache_key = Column(String(64), nullable=False)  # sha256 hex digest
+
+    # Cached value
+    value = Column(JSONB, nullable=False)
+    expires_at = Column(DateTime, nullable=True)  # None = never expires
+
+    # Note: created_at, updated_at are automatically added by @auditable
+    #
+    # CRUD operations added by @crud_enabled decorator:
+    # - CacheEntry.create(db, **kwargs) -> CacheEntry
+    # - CacheEntry.get_by_id(db, id) -> CacheEntry | None
+    # - CacheEntry.get_all(db) -> List[CacheEntry]
+    # - CacheEntry.get_paginated(db, page, limit) -> Dict
+    # - CacheEntry.update(db, id, updates) -> CacheEntry | None
+    # - CacheEntry.delete(db, id) -> bool
+    # - CacheEntry.count(db) -> int
+    # - CacheEntry.exists(db, id) -> bool
+
+    def __repr__(self):
+        return f"<CacheEntry(namespace={self.namespace}, cache_key={self.cache_key})>"
@@ -0,0 +1,110 @@
+"""
+EditJob model for Nova Draw AI application.
+
+Represents a queued image edit that is processed asynchronously by a worker process.
+
+Why this table exists:
+- Lets the edit endpoints return immediately in "async mode" instead of holding the
+  HTTP connection open for the whole transcribe → Gemini → Spaces → DB pipeline
+- Makes edits durable: a job survives API restarts and is retried if a worker dies
+- Lets API nodes and worker nodes scale independently (workers claim jobs with
+  SELECT ... FOR UPDATE SKIP LOCKED, so many workers can poll the same table)
+"""
+
+from sqlalchemy import (
+    Column,
+    String,
+    Text,
+    Integer,
+    DateTime,
+    LargeBinary,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+import uuid
+
+from src.database.db import Base
+from src.utils import auditable, crud_enabled
+
+
+@crud_enabled
+@auditable
+class EditJob(Base):
+    """
+    EditJob model representing one asynchronous image edit.
+
+    Lifecycle: queued → running → succeeded | failed
+    A running job whose worker stopped heartbeating (locked_at too old) is
+    claimed again by another worker until max_attempts is reached.
+
+    Decorators:
+    - @auditable: Adds created_at, updated_at for audit trail
+    - @crud_enabled: Adds CRUD operations (create, get_by_id, get_all, get_paginated, update, delete, count, exists)
+    """
+
+    __tablename__ = "edit_jobs"
+
+    # Job types (one per edit endpoint)
+    TYPE_EDIT_IMAGE = "edit_image"
+    TYPE_EDIT_IMAGE_WITH_AUDIO = "edit_image_with_audio"
+    TYPE_DIRECT_UPLOAD = "direct_upload"
+    TYPE_DIRECT_UPLOAD_AUDIO = "direct_upload_audio"
+
+    # Job statuses
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+
+    # Foreign keys
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Job definition
+    job_type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default=STATUS_QUEUED, index=True)
+    params = Column(JSONB, nullable=False, default=dict)  # prompt, subject, ids, ...
+
+    # Uploaded payloads (cleared once the job has finished)
+    image_data = Column(LargeBinary, nullable=True)
+    audio_data = Column(LargeBinary, nullable=True)
+
+    # Outcome
+    result = Column(JSONB, nullable=True)  # Final response payload of the endpoint
+    error = Column(Text, nullable=True)
+    error_status_code = Column(Integer, nullable=True)  # 400 for validation errors
+
+    # Worker bookkeeping
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    # Note: created_at, updated_at are automatically added by @auditable
+    #
+    # CRUD operations added by @crud_enabled decorator:
+    # - EditJob.create(db, **kwargs) -> EditJob
+    # - EditJob.get_by_id(db, id) -> EditJob | None
+    # - EditJob.get_all(db) -> List[EditJob]
+    # - EditJob.get_paginated(db, page, limit) -> Dict
+    # - EditJob.update(db, id, updates) -> EditJob | None
+    # - EditJob.delete(db, id) -> bool
+    # - EditJob.count(db) -> int
+    # - EditJob.exists(db, id) -> bool
+
+    def __repr__(self):
+        return f"<EditJob(id={self.id}, user_id={self.user_id}, job_type={self.job_type}, status={self.status})>"
+
+
+# Workers claim the oldest claimable job first.
+# Declared after the class because created_at is only added by @auditable.
+Index("ix_edit_jobs_status_created_at", EditJob.status, EditJob.created_at)
@@ -3,7 +3,7 @@ Story model for Nova Draw AI application.
 Represents AI-generated stories from user drawings.
 """
 
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -26,6 +26,18 @@ class Story(Base):
     """
 
     __tablename__ = "stories"
+    __table_args__ = (
+        # One story per stored image of a drawing (target of
+        # StoryRepository.upsert_for_image); stories of uploads without a URL
+        # (image_url '') are not limited
+        Index(
+            "uq_stories_drawing_id_image_url",
+            "drawing_id",
+            "image_url",
+            unique=True,
+            postgresql_where=text("image_url <> ''"),
+        ),
+    )
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -34,6 +34,8 @@ from src.prompts.story_prompts import (
     get_story_generation_prompt_en,
     get_story_generation_prompt,
     get_story_generation_prompt_bilingual,
+    get_story_generation_prompt_bilingual_sections,
+    get_story_translation_prompt_de,
 )
 
 # Image generation prompts
@@ -59,6 +61,8 @@ __all__ = [
     "get_story_generation_prompt_en",
     "get_story_generation_prompt",
     "get_story_generation_prompt_bilingual",
+    "get_story_generation_prompt_bilingual_sections",
+    "get_story_translation_prompt_de",
     # Image generation prompts
     "get_step_image_generation_prompt_first_step",
     "get_step_image_editing_prompt_subsequent_steps",
@@ -3,6 +3,8 @@ Story service prompts for children's story generation.
 
 This module contains prompts used by the StoryService for:
 - Generating children's stories from images (English and German)
+- Translating an English story to German
+- Streaming a bilingual story section by section
 """
 
 
@@ -154,6 +156,95 @@ CRITICAL: Your response MUST be valid JSON that can be parsed. Do not include an
 """
 
 
+def get_story_generation_prompt_bilingual_sections() -> str:
+    """
+    Get the bilingual story prompt for streamed answers.
+
+    Unlike the JSON prompt, the answer is plain labelled text (TITLE/STORY, then
+    TITEL/GESCHICHTE), so titles and paragraphs can be shown while it is written.
+
+    Returns:
+        str: Bilingual story generation prompt with section labels
+    """
+
+    return """
+You are a professional children's story writer who creates engaging, educational, and age-appropriate stories for children aged 4-7 years old.
+
+Look at this image and create a wonderful short story based on what you see. You MUST provide the story in BOTH English and German.
+
+STORY REQUIREMENTS:
+- Target audience: 4-7 year old children
+- Length: 150-250 words per language (perfect for bedtime or reading time)
+- Language: Simple, clear vocabulary that young children can understand
+- Tone: Positive, encouraging, and magical
+- Include: A clear beginning, middle, and end
+- Themes: Friendship, kindness, adventure, learning, or discovery
+- Make it engaging and fun to read aloud
+
+STORY STRUCTURE:
+1. Start with an interesting character or situation from the image
+2. Create a simple problem or adventure
+3. Show how the character solves it or learns something
+4. End with a positive, uplifting conclusion
+
+WRITING STYLE:
+- Use short, simple sentences
+- Include some dialogue to make it lively
+- Add descriptive words that help children visualize
+- Make it rhythmic and pleasant to read aloud
+- Avoid scary or negative themes
+
+IMPORTANT REQUIREMENTS FOR BILINGUAL OUTPUT:
+- Write the complete English version first, then the German version
+- The German version must tell the SAME story as the English one
+- Maintain the same tone, structure, and message in both languages
+- Separate paragraphs with an empty line
+
+Format your response exactly like this, with no other text:
+TITLE: [Your catchy title in English (5-8 words)]
+
+STORY:
+[The complete story in English]
+
+TITEL: [Dein fesselnder Titel auf Deutsch (5-8 Wörter)]
+
+GESCHICHTE:
+[Die vollständige Geschichte auf Deutsch]
+"""
+
+
+def get_story_translation_prompt_de(title_en: str, story_text_en: str) -> str:
+    """
+    Get the prompt for translating an English children's story to German.
+
+    Args:
+        title_en: Story title in English
+        story_text_en: Story text in English
+
+    Returns:
+        str: Translation prompt (answer uses the TITEL/GESCHICHTE format)
+    """
+
+    return f"""
+Translate this children's story for 4-7 year old children from English to German.
+
+- Keep the same story, characters, dialogue and paragraphs
+- Use simple, natural German that is pleasant to read aloud
+- Adapt names or idioms only where a literal translation would sound odd
+
+Format your response as:
+TITEL: [German title]
+
+GESCHICHTE:
+[German story]
+
+TITLE: {title_en}
+
+STORY:
+{story_text_en}
+"""
+
+
 def get_story_generation_prompt(language: str = "en") -> str:
     """
     Get the story generation prompt based on language.
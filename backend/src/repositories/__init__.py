@@ -21,6 +21,8 @@ from .tutorial_repository import TutorialRepository
 from .drawing_repository import DrawingRepository
 from .story_repository import StoryRepository
 from .edit_option_repository import EditOptionRepository
+from .edit_job_repository import EditJobRepository
+from .cache_entry_repository import CacheEntryRepository
 
 __all__ = [
     "UserRepository",
@@ -28,4 +30,6 @@ __all__ = [
     "DrawingRepository",
     "StoryRepository",
     "EditOptionRepository",
+    "EditJobRepository",
+    "CacheEntryRepository",
 ]
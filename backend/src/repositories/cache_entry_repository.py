@@ -0,0 +1,122 @@
+"""
+CacheEntryRepository for custom CacheEntry queries.
+
+Provides the lookups used by the persistent cache tier: fetching a live entry by
+namespace and key, upserting entries, and invalidating entries by a value field.
+For basic CRUD, use the @crud_enabled decorator methods on the CacheEntry model directly.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, or_
+from sqlalchemy.dialects.postgresql import insert
+from typing import Optional, Dict, Any
+
+from src.models import CacheEntry
+
+
+class CacheEntryRepository:
+    """
+    Repository for CacheEntry model queries.
+
+    Provides custom query methods for specialized use cases.
+    For basic CRUD operations, use CacheEntry.create(), CacheEntry.get_by_id(), etc.
+    """
+
+    @staticmethod
+    async def get_value(
+        db: AsyncSession, namespace: str, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the value of a cache entry that has not expired.
+
+        Args:
+            db: Async database session
+            namespace: Cache namespace
+            cache_key: Cache key within the namespace
+
+        Returns:
+            Cached value or None if missing or expired
+
+        Example:
+            value = await CacheEntryRepository.get_value(db, "gemini_edit", key)
+        """
+
+        query = select(CacheEntry.value).where(
+            CacheEntry.namespace == namespace,
+            CacheEntry.cache_key == cache_key,
+            or_(
+                CacheEntry.expires_at.is_(None),
+                CacheEntry.expires_at > datetime.utcnow(),
+            ),
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def set_value(
+        db: AsyncSession,
+        namespace: str,
+        cache_key: str,
+        value: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """
+        Insert or replace a cache entry (INSERT ... ON CONFLICT DO UPDATE).
+
+        Args:
+            db: Async database session
+            namespace: Cache namespace
+            cache_key: Cache key within the namespace
+            value: JSON-serializable value
+            ttl_seconds: Entry lifetime in seconds (None = never expires)
+
+        Example:
+            await CacheEntryRepository.set_value(db, "gemini_edit", key, {"url": url})
+        """
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds) if ttl_seconds else None
+
+        statement = insert(CacheEntry).values(
+            namespace=namespace,
+            cache_key=cache_key,
+            value=value,
+            expires_at=expires_at,
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_cache_entries_namespace_cache_key",
+            set_={"value": value, "expires_at": expires_at, "updated_at": now},
+        )
+        await db.execute(statement)
+        await db.commit()
+
+    @staticmethod
+    async def delete_by_value_field(
+        db: AsyncSession, namespace: str, field: str, field_value: str
+    ) -> int:
+        """
+        Delete all entries of a namespace whose value[field] equals field_value.
+
+        Args:
+            db: Async database session
+            namespace: Cache namespace
+            field: Top-level key of the JSON value
+            field_value: Value to match
+
+        Returns:
+            Number of deleted entries
+
+        Example:
+            await CacheEntryRepository.delete_by_value_field(
+                db, "gemini_edit", "edited_image_url", url
+            )
+        """
+
+        statement = delete(CacheEntry).where(
+            CacheEntry.namespace == namespace,
+            CacheEntry.value[field].astext == field_value,
+        )
+        result = await db.execute(statement)
+        await db.commit()
+        return result.rowcount
@@ -206,3 +206,40 @@ class DrawingRepository:
         )
         result = await db.execute(query)
         return result.scalars().all()
+
+    @staticmethod
+    async def count_edited_image_references(
+        db: AsyncSession,
+        user_id: UUID,
+        image_url: str,
+        exclude_drawing_id: Optional[UUID] = None,
+    ) -> int:
+        """
+        Count how often an edited image URL appears in a user's drawings.
+
+        Cached edits reuse the same Spaces object, so one edited image can belong
+        to several drawings (or appear twice in one drawing).
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            image_url: Edited image URL
+            exclude_drawing_id: Drawing to leave out of the count
+
+        Returns:
+            Number of occurrences in edited_images_urls
+
+        Example:
+            refs = await DrawingRepository.count_edited_image_references(
+                db, user_id, image_url, exclude_drawing_id=drawing_id
+            )
+        """
+        query = select(Drawing.edited_images_urls).where(
+            Drawing.user_id == user_id,
+            Drawing.edited_images_urls.any(image_url),
+        )
+        if exclude_drawing_id:
+            query = query.where(Drawing.id != exclude_drawing_id)
+
+        result = await db.execute(query)
+        return sum(urls.count(image_url) for urls in result.scalars().all())
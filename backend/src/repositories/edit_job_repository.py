@@ -0,0 +1,271 @@
+"""
+EditJobRepository for custom EditJob queries.
+
+Provides the queue operations used by the async edit endpoints and the worker:
+claiming the next job with SELECT ... FOR UPDATE SKIP LOCKED and recording outcomes.
+For basic CRUD, use the @crud_enabled decorator methods on the EditJob model directly.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.orm import defer
+from typing import Optional, Dict, Any
+from uuid import UUID
+
+from src.models import EditJob
+
+
+class EditJobRepository:
+    """
+    Repository for EditJob model queries.
+
+    Provides custom query methods for specialized use cases.
+    For basic CRUD operations, use EditJob.create(), EditJob.get_by_id(), etc.
+    """
+
+    @staticmethod
+    async def find_by_id_and_user(
+        db: AsyncSession, job_id: UUID, user_id: UUID
+    ) -> Optional[EditJob]:
+        """
+        Find a job owned by a user, without loading the uploaded payloads.
+
+        Args:
+            db: Async database session
+            job_id: Job ID
+            user_id: User ID (owner)
+
+        Returns:
+            EditJob instance or None if not found
+
+        Example:
+            job = await EditJobRepository.find_by_id_and_user(db, job_id, user_id)
+        """
+
+        query = (
+            select(EditJob)
+            .where(EditJob.id == job_id, EditJob.user_id == user_id)
+            .options(defer(EditJob.image_data), defer(EditJob.audio_data))
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def claim_next(
+        db: AsyncSession, worker_id: str, stale_after_seconds: int
+    ) -> Optional[EditJob]:
+        """
+        Atomically claim the oldest claimable job for a worker.
+
+        A job is claimable when it is queued, or when it is running but its worker
+        has not touched it for stale_after_seconds (the worker most likely died).
+        FOR UPDATE SKIP LOCKED lets many workers poll concurrently without ever
+        claiming the same row twice or blocking on each other.
+
+        Args:
+            db: Async database session
+            worker_id: Identifier of the claiming worker
+            stale_after_seconds: Age after which a running job is considered abandoned
+
+        Returns:
+            The claimed EditJob (status 'running', attempts incremented) or None
+
+        Example:
+            job = await EditJobRepository.claim_next(db, "worker-1", 300)
+        """
+
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=stale_after_seconds)
+
+        query = (
+            select(EditJob)
+            .where(
+                or_(
+                    EditJob.status == EditJob.STATUS_QUEUED,
+                    and_(
+                        EditJob.status == EditJob.STATUS_RUNNING,
+                        EditJob.locked_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(EditJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(query)
+        job = result.scalar_one_or_none()
+
+        if not job:
+            # Release the (empty) transaction so the next poll starts fresh
+            await db.rollback()
+            return None
+
+        job.status = EditJob.STATUS_RUNNING
+        job.attempts = (job.attempts or 0) + 1
+        job.locked_by = worker_id
+        job.locked_at = now
+        job.updated_at = now
+
+        await db.commit()
+        return job
+
+    @staticmethod
+    async def heartbeat(db: AsyncSession, job_id: UUID, worker_id: str) -> bool:
+        """
+        Refresh locked_at for a running job so it is not reclaimed as abandoned.
+
+        Args:
+            db: Async database session
+            job_id: Job ID
+            worker_id: Identifier of the worker that holds the job
+
+        Returns:
+            True if the job is still held by this worker, False otherwise
+
+        Example:
+            still_ours = await EditJobRepository.heartbeat(db, job.id, "worker-1")
+        """
+
+        query = (
+            update(EditJob)
+            .where(
+                EditJob.id == job_id,
+                EditJob.status == EditJob.STATUS_RUNNING,
+                EditJob.locked_by == worker_id,
+            )
+            .values(locked_at=datetime.utcnow())
+        )
+        result = await db.execute(query)
+        await db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    async def _update_held(
+        db: AsyncSession, job_id: UUID, worker_id: str, values: Dict[str, Any]
+    ) -> bool:
+        """Update a running job only while the worker still holds its lease."""
+
+        query = (
+            update(EditJob)
+            .where(
+                EditJob.id == job_id,
+                EditJob.status == EditJob.STATUS_RUNNING,
+                EditJob.locked_by == worker_id,
+            )
+            .values(**values)
+        )
+        result = await db.execute(query)
+        await db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    async def mark_succeeded(
+        db: AsyncSession, job_id: UUID, worker_id: str, result: Dict[str, Any]
+    ) -> bool:
+        """
+        Record a successful job and drop its uploaded payloads.
+
+        Like every outcome, only recorded while the worker still holds the job;
+        a worker whose job was reclaimed must not overwrite the new holder's.
+
+        Args:
+            db: Async database session
+            job_id: Job ID
+            worker_id: Identifier of the worker that holds the job
+            result: Final response payload
+
+        Returns:
+            True if the outcome was recorded, False if the worker lost the job
+
+        Example:
+            await EditJobRepository.mark_succeeded(db, job.id, "worker-1", {"drawing_id": "..."})
+        """
+
+        return await EditJobRepository._update_held(
+            db,
+            job_id,
+            worker_id,
+            {
+                "status": EditJob.STATUS_SUCCEEDED,
+                "result": result,
+                "error": None,
+                "error_status_code": None,
+                "image_data": None,
+                "audio_data": None,
+                "locked_by": None,
+                "finished_at": datetime.utcnow(),
+            },
+        )
+
+    @staticmethod
+    async def mark_failed(
+        db: AsyncSession,
+        job_id: UUID,
+        worker_id: str,
+        error: str,
+        error_status_code: int,
+    ) -> bool:
+        """
+        Record a permanently failed job and drop its uploaded payloads.
+
+        Args:
+            db: Async database session
+            job_id: Job ID
+            worker_id: Identifier of the worker that holds the job
+            error: Error message shown to the client
+            error_status_code: HTTP status the synchronous endpoint would have used
+
+        Returns:
+            True if the outcome was recorded, False if the worker lost the job
+
+        Example:
+            await EditJobRepository.mark_failed(db, job.id, "worker-1", "Invalid image", 400)
+        """
+
+        return await EditJobRepository._update_held(
+            db,
+            job_id,
+            worker_id,
+            {
+                "status": EditJob.STATUS_FAILED,
+                "error": error,
+                "error_status_code": error_status_code,
+                "image_data": None,
+                "audio_data": None,
+                "locked_by": None,
+                "finished_at": datetime.utcnow(),
+            },
+        )
+
+    @staticmethod
+    async def release_for_retry(
+        db: AsyncSession, job_id: UUID, worker_id: str, error: str
+    ) -> bool:
+        """
+        Put a job back in the queue after a transient failure.
+
+        Args:
+            db: Async database session
+            job_id: Job ID
+            worker_id: Identifier of the worker that holds the job
+            error: Last error message (kept for debugging)
+
+        Returns:
+            True if the job was released, False if the worker lost it
+
+        Example:
+            await EditJobRepository.release_for_retry(db, job.id, "worker-1", "Gemini timeout")
+        """
+
+        return await EditJobRepository._update_held(
+            db,
+            job_id,
+            worker_id,
+            {
+                "status": EditJob.STATUS_QUEUED,
+                "error": error,
+                "locked_by": None,
+                "locked_at": None,
+            },
+        )
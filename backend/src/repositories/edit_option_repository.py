@@ -13,6 +13,7 @@ Why this repository exists:
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
+from uuid import UUID
 from sqlalchemy.orm import joinedload
 
 from src.models import EditOption, Tutorial
@@ -118,6 +119,31 @@ class EditOptionRepository:
         result = await db.execute(query)
         return result.scalars().unique().all()
 
+    @staticmethod
+    async def find_by_ids(db: AsyncSession, option_ids: List[UUID]) -> List[EditOption]:
+        """
+        Find several edit options (with their tutorial) in one query.
+
+        Used by batch edits, which apply a list of edit options to one drawing.
+
+        Args:
+            db: Async database session
+            option_ids: List of EditOption IDs
+
+        Returns:
+            List of EditOption instances found (missing IDs are skipped)
+
+        Example:
+            options = await EditOptionRepository.find_by_ids(db, [id1, id2])
+        """
+        query = (
+            select(EditOption)
+            .where(EditOption.id.in_(option_ids))
+            .options(joinedload(EditOption.tutorial))
+        )
+        result = await db.execute(query)
+        return result.scalars().unique().all()
+
     @staticmethod
     async def get_all_categories(db: AsyncSession) -> List[str]:
         """
@@ -5,8 +5,10 @@ Provides specialized query methods beyond basic CRUD operations.
 For basic CRUD, use the @crud_enabled decorator methods on the Story model directly.
 """
 
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
 from typing import Optional, List
 from uuid import UUID
 
@@ -197,6 +199,72 @@ class StoryRepository:
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def upsert_for_image(
+        db: AsyncSession,
+        user_id: UUID,
+        drawing_id: UUID,
+        image_url: str,
+        title_en: str,
+        title_de: str,
+        story_text_en: str,
+        story_text_de: str,
+        generation_time_ms: Optional[int] = None,
+    ) -> Story:
+        """
+        Save the story of a drawing's image, replacing any story it already has.
+
+        A single INSERT ... ON CONFLICT (drawing_id, image_url) DO UPDATE ...
+        RETURNING statement, so concurrent saves for the same image cannot leave
+        two stories behind. A replaced story keeps its ID and owner and loses its
+        favorite mark (it is a different story). The caller checks that the
+        drawing belongs to the user.
+
+        Only for stored images: stories without an image URL are not unique per
+        drawing and are saved with Story.create.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            drawing_id: Drawing ID
+            image_url: Image URL (not empty)
+            title_en: Story title in English
+            title_de: Story title in German
+            story_text_en: Story text in English
+            story_text_de: Story text in German
+            generation_time_ms: Time taken to generate the story in milliseconds
+
+        Returns:
+            The inserted or updated Story instance
+
+        Example:
+            story = await StoryRepository.upsert_for_image(db, user_id, drawing_id, url, ...)
+        """
+
+        story = {
+            "title_en": title_en,
+            "title_de": title_de,
+            "story_text_en": story_text_en,
+            "story_text_de": story_text_de,
+            "generation_time_ms": generation_time_ms,
+        }
+        statement = insert(Story).values(
+            user_id=user_id, drawing_id=drawing_id, image_url=image_url, **story
+        )
+        statement = (
+            statement.on_conflict_do_update(
+                index_elements=[Story.drawing_id, Story.image_url],
+                index_where=text("image_url <> ''"),
+                set_={**story, "is_favorite": False, "updated_at": datetime.utcnow()},
+            )
+            .returning(Story)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(statement)
+        saved_story = result.scalar_one()
+        await db.commit()
+        return saved_story
+
     @staticmethod
     async def toggle_favorite(db: AsyncSession, story_id: UUID) -> Optional[Story]:
         """
@@ -16,7 +16,7 @@ Usage:
         return {"status": "healthy", "message": "API is running"}
 """
 
-from .health import HealthResponse
+from .health import HealthResponse, MetricsResponse
 from .tutorial import (
     FullTutorialRequest,
     FullTutorialResponse,
@@ -29,11 +29,14 @@ from .tutorial import (
 from .image import (
     ImageProcessRequest,
     ImageProcessResponse,
+    BatchEditOptionResult,
+    BatchEditResponse,
     EffectInfo,
     EffectsListResponse,
 )
 from .story import StoryRequest, StoryResponse
 from .audio import EditImageWithAudioResponse
+from .edit_job import EditJobResponse
 from .error import ErrorResponse, SessionInfo
 from .auth import (
     RegisterRequest,
@@ -63,6 +66,7 @@ from .drawing import (
 
 __all__ = [
     "HealthResponse",
+    "MetricsResponse",
     "FullTutorialRequest",
     "FullTutorialResponse",
     "TutorialMetadata",
@@ -72,11 +76,14 @@ __all__ = [
     "AllCategoriesWithDrawingsResponse",
     "ImageProcessRequest",
     "ImageProcessResponse",
+    "BatchEditOptionResult",
+    "BatchEditResponse",
     "EffectInfo",
     "EffectsListResponse",
     "StoryRequest",
     "StoryResponse",
     "EditImageWithAudioResponse",
+    "EditJobResponse",
     "ErrorResponse",
     "SessionInfo",
     "RegisterRequest",
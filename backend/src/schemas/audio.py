@@ -1,7 +1,7 @@
 """Audio-related schemas."""
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 
 class EditImageWithAudioResponse(BaseModel):
@@ -12,5 +12,6 @@ class EditImageWithAudioResponse(BaseModel):
     original_image_url: Optional[str] = None  # URL of the original uploaded image
     edited_image_url: Optional[str] = None  # URL of the edited image
     processing_time: Optional[float] = None
+    stage_timings: Optional[Dict[str, float]] = None  # Seconds per pipeline stage
     drawing_id: Optional[str] = None  # ID of the saved drawing in database
     user_id: Optional[str] = None  # ID of the user who created the drawing
@@ -0,0 +1,30 @@
+"""Asynchronous edit job schemas."""
+
+from pydantic import BaseModel, Field
+from typing import Optional, Union
+from datetime import datetime
+
+from .audio import EditImageWithAudioResponse
+from .image import ImageProcessResponse
+
+
+class EditJobResponse(BaseModel):
+    """Status of an asynchronous image edit job."""
+
+    job_id: str = Field(..., description="ID of the queued edit job")
+    job_type: str = Field(
+        ...,
+        description="edit_image, edit_image_with_audio, direct_upload or direct_upload_audio",
+    )
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    attempts: int = Field(0, description="How many times a worker picked up the job")
+    result: Optional[Union[EditImageWithAudioResponse, ImageProcessResponse]] = Field(
+        None,
+        description="Final response of the edit once the job has succeeded",
+    )
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    error_status_code: Optional[int] = Field(
+        None, description="HTTP status the synchronous endpoint would have returned"
+    )
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
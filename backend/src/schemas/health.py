@@ -1,6 +1,7 @@
 """Health check response schema."""
 
 from pydantic import BaseModel
+from typing import Dict
 
 
 class HealthResponse(BaseModel):
@@ -8,3 +9,11 @@ class HealthResponse(BaseModel):
 
     status: str
     message: str
+
+
+class MetricsResponse(BaseModel):
+    """In-process metrics snapshot (per API worker)."""
+
+    counters: Dict[str, float]
+    gauges: Dict[str, float]
+    observations: Dict[str, Dict[str, float]]
@@ -1,7 +1,7 @@
 """Image processing-related schemas."""
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 class ImageProcessRequest(BaseModel):
@@ -39,11 +39,34 @@ class ImageProcessResponse(BaseModel):
     original_image_url: Optional[str] = None  # URL of the original uploaded image
     edited_image_url: Optional[str] = None  # URL of the edited image
     processing_time: Optional[float] = None
+    stage_timings: Optional[Dict[str, float]] = None  # Seconds per pipeline stage
     effect_used: Optional[str] = None  # The effect that was applied
     drawing_id: Optional[str] = None  # ID of the saved drawing in database
     user_id: Optional[str] = None  # ID of the user who created the drawing
 
 
+class BatchEditOptionResult(BaseModel):
+    """Result of one edit option in a batch edit."""
+
+    edit_option_id: str
+    success: bool
+    edited_image_url: Optional[str] = None  # URL of the edited image
+    processing_time: Optional[float] = None
+    error: Optional[str] = None  # Why this option failed (other options still apply)
+
+
+class BatchEditResponse(BaseModel):
+    """Response from applying several edit options to one drawing."""
+
+    success: str  # "true" or "false" as string
+    drawing_id: Optional[str] = None  # Drawing the edited images were appended to
+    original_image_url: Optional[str] = None  # URL of the original image
+    results: List[BatchEditOptionResult]  # In the order the options were requested
+    processing_time: Optional[float] = None
+    stage_timings: Optional[Dict[str, float]] = None  # Seconds per pipeline stage
+    user_id: Optional[str] = None  # ID of the user who created the drawing
+
+
 class EffectInfo(BaseModel):
     """Information about an image effect."""
 
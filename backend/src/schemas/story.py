@@ -7,9 +7,13 @@ from typing import Optional
 class StoryRequest(BaseModel):
     """Request to generate a story from an image.
 
-    Supports two modes:
+    Supports three modes:
     1. Upload image as base64 (image field provided)
     2. Use image URL from Spaces (image_url field provided)
+    3. Use an image of a stored drawing (drawing_id and image_index provided)
+
+    The same fields are accepted as multipart form fields (with `image` as a
+    file) and, for a raw image body, as query parameters.
 
     Stories are always generated in both English and German.
     """
@@ -29,6 +33,21 @@ class StoryRequest(BaseModel):
         None,
         description="URL of the image used for story generation (optional if image provided)",
     )
+    image_index: Optional[int] = Field(
+        None,
+        ge=0,
+        description=(
+            "Image of the drawing to use: 0 is the uploaded original, 1 the first "
+            "edit, 2 the second, ... (requires drawing_id)"
+        ),
+    )
+    regenerate: bool = Field(
+        False,
+        description=(
+            "Write a new story even if one is cached for this image "
+            "(the app's 'Generate new story')"
+        ),
+    )
 
 
 class StoryResponse(BaseModel):
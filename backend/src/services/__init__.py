@@ -13,6 +13,8 @@ from .audio_service import AudioService
 from .image_processing_service import ImageProcessingService
 from .storage_service import StorageService
 from .email_service import EmailService
+from .edit_job_service import EditJobService
+from .registry import ServiceRegistry, services
 
 __all__ = [
     "AuthService",
@@ -24,4 +26,7 @@ __all__ = [
     "ImageProcessingService",
     "StorageService",
     "EmailService",
+    "EditJobService",
+    "ServiceRegistry",
+    "services",
 ]
@@ -2,14 +2,19 @@ import time
 import base64
 from pathlib import Path
 from openai import OpenAI
-from typing import Tuple, Any
+from typing import Optional, Tuple, Any
 from src.core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-import io
-import subprocess
-import tempfile
 from src.core.logger import logger
+from src.services.speech_to_text import (
+    SpeechToTextBackend,
+    create_speech_to_text_backend,
+)
+from src.services.transcription_cache import transcription_cache
+from src.core.metrics import metrics
+from src.utils.audio_transcode import preprocess_speech, transcode_to_mp3
+from src.utils.upstream import call_upstream, OPENAI_CHAT
 from src.prompts import (
     get_prompt_enhancement_prompt_de,
     get_prompt_enhancement_prompt_en,
@@ -20,31 +25,41 @@ from src.prompts import (
 class AudioService:
     """Service for transcribing audio files and enhancing them into drawing prompts"""
 
-    def __init__(self):
+    def __init__(self, stt_backend: Optional[SpeechToTextBackend] = None):
+        """
+        Args:
+            stt_backend: Speech-to-text backend (defaults to SPEECH_TO_TEXT_BACKEND,
+                see src/services/speech_to_text.py)
+        """
+
         logger.info("Initializing AudioService...")
 
         if not settings.OPENAI_API_KEY:
             logger.error("OpenAI API key is missing")
             raise ValueError("OpenAI API key is required for audio transcription")
 
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.whisper_model = "whisper-1"
+        # Retries are left to call_upstream (budgeted, shared with other callers)
+        self.client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.UPSTREAM_OPENAI_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
+        self.stt_backend = stt_backend or create_speech_to_text_backend()
         self.enhancement_model = "gpt-4o"
 
-        # Create audio storage directory
-        self.audio_storage = Path("storage/audio")
-        self.audio_storage.mkdir(parents=True, exist_ok=True)
-
         logger.info(f"AudioService initialized successfully")
-        logger.info(f"Using Whisper model: {self.whisper_model}")
+        logger.info(
+            f"Using speech-to-text backend: {self.stt_backend.name} "
+            f"(model: {self.stt_backend.model})"
+        )
         logger.info(f"Using enhancement model: {self.enhancement_model}")
 
-    def convert_audio_to_mp3(
+    async def convert_audio_to_mp3(
         self, audio_data: bytes, original_filename: str
     ) -> Tuple[bytes, str]:
         """
         Convert audio to MP3 format if needed.
-        Uses pydub with imageio-ffmpeg for conversion.
+        Streams the audio through ffmpeg in memory (see src.utils.audio_transcode).
 
         Args:
             audio_data: Original audio file data
@@ -79,90 +94,134 @@ class AudioService:
         logger.info(f"🔄 Converting '{file_ext}' to MP3...")
 
         try:
-            import imageio_ffmpeg
+            converted_data = await transcode_to_mp3(audio_data)
+        except Exception as e:
+            logger.error(f"❌ Conversion failed: {str(e)}")
+            raise ValueError(
+                f"Failed to convert audio format '{file_ext}' to MP3. Error: {str(e)}"
+            )
 
-            # Get ffmpeg path from imageio
-            ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
-            logger.info(f"📦 Using ffmpeg from: {ffmpeg_path}")
+        new_filename = Path(original_filename).stem + ".mp3"
 
-            # Create temporary files for conversion
-            with tempfile.NamedTemporaryFile(
-                suffix=f".{file_ext}", delete=False
-            ) as input_file:
-                input_file.write(audio_data)
-                input_path = input_file.name
+        logger.info(
+            f"✅ Conversion successful: {len(audio_data)} → {len(converted_data)} bytes"
+        )
 
-            with tempfile.NamedTemporaryFile(
-                suffix=".mp3", delete=False
-            ) as output_file:
-                output_path = output_file.name
+        return converted_data, new_filename
 
-            try:
-                # Use ffmpeg directly to convert
-                command = [
-                    ffmpeg_path,
-                    "-i",
-                    input_path,
-                    "-vn",  # No video
-                    "-ar",
-                    "44100",  # Audio sample rate
-                    "-ac",
-                    "2",  # Audio channels
-                    "-b:a",
-                    "128k",  # Audio bitrate
-                    "-f",
-                    "mp3",  # Output format
-                    output_path,
-                    "-y",  # Overwrite output file
-                    "-loglevel",
-                    "error",  # Only show errors
-                ]
-
-                logger.info(f"🔧 Running ffmpeg conversion...")
-                result = subprocess.run(
-                    command, capture_output=True, text=True, timeout=30
-                )
+    async def prepare_audio(
+        self, audio_data: bytes, filename: str
+    ) -> Tuple[bytes, str]:
+        """
+        Prepare a recording for Whisper.
 
-                if result.returncode != 0:
-                    logger.error(f"❌ ffmpeg error: {result.stderr}")
-                    raise ValueError(f"ffmpeg conversion failed: {result.stderr}")
+        With AUDIO_PREPROCESSING_ENABLED the clip is trimmed of leading/trailing
+        silence and re-encoded as 16 kHz mono Opus; the bytes and seconds saved
+        are logged and recorded in metrics (audio_preprocessing.*). If that is
+        disabled or ffmpeg cannot read the clip, it falls back to
+        convert_audio_to_mp3.
 
-                # Read converted file
-                with open(output_path, "rb") as f:
-                    converted_data = f.read()
+        Args:
+            audio_data: Original audio file data
+            filename: Original filename
 
-                new_filename = Path(original_filename).stem + ".mp3"
+        Returns:
+            Tuple of (audio_data, filename) ready for transcribe_audio
+        """
 
+        if settings.AUDIO_PREPROCESSING_ENABLED:
+            try:
+                speech = await preprocess_speech(
+                    audio_data,
+                    threshold_db=settings.AUDIO_SILENCE_THRESHOLD_DB,
+                    bitrate_kbps=settings.AUDIO_SPEECH_BITRATE_KBPS,
+                )
+            except ValueError as e:
+                metrics.increment("audio_preprocessing.failures")
+                logger.warning(
+                    f"⚠️ Speech pre-processing failed, converting instead: {e}"
+                )
+            else:
+                metrics.observe("audio_preprocessing.bytes_saved", speech.bytes_saved)
+                metrics.observe(
+                    "audio_preprocessing.seconds_saved", speech.seconds_saved
+                )
                 logger.info(
-                    f"✅ Conversion successful: {len(audio_data)} → {len(converted_data)} bytes"
+                    f"✂️ Speech pre-processed: {speech.input_bytes} → "
+                    f"{speech.output_bytes} bytes, {speech.input_seconds:.1f}s → "
+                    f"{speech.output_seconds:.1f}s (saved {speech.bytes_saved} bytes, "
+                    f"{speech.seconds_saved:.1f}s)"
                 )
+                return speech.data, Path(filename).stem + ".ogg"
 
-                return converted_data, new_filename
+        return await self.convert_audio_to_mp3(audio_data, filename)
 
-            finally:
-                # Clean up temporary files
-                try:
-                    Path(input_path).unlink()
-                    Path(output_path).unlink()
-                except:
-                    pass
+    async def transcribe(
+        self,
+        audio_data: bytes,
+        language: str = "en",
+        filename: str = "audio.mp3",
+        use_cache: bool = True,
+    ) -> Tuple[str, float]:
+        """
+        Prepare audio for Whisper (see prepare_audio) and transcribe it with the
+        speech-to-text backend.
 
-        except Exception as e:
-            logger.error(f"❌ Conversion failed: {str(e)}")
-            raise ValueError(
-                f"Failed to convert audio format '{file_ext}' to MP3. Error: {str(e)}"
+        Pre-processing runs as async ffmpeg subprocesses; only the backend call
+        takes an upstream slot. Results are cached by audio content, language
+        and model (see transcription_cache.py), so a repeated clip skips both.
+
+        Args:
+            audio_data: Audio file data in bytes
+            language: Language code ('en' or 'de')
+            filename: Original filename (its extension selects the conversion)
+            use_cache: Look up and store the result in the transcription cache
+
+        Returns:
+            Tuple of (transcribed_text, transcription_time)
+        """
+
+        start_time = time.time()
+
+        async def convert_and_transcribe() -> str:
+            converted, converted_filename = await self.prepare_audio(
+                audio_data, filename
+            )
+            transcribed_text, _ = await call_upstream(
+                self.stt_backend.upstream,
+                self.transcribe_audio,
+                converted,
+                language,
+                converted_filename,
             )
+            return transcribed_text
+
+        if not use_cache:
+            transcribed_text = await convert_and_transcribe()
+            return transcribed_text, time.time() - start_time
+
+        # Identical clips (app retries, reused recordings) are transcribed once
+        cache_key = transcription_cache.build_key(
+            audio_data, language, self.stt_backend.model
+        )
+        transcribed_text = await transcription_cache.get_or_transcribe(
+            cache_key, convert_and_transcribe
+        )
+        return transcribed_text, time.time() - start_time
 
     def transcribe_audio(
         self, audio_data: bytes, language: str = "en", filename: str = "audio.mp3"
     ) -> Tuple[str, float]:
         """
-        Transcribe audio file to text using OpenAI Whisper.
+        Transcribe audio file to text with the speech-to-text backend (blocking).
+
+        The audio must already be in a format the backend accepts; use
+        transcribe() for uploads that may need converting.
 
         Args:
             audio_data: Audio file data in bytes
             language: Language code ('en' or 'de')
-            filename: Original filename (for saving temporarily)
+            filename: Original filename (its extension tells Whisper the format)
 
         Returns:
             Tuple of (transcribed_text, transcription_time)
@@ -174,49 +233,21 @@ class AudioService:
         start_time = time.time()
 
         try:
-            # Convert to supported format if needed
-            audio_data, filename = self.convert_audio_to_mp3(audio_data, filename)
-
-            # Save audio temporarily for Whisper API
-            temp_audio_path = self.audio_storage / f"temp_{int(time.time())}_{filename}"
-            logger.info(f"📁 Saving temporary audio file: {temp_audio_path.name}")
-
-            with open(temp_audio_path, "wb") as f:
-                f.write(audio_data)
-
-            # Transcribe using Whisper with language parameter for better accuracy
-            logger.info(f"🔄 Calling Whisper API (model: {self.whisper_model})...")
-            with open(temp_audio_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model=self.whisper_model,
-                    file=audio_file,
-                    language=language,  # 'en' or 'de' - helps Whisper understand the audio better
-                    response_format="text",
-                    prompt=None,  # Optional: can add context hints here if needed
-                )
+            logger.info(
+                f"🔄 Calling {self.stt_backend.name} speech-to-text "
+                f"(model: {self.stt_backend.model})..."
+            )
+            transcript = self.stt_backend.transcribe(audio_data, language, filename)
 
             duration = time.time() - start_time
             logger.info(f"✅ Transcription completed in {duration:.2f}s")
             logger.info(f"📝 Transcribed text: '{transcript.strip()}'")
 
-            # Clean up temporary file
-            try:
-                temp_audio_path.unlink()
-                logger.info(f"🗑️ Temporary file cleaned up")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not delete temporary audio file: {e}")
-
             return transcript.strip(), duration
 
         except Exception as e:
             duration = time.time() - start_time
             logger.error(f"❌ Transcription failed after {duration:.2f}s: {str(e)}")
-            # Clean up on error
-            try:
-                if temp_audio_path.exists():
-                    temp_audio_path.unlink()
-            except:
-                pass
             raise ValueError(f"Audio transcription failed: {str(e)}")
 
     def enhance_prompt(
@@ -298,7 +329,7 @@ class AudioService:
 
         return f"filename={filename}, size={size_str}"
 
-    def process_audio_to_prompt(
+    async def process_audio_to_prompt(
         self, audio_data: bytes, language: str = "en", filename: str = "audio.mp3"
     ) -> Tuple[str, str, float]:
         """
@@ -317,13 +348,13 @@ class AudioService:
         pipeline_start = time.time()
 
         # Step 1: Transcribe audio
-        transcribed_text, transcription_time = self.transcribe_audio(
+        transcribed_text, transcription_time = await self.transcribe(
             audio_data, language, filename
         )
 
         # Step 2: Enhance to prompt
-        enhanced_prompt, enhancement_time = self.enhance_prompt(
-            transcribed_text, language
+        enhanced_prompt, enhancement_time = await call_upstream(
+            OPENAI_CHAT, self.enhance_prompt, transcribed_text, language
         )
 
         total_time = time.time() - pipeline_start
@@ -7,7 +7,7 @@ Manages deletion from both database and DigitalOcean Spaces storage.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import attributes
 from uuid import UUID
@@ -15,6 +15,7 @@ from uuid import UUID
 from src.models import Drawing
 from src.repositories import DrawingRepository
 from src.services.storage_service import StorageService
+from src.services.edit_result_cache import edit_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +23,22 @@ logger = logging.getLogger(__name__)
 class DrawingGalleryService:
     """Service for drawing gallery operations"""
 
-    def __init__(self):
-        """Initialize service with storage client"""
+    def __init__(self, storage_service: Optional[StorageService] = None):
+        """
+        Initialize service with storage client.
+
+        Args:
+            storage_service: Shared StorageService (a new one is created if omitted)
+        """
         logger.info("Initializing DrawingGalleryService...")
-        try:
-            self.storage_service = StorageService()
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to initialize StorageService: {str(e)}")
-            self.storage_service = None
+        if storage_service is not None:
+            self.storage_service = storage_service
+        else:
+            try:
+                self.storage_service = StorageService()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to initialize StorageService: {str(e)}")
+                self.storage_service = None
         logger.info("DrawingGalleryService initialized successfully")
 
     def _delete_image_from_spaces(self, image_url: str) -> bool:
@@ -58,6 +67,39 @@ class DrawingGalleryService:
             logger.error(f"❌ Error deleting image from Spaces: {str(e)}")
             return False
 
+    async def _release_edited_image(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        drawing_id: UUID,
+        image_url: str,
+        remaining_in_drawing: int = 0,
+    ) -> None:
+        """
+        Delete an edited image from Spaces unless it is still referenced.
+
+        Cached edits reuse the same Spaces object across drawings, so the object is
+        only deleted (and its edit cache entries dropped) with its last reference.
+
+        Args:
+            db: Async database session
+            user_id: UUID of the drawing owner
+            drawing_id: UUID of the drawing the image is removed from
+            image_url: Edited image URL
+            remaining_in_drawing: Occurrences left in this drawing after removal
+        """
+        other_references = await DrawingRepository.count_edited_image_references(
+            db, user_id, image_url, exclude_drawing_id=drawing_id
+        )
+        if other_references + remaining_in_drawing > 0:
+            logger.info(
+                f"ℹ️  Edited image still used by other drawings, keeping it in Spaces: {image_url}"
+            )
+            return
+
+        await edit_result_cache.invalidate_url(image_url)
+        self._delete_image_from_spaces(image_url)
+
     async def get_user_gallery(
         self,
         db: AsyncSession,
@@ -229,11 +271,13 @@ class DrawingGalleryService:
                 logger.info(
                     f"🗑️  Deleting {len(drawing.edited_images_urls)} edited images from Spaces"
                 )
-                for idx, image_url in enumerate(drawing.edited_images_urls, 1):
+                for idx, image_url in enumerate(
+                    dict.fromkeys(drawing.edited_images_urls), 1
+                ):
                     logger.info(
                         f"🗑️  Deleting edited image {idx}/{len(drawing.edited_images_urls)}: {image_url}"
                     )
-                    self._delete_image_from_spaces(image_url)
+                    await self._release_edited_image(db, user_id, drawing_id, image_url)
             else:
                 logger.info(f"ℹ️  No edited images to delete for drawing {drawing_id}")
 
@@ -313,7 +357,17 @@ class DrawingGalleryService:
 
             # Delete image from Spaces first
             logger.info(f"🗑️  Deleting image from Spaces: {image_url}")
-            self._delete_image_from_spaces(image_url)
+            if is_edited and not is_original:
+                await self._release_edited_image(
+                    db,
+                    user_id,
+                    drawing_id,
+                    image_url,
+                    remaining_in_drawing=drawing.edited_images_urls.count(image_url)
+                    - 1,
+                )
+            else:
+                self._delete_image_from_spaces(image_url)
 
             # If deleting the original/uploaded image, delete the entire drawing row
             # because the original/uploaded image cannot be null
@@ -323,11 +377,15 @@ class DrawingGalleryService:
                     logger.info(
                         f"🗑️  Deleting {len(drawing.edited_images_urls)} edited images from Spaces before deleting drawing"
                     )
-                    for idx, edited_url in enumerate(drawing.edited_images_urls, 1):
+                    for idx, edited_url in enumerate(
+                        dict.fromkeys(drawing.edited_images_urls), 1
+                    ):
                         logger.info(
                             f"🗑️  Deleting edited image {idx}/{len(drawing.edited_images_urls)}: {edited_url}"
                         )
-                        self._delete_image_from_spaces(edited_url)
+                        await self._release_edited_image(
+                            db, user_id, drawing_id, edited_url
+                        )
 
                 await Drawing.delete(db, drawing_id)
                 logger.info(
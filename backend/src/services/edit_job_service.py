@@ -0,0 +1,419 @@
+"""
+EditJobService for asynchronous image edits.
+
+Provides the business logic behind the "async mode" of the edit endpoints:
+- Enqueue an edit job (the HTTP request returns a job id straight away)
+- Report job status and the final response to the client
+- Run jobs in worker processes (see worker.py) using the existing
+  ImageProcessingService pipeline
+
+Why this service exists:
+- Mobile clients on bad networks no longer hold a connection open for the whole
+  transcribe → Gemini → Spaces → DB pipeline, so timeouts don't trigger retries
+  that double the upstream spend
+- API nodes and worker nodes can be scaled independently
+"""
+
+import asyncio
+import os
+import socket
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, Optional
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.database import async_session
+from src.models import EditJob
+from src.repositories import EditJobRepository
+from src.schemas import ImageProcessResponse, EditImageWithAudioResponse
+from src.services.image_processing_service import ImageProcessingService
+
+
+class EditJobService:
+    """Service for queueing image edits and reporting their status"""
+
+    @staticmethod
+    async def enqueue_job(
+        db: AsyncSession,
+        user_id: UUID,
+        job_type: str,
+        params: Dict[str, Any],
+        image_data: bytes = None,
+        audio_data: bytes = None,
+    ) -> Dict[str, Any]:
+        """
+        Store a new edit job so a worker can pick it up.
+
+        Args:
+            db: Async database session
+            user_id: UUID of the user requesting the edit
+            job_type: One of the EditJob.TYPE_* constants
+            params: JSON-serializable edit parameters (prompt, subject, ids, ...)
+            image_data: Uploaded image bytes (optional if params has image_url)
+            audio_data: Uploaded audio bytes (voice edits only)
+
+        Returns:
+            Dictionary describing the queued job
+
+        Raises:
+            ValueError: If the job type is unknown
+        """
+
+        if job_type not in _JOB_RUNNERS:
+            raise ValueError(f"Unknown edit job type: {job_type}")
+
+        job = await EditJob.create(
+            db,
+            user_id=user_id,
+            job_type=job_type,
+            status=EditJob.STATUS_QUEUED,
+            params=params,
+            image_data=image_data,
+            audio_data=audio_data,
+            attempts=0,
+            max_attempts=settings.EDIT_JOB_MAX_ATTEMPTS,
+        )
+
+        logger.info(f"📥 Queued {job_type} job {job.id} for user {user_id}")
+
+        return EditJobService.job_to_dict(job)
+
+    @staticmethod
+    async def get_job_status(
+        db: AsyncSession, job_id: UUID, user_id: UUID
+    ) -> Dict[str, Any]:
+        """
+        Get the status (and final result once available) of a user's job.
+
+        Args:
+            db: Async database session
+            job_id: UUID of the job
+            user_id: UUID of the user (for ownership check)
+
+        Returns:
+            Dictionary describing the job
+
+        Raises:
+            ValueError: If the job does not exist or belongs to another user
+        """
+
+        job = await EditJobRepository.find_by_id_and_user(db, job_id, user_id)
+        if not job:
+            raise ValueError("Edit job not found")
+
+        return EditJobService.job_to_dict(job)
+
+    @staticmethod
+    def job_to_dict(job: EditJob) -> Dict[str, Any]:
+        """
+        Convert an EditJob to the fields of EditJobResponse.
+
+        Args:
+            job: EditJob instance
+
+        Returns:
+            Dictionary with job status fields
+        """
+
+        return {
+            "job_id": str(job.id),
+            "job_type": job.job_type,
+            "status": job.status,
+            "attempts": job.attempts or 0,
+            "result": job.result,
+            "error": job.error,
+            "error_status_code": job.error_status_code,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
+
+
+async def _run_edit_image(
+    service: ImageProcessingService, db: AsyncSession, job: EditJob
+) -> Dict[str, Any]:
+    """Run an /api/edit-image job and build its ImageProcessResponse payload."""
+
+    params = job.params
+    result = await service.edit_image_with_prompt(
+        db=db,
+        prompt=params["prompt"],
+        subject=params.get("subject"),
+        user_id=job.user_id,
+        tutorial_id=_optional_uuid(params.get("tutorial_id")),
+        drawing_id=_optional_uuid(params.get("drawing_id")),
+        image_data=job.image_data,
+        image_url=params.get("image_url"),
+    )
+
+    return ImageProcessResponse(
+        success="true",
+        prompt=params["prompt"],
+        original_image_url=result["original_image_url"],
+        edited_image_url=result["edited_image_url"],
+        processing_time=result["processing_time"],
+        stage_timings=result["stage_timings"],
+        drawing_id=result["drawing_id"],
+        user_id=str(job.user_id),
+    ).model_dump()
+
+
+async def _run_edit_image_with_audio(
+    service: ImageProcessingService, db: AsyncSession, job: EditJob
+) -> Dict[str, Any]:
+    """Run an /api/edit-image-with-audio job and build its response payload."""
+
+    params = job.params
+    result = await service.edit_image_with_audio(
+        db=db,
+        audio_data=job.audio_data,
+        audio_filename=params.get("audio_filename") or "audio.mp3",
+        language=params["language"],
+        subject=params.get("subject"),
+        user_id=job.user_id,
+        tutorial_id=_optional_uuid(params.get("tutorial_id")),
+        drawing_id=_optional_uuid(params.get("drawing_id")),
+        image_data=job.image_data,
+        image_url=params.get("image_url"),
+    )
+
+    return EditImageWithAudioResponse(
+        success="true",
+        transcribed_text=result["transcribed_text"],
+        original_image_url=result["original_image_url"],
+        edited_image_url=result["edited_image_url"],
+        processing_time=result["processing_time"],
+        stage_timings=result["stage_timings"],
+        drawing_id=result["drawing_id"],
+        user_id=str(job.user_id),
+    ).model_dump()
+
+
+async def _run_direct_upload(
+    service: ImageProcessingService, db: AsyncSession, job: EditJob
+) -> Dict[str, Any]:
+    """Run an /api/direct-upload or /api/direct-upload-audio job."""
+
+    params = job.params
+    result = await service.process_direct_upload(
+        db=db,
+        subject=params["subject"],
+        user_id=job.user_id,
+        image_data=job.image_data,
+        prompt=params.get("prompt"),
+        audio_data=job.audio_data,
+        audio_filename=params.get("audio_filename"),
+        language=params.get("language", "en"),
+    )
+
+    return ImageProcessResponse(
+        success="true",
+        prompt=result["prompt"],
+        original_image_url=result["original_image_url"],
+        edited_image_url=result["edited_image_url"],
+        processing_time=result["processing_time"],
+        stage_timings=result["stage_timings"],
+        drawing_id=result["drawing_id"],
+        user_id=str(job.user_id),
+    ).model_dump()
+
+
+def _optional_uuid(value: Optional[str]) -> Optional[UUID]:
+    """Convert an optional UUID string from job params."""
+    return UUID(value) if value else None
+
+
+# Maps each job type to the pipeline that runs it
+_JOB_RUNNERS = {
+    EditJob.TYPE_EDIT_IMAGE: _run_edit_image,
+    EditJob.TYPE_EDIT_IMAGE_WITH_AUDIO: _run_edit_image_with_audio,
+    EditJob.TYPE_DIRECT_UPLOAD: _run_direct_upload,
+    EditJob.TYPE_DIRECT_UPLOAD_AUDIO: _run_direct_upload,
+}
+
+
+class EditJobWorker:
+    """
+    Worker that claims queued edit jobs and runs them.
+
+    Each worker process runs `concurrency` claim loops. Jobs are claimed with
+    SELECT ... FOR UPDATE SKIP LOCKED, so any number of worker processes can
+    share the same queue. While a job runs, its lock is refreshed periodically
+    so long edits are not mistaken for abandoned ones. A worker whose lock went
+    stale anyway (and was reclaimed) cancels its edit, and outcomes are only
+    recorded by the worker that holds the job.
+    """
+
+    def __init__(
+        self,
+        image_processing_service: ImageProcessingService,
+        worker_id: str = None,
+        concurrency: int = None,
+        poll_interval: float = None,
+        stale_after_seconds: int = None,
+    ):
+        self.image_processing_service = image_processing_service
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.concurrency = concurrency or settings.EDIT_JOB_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.EDIT_JOB_POLL_INTERVAL_SECONDS
+        self.stale_after_seconds = (
+            stale_after_seconds or settings.EDIT_JOB_STALE_AFTER_SECONDS
+        )
+
+        logger.info(
+            f"👷 EditJobWorker '{self.worker_id}' ready "
+            f"(concurrency: {self.concurrency}, poll: {self.poll_interval}s)"
+        )
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Process jobs until stop_event is set (in-flight jobs are finished first).
+
+        Args:
+            stop_event: Event that signals the worker to stop claiming new jobs
+        """
+
+        await asyncio.gather(
+            *(self._claim_loop(slot, stop_event) for slot in range(self.concurrency))
+        )
+        logger.info(f"👷 EditJobWorker '{self.worker_id}' stopped")
+
+    async def _claim_loop(self, slot: int, stop_event: asyncio.Event) -> None:
+        """Repeatedly claim and run jobs, sleeping while the queue is empty."""
+
+        while not stop_event.is_set():
+            try:
+                processed = await self.run_next_job()
+            except Exception as e:
+                logger.error(f"❌ Worker slot {slot} failed to process a job: {e}")
+                processed = False
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_next_job(self) -> bool:
+        """
+        Claim one job and run it to completion.
+
+        Returns:
+            True if a job was processed, False if the queue was empty
+        """
+
+        async with async_session() as db:
+            job = await EditJobRepository.claim_next(
+                db, self.worker_id, self.stale_after_seconds
+            )
+
+        if not job:
+            return False
+
+        logger.info(
+            f"🛠️ Worker '{self.worker_id}' running {job.job_type} job {job.id} "
+            f"(attempt {job.attempts}/{job.max_attempts})"
+        )
+
+        if job.attempts > job.max_attempts:
+            async with async_session() as db:
+                await EditJobRepository.mark_failed(
+                    db,
+                    job.id,
+                    self.worker_id,
+                    "Edit job exceeded its maximum attempts",
+                    500,
+                )
+            return True
+
+        async def run_job() -> Dict[str, Any]:
+            async with async_session() as db:
+                return await _JOB_RUNNERS[job.job_type](
+                    self.image_processing_service, db, job
+                )
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        edit = asyncio.create_task(run_job())
+        try:
+            # The heartbeat only returns when another worker reclaimed the job
+            await asyncio.wait({edit, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+            if not edit.done():
+                edit.cancel()
+                await asyncio.gather(edit, return_exceptions=True)
+                logger.warning(
+                    f"⚠️ Worker '{self.worker_id}' lost job {job.id} to another "
+                    "worker; its edit was cancelled"
+                )
+                return True
+            result = edit.result()
+        except ValueError as e:
+            # Validation errors are permanent (the sync endpoint returns 400)
+            logger.warning(f"⚠️ Edit job {job.id} failed validation: {e}")
+            async with async_session() as db:
+                recorded = await EditJobRepository.mark_failed(
+                    db, job.id, self.worker_id, str(e), 400
+                )
+            if not recorded:
+                self._log_lost_outcome(job.id)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Edit job {job.id} failed: {e}")
+            async with async_session() as db:
+                if job.attempts < job.max_attempts:
+                    recorded = await EditJobRepository.release_for_retry(
+                        db, job.id, self.worker_id, str(e)
+                    )
+                else:
+                    recorded = await EditJobRepository.mark_failed(
+                        db,
+                        job.id,
+                        self.worker_id,
+                        f"Failed to process edit: {str(e)}",
+                        500,
+                    )
+            if not recorded:
+                self._log_lost_outcome(job.id)
+            return True
+        finally:
+            heartbeat.cancel()
+            if not edit.done():
+                edit.cancel()
+
+        async with async_session() as db:
+            recorded = await EditJobRepository.mark_succeeded(
+                db, job.id, self.worker_id, result
+            )
+        if not recorded:
+            self._log_lost_outcome(job.id)
+            return True
+
+        logger.info(f"✅ Edit job {job.id} succeeded")
+        return True
+
+    def _log_lost_outcome(self, job_id: UUID) -> None:
+        """Note an outcome that was dropped because another worker holds the job."""
+
+        logger.warning(
+            f"⚠️ Worker '{self.worker_id}' no longer holds job {job_id}; "
+            "its outcome was not recorded"
+        )
+
+    async def _heartbeat(self, job_id: UUID) -> None:
+        """
+        Keep the job lock fresh while it is being processed.
+
+        Returns as soon as the job turns out to be held by another worker (its
+        lock went stale and was reclaimed); failed refreshes are retried.
+        """
+
+        interval = max(1.0, self.stale_after_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with async_session() as db:
+                    if not await EditJobRepository.heartbeat(
+                        db, job_id, self.worker_id
+                    ):
+                        return
+            except Exception as e:
+                logger.warning(f"⚠️ Heartbeat for job {job_id} failed: {e}")
@@ -0,0 +1,184 @@
+"""
+Content-addressed cache of Gemini image edit results.
+
+Kids often tap the same edit option on the same drawing several times, and
+re-edits via image_url send identical bytes to Gemini. An edit is identified by:
+- sha256 of the input image bytes
+- the final Gemini prompt (output of get_image_processing_prompt_en/_de)
+- the subject, the language and the Gemini model name
+- the user (cached URLs point into the user's own Spaces folder, which the
+  ownership checks on re-edit rely on)
+
+Two tiers:
+- Local: bounded per-process LRU (EDIT_CACHE_LOCAL_MAX_ENTRIES), no DB round trip
+- Persistent: cache_entries table shared by all API and worker processes
+
+Values are pointers to edited images already stored in Spaces, so a hit skips both
+Gemini and the upload. Hits, misses and errors are recorded in src.core.metrics.
+
+The persistent tier uses its own short-lived sessions, so a cache failure never
+leaves the caller's session in a failed transaction.
+"""
+
+import hashlib
+from typing import Optional
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.database import async_session
+from src.repositories import CacheEntryRepository
+from src.utils import LRUCache
+
+
+class EditResultCache:
+    """Two-tier cache mapping an edit fingerprint to the edited image URL"""
+
+    NAMESPACE = "gemini_edit"
+
+    def __init__(self):
+        self.enabled = settings.EDIT_CACHE_ENABLED
+        self.ttl_seconds = settings.EDIT_CACHE_TTL_SECONDS
+        self.local = LRUCache(
+            max_entries=settings.EDIT_CACHE_LOCAL_MAX_ENTRIES,
+            ttl_seconds=settings.EDIT_CACHE_LOCAL_TTL_SECONDS,
+        )
+
+    @staticmethod
+    def build_key(
+        image_data: bytes,
+        full_prompt: str,
+        subject: Optional[str],
+        language: str,
+        model: str,
+        user_id: UUID,
+    ) -> str:
+        """
+        Build the cache key for an edit.
+
+        Args:
+            image_data: Raw input image bytes sent to Gemini
+            full_prompt: Final Gemini prompt (with preservation guidelines)
+            subject: What the child drew
+            language: Prompt language ('en' or 'de')
+            model: Gemini model name
+            user_id: UUID of the user (owner of the cached Spaces object)
+
+        Returns:
+            sha256 hex digest identifying the edit
+        """
+
+        image_hash = hashlib.sha256(image_data).hexdigest()
+        fingerprint = "\x1f".join(
+            [str(user_id), model, language, subject or "", image_hash, full_prompt]
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up the edited image URL for an edit (local tier first).
+
+        Cache failures are logged and treated as misses, never raised.
+
+        Args:
+            key: Key from build_key()
+
+        Returns:
+            Edited image URL or None on a miss
+        """
+
+        if not self.enabled:
+            return None
+
+        edited_image_url = self.local.get(key)
+        if edited_image_url:
+            metrics.increment("edit_cache.hits.local")
+            logger.info("♻️ Edit cache hit (local)")
+            return edited_image_url
+
+        try:
+            async with async_session() as db:
+                value = await CacheEntryRepository.get_value(db, self.NAMESPACE, key)
+        except Exception as e:
+            metrics.increment("edit_cache.errors")
+            logger.warning(f"⚠️ Edit cache lookup failed: {e}")
+            metrics.increment("edit_cache.misses")
+            return None
+
+        if value and value.get("edited_image_url"):
+            edited_image_url = value["edited_image_url"]
+            self._set_local(key, edited_image_url)
+            metrics.increment("edit_cache.hits.persistent")
+            logger.info("♻️ Edit cache hit (persistent)")
+            return edited_image_url
+
+        metrics.increment("edit_cache.misses")
+        return None
+
+    async def put(self, key: str, edited_image_url: str) -> None:
+        """
+        Store the edited image URL for an edit in both tiers.
+
+        Args:
+            key: Key from build_key()
+            edited_image_url: Spaces URL of the edited image
+        """
+
+        if not self.enabled:
+            return
+
+        self._set_local(key, edited_image_url)
+
+        try:
+            async with async_session() as db:
+                await CacheEntryRepository.set_value(
+                    db,
+                    self.NAMESPACE,
+                    key,
+                    {"edited_image_url": edited_image_url},
+                    ttl_seconds=self.ttl_seconds,
+                )
+            metrics.increment("edit_cache.stores")
+        except Exception as e:
+            metrics.increment("edit_cache.errors")
+            logger.warning(f"⚠️ Failed to store edit cache entry: {e}")
+
+    async def invalidate_url(self, edited_image_url: str) -> None:
+        """
+        Drop every entry pointing at an image that is being deleted from Spaces.
+
+        Other processes may still hold the URL in their local tier until
+        EDIT_CACHE_LOCAL_TTL_SECONDS expires it.
+
+        Args:
+            edited_image_url: Spaces URL of the deleted image
+        """
+
+        if not self.enabled:
+            return
+
+        self.local.remove_where(lambda url: url == edited_image_url)
+        metrics.set_gauge("edit_cache.local_size", len(self.local))
+
+        try:
+            async with async_session() as db:
+                removed = await CacheEntryRepository.delete_by_value_field(
+                    db, self.NAMESPACE, "edited_image_url", edited_image_url
+                )
+            if removed:
+                logger.info(
+                    f"🧹 Removed {removed} edit cache entries for deleted image"
+                )
+        except Exception as e:
+            metrics.increment("edit_cache.errors")
+            logger.warning(f"⚠️ Failed to invalidate edit cache entries: {e}")
+
+    def _set_local(self, key: str, edited_image_url: str) -> None:
+        """Store an entry in the local tier and update its size gauge."""
+        self.local.set(key, edited_image_url)
+        metrics.set_gauge("edit_cache.local_size", len(self.local))
+
+
+# Global cache instance (the local tier is shared by everything in this process)
+edit_result_cache = EditResultCache()
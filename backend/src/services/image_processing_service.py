@@ -1,11 +1,13 @@
 import time
 import base64
+import asyncio
 from pathlib import Path
 from PIL import Image
 from io import BytesIO
 from google import genai
+from google.genai import types
 from openai import OpenAI
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional, List
 from src.services import AudioService
 from src.core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,7 +16,18 @@ from uuid import UUID
 from src.models import Drawing
 from src.services.storage_service import StorageService
 from src.models import Drawing, Tutorial
+from src.repositories import EditOptionRepository
 from src.core.logger import logger
+from src.utils.executor import run_blocking
+from src.utils.upstream import call_upstream, GEMINI, OPENAI_CHAT, SPACES
+from src.utils.upstream_limiter import UpstreamUnavailableError
+from src.utils.pipeline import StageTimings, concurrent_stages
+from src.utils.progress import ProgressCallback, report_progress
+from src.utils.image_normalization import normalize_image
+from src.utils.image_format import sniff_image_mime_type
+from src.core.metrics import metrics
+from src.services.edit_result_cache import edit_result_cache
+from src.services.story_pregeneration import story_pregenerator
 from src.prompts import (
     get_image_processing_prompt_en,
     get_image_processing_prompt_de,
@@ -24,7 +37,18 @@ from src.prompts import (
 class ImageProcessingService:
     """Service for processing images using Google Gemini"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        storage_service: Optional[StorageService] = None,
+        audio_service: Optional[AudioService] = None,
+    ):
+        """
+        Args:
+            storage_service: Shared StorageService (a new one is created if omitted)
+            audio_service: Shared AudioService for voice edits (created on first
+                use if omitted)
+        """
+
         logger.info("Initializing ImageProcessingService...")
 
         if not settings.GOOGLE_API_KEY:
@@ -34,23 +58,48 @@ class ImageProcessingService:
             logger.error("OpenAI API key is missing")
             raise ValueError("OpenAI API key is required for prompt enhancement")
 
-        self.gemini_client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Deadlines match call_upstream's; retries are left to call_upstream
+        self.gemini_client = genai.Client(
+            api_key=settings.GOOGLE_API_KEY,
+            http_options=types.HttpOptions(
+                timeout=int(settings.UPSTREAM_GEMINI_TIMEOUT_SECONDS * 1000)
+            ),
+        )
+        self.openai_client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.UPSTREAM_OPENAI_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
         self.gemini_model = "gemini-2.5-flash-image-preview"
         self.openai_model = "gpt-3.5-turbo"  # Cheap and fast for prompt enhancement
 
         # Initialize storage service for DigitalOcean Spaces
-        try:
-            self.storage_service = StorageService()
-            logger.info("✅ StorageService initialized")
-        except Exception as e:
-            logger.warning(f"⚠️ StorageService initialization failed: {e}")
-            self.storage_service = None
+        if storage_service is not None:
+            self.storage_service = storage_service
+        else:
+            try:
+                self.storage_service = StorageService()
+                logger.info("✅ StorageService initialized")
+            except Exception as e:
+                logger.warning(f"⚠️ StorageService initialization failed: {e}")
+                self.storage_service = None
+        self._audio_service = audio_service
 
         logger.info(f"ImageProcessingService initialized successfully")
         logger.info(f"Using Gemini model: {self.gemini_model}")
         logger.info(f"Using OpenAI model: {self.openai_model}")
 
+    @property
+    def audio_service(self) -> AudioService:
+        """AudioService used for voice edits (one per ImageProcessingService)."""
+        if self._audio_service is None:
+            self._audio_service = AudioService()
+        return self._audio_service
+
+    @audio_service.setter
+    def audio_service(self, audio_service: AudioService) -> None:
+        self._audio_service = audio_service
+
     # Commented for now, cause not being used anywhere!
     # def enhance_voice_prompt(self, user_request: str, subject: str = None) -> str:
     #     """
@@ -100,26 +149,30 @@ class ImageProcessingService:
     #         logger.error(f"❌ Voice prompt enhancement failed: {e}")
     #         return user_request
 
-    def process_image(
+    async def process_image(
         self,
         image_data: bytes,
         prompt: str,
         subject: str = None,
         language: str = "en",  # en or de
-    ) -> Tuple[str, float]:
+    ) -> Tuple[bytes, str, float]:
         """
         Process an image with a text prompt using Gemini.
 
         For predefined edit options, the prompt already contains detailed instructions
         from the database, so we skip GPT enhancement and send directly to Gemini.
 
+        The Gemini SDK is synchronous, so the call (and the PIL decode/encode work
+        around it) runs in the upstream executor to keep the event loop free.
+        The input image is normalized first (see _prepare_input_image).
+
         Args:
             image_data: Raw image bytes
             prompt: Text prompt for processing (detailed prompt from edit_options table)
             subject: What the child drew (e.g., 'dog', 'cat') - helps Gemini understand the drawing
 
         Returns:
-            Tuple of (base64_result_image, processing_time)
+            Tuple of (result_image_bytes, mime_type, processing_time)
         """
 
         logger.info(f"🎨 Starting image processing with prompt: '{prompt[:100]}...'")
@@ -127,29 +180,15 @@ class ImageProcessingService:
         start_time = time.time()
 
         try:
-            # Convert bytes to PIL Image
+            # Normalize the upload (EXIF rotate, downsize, JPEG re-encode)
             logger.info("📷 Processing uploaded image...")
-            input_image = Image.open(BytesIO(image_data))
-            original_size = input_image.size
-            original_mode = input_image.mode
-
-            logger.info(
-                f"📊 Image info: {original_size[0]}x{original_size[1]} pixels, mode: {original_mode}"
-            )
-
-            # Ensure image is in RGB mode
-            if input_image.mode != "RGB":
-                logger.info(f"🔄 Converting image from {input_image.mode} to RGB")
-                input_image = input_image.convert("RGB")
+            input_image = await run_blocking(self._prepare_input_image, image_data)
 
             # Create the final prompt for Gemini
             # The prompt from edit_options already contains detailed instructions,
             # so we just wrap it with preservation guidelines
             logger.info("🎯 Preparing prompt for Gemini (no GPT enhancement)...")
-            if language == "en":
-                full_prompt = get_image_processing_prompt_en(prompt, subject)
-            else:
-                full_prompt = get_image_processing_prompt_de(prompt, subject)
+            full_prompt = self.build_full_prompt(prompt, subject, language)
 
             # Prepare content for Gemini
             contents = [full_prompt, input_image]
@@ -158,7 +197,9 @@ class ImageProcessingService:
             gemini_start = time.time()
 
             # Call Gemini API
-            response = self.gemini_client.models.generate_content(
+            response = await call_upstream(
+                GEMINI,
+                self.gemini_client.models.generate_content,
                 model=self.gemini_model,
                 contents=contents,
             )
@@ -168,89 +209,263 @@ class ImageProcessingService:
 
             duration = time.time() - start_time
 
-            # Extract and process the result image
-            logger.info("🔍 Extracting result image from Gemini response...")
-            for part in response.candidates[0].content.parts:
-                if part.inline_data is not None:
-                    try:
-                        # Get the raw image data
-                        result_image_data = part.inline_data.data
-                        logger.info(
-                            f"📦 Received image data: {len(result_image_data)} bytes"
-                        )
+            # Extract the result image (raw bytes, no re-encode)
+            result_bytes, mime_type = await run_blocking(
+                self._extract_result_image, response
+            )
+            logger.info(f"🎉 Image processing successful! Total time: {duration:.2f}s")
 
-                        # Handle different data formats
-                        if isinstance(
-                            result_image_data, bytes
-                        ) and result_image_data.startswith(b"\x89PNG"):
-                            # Already binary PNG data
-                            logger.info("✅ Image data is already in binary PNG format")
-                            processed_data = result_image_data
-                        else:
-                            # Try base64 decoding
-                            logger.info("🔄 Attempting base64 decoding...")
-                            try:
-                                processed_data = base64.b64decode(result_image_data)
-                                if not processed_data.startswith(b"\x89PNG"):
-                                    # If not PNG after decoding, use original
-                                    logger.warning(
-                                        "⚠️ Decoded data is not PNG, using original"
-                                    )
-                                    processed_data = result_image_data
-                                else:
-                                    logger.info("✅ Successfully decoded base64 to PNG")
-                            except Exception as decode_error:
-                                logger.warning(
-                                    f"⚠️ Base64 decode failed: {decode_error}, using original data"
-                                )
-                                processed_data = result_image_data
-
-                        # Convert to PIL Image and then to base64
-                        logger.info("🖼️ Converting to PIL Image...")
-                        result_image = Image.open(BytesIO(processed_data))
-                        result_size = result_image.size
-                        result_mode = result_image.mode
+            return result_bytes, mime_type, duration
 
-                        logger.info(
-                            f"📊 Result image: {result_size[0]}x{result_size[1]} pixels, mode: {result_mode}"
-                        )
+        except UpstreamUnavailableError:
+            # Not an input problem: surfaced as 503 instead of a 400
+            raise
+        except Exception as e:
+            duration = time.time() - start_time
+            logger.error(f"❌ Image processing failed after {duration:.2f}s: {str(e)}")
+            raise ValueError(f"Image processing failed: {str(e)}")
+
+    def build_full_prompt(
+        self, prompt: str, subject: str = None, language: str = "en"
+    ) -> str:
+        """
+        Wrap an edit prompt with the preservation guidelines sent to Gemini.
+
+        Args:
+            prompt: Edit instruction (edit option prompt, transcription, ...)
+            subject: What the child drew
+            language: Prompt language ('en' or 'de')
+
+        Returns:
+            Final prompt for Gemini
+        """
+
+        if language == "en":
+            return get_image_processing_prompt_en(prompt, subject)
+        return get_image_processing_prompt_de(prompt, subject)
+
+    async def generate_edited_image(
+        self,
+        image_data: bytes,
+        prompt: str,
+        user_id: UUID,
+        subject: str = None,
+        language: str = "en",
+        on_progress: ProgressCallback = None,
+    ) -> Tuple[Optional[str], Optional[str], float]:
+        """
+        Produce the edited image for a drawing and store it in Spaces.
+
+        Identical edits are served from the edit result cache: a hit reuses the
+        edited image already in Spaces and skips both Gemini and the upload.
+
+        Args:
+            image_data: Raw input image bytes
+            prompt: Edit instruction
+            user_id: UUID of the user editing the image
+            subject: What the child drew
+            language: Prompt language ('en' or 'de')
+            on_progress: Optional callback for 'upstream_started' and 'result_stored'
+
+        Returns:
+            Tuple of (edited_image_url, result_base64, processing_time).
+            Exactly one of edited_image_url and result_base64 is set: the base64
+            image is only produced as a fallback when the upload failed.
+        """
+
+        start_time = time.time()
+        cache_key = edit_result_cache.build_key(
+            image_data,
+            self.build_full_prompt(prompt, subject, language),
+            subject,
+            language,
+            self.gemini_model,
+            user_id,
+        )
+
+        cached_url = await edit_result_cache.get(cache_key)
+        if cached_url:
+            logger.info(f"♻️ Reusing cached edited image: {cached_url}")
+            await report_progress(
+                on_progress, "result_stored", edited_image_url=cached_url, cached=True
+            )
+            return cached_url, None, time.time() - start_time
+
+        await report_progress(on_progress, "upstream_started")
+        result_bytes, mime_type, processing_time = await self.process_image(
+            image_data, prompt, subject, language
+        )
+
+        edited_image_url = None
+        if self.storage_service:
+            try:
+                logger.info("📤 Uploading edited image to Spaces...")
+                edited_image_url = await call_upstream(
+                    SPACES,
+                    self.storage_service.upload_image_from_bytes,
+                    result_bytes,
+                    user_id,
+                    image_type="edited",
+                    content_type=mime_type,
+                )
+                logger.info(f"✅ Edited image uploaded: {edited_image_url}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to upload edited image: {e}")
+
+        # Base64 is only produced for the DB fallback when Spaces is unavailable
+        result_base64 = None
+        if not edited_image_url:
+            result_base64 = base64.b64encode(result_bytes).decode("utf-8")
+
+        # Only results stored in Spaces are cached (the cache holds pointers)
+        if edited_image_url:
+            await edit_result_cache.put(cache_key, edited_image_url)
+
+        await report_progress(
+            on_progress,
+            "result_stored",
+            edited_image_url=edited_image_url,
+            cached=False,
+        )
+
+        return edited_image_url, result_base64, processing_time
+
+    def _prepare_input_image(self, image_data: bytes) -> Any:
+        """
+        Turn the uploaded image into the image part sent to Gemini.
+
+        With IMAGE_NORMALIZATION_ENABLED the image is EXIF-rotated, stripped of
+        metadata, capped to IMAGE_NORMALIZATION_MAX_EDGE and re-encoded as JPEG,
+        which shrinks the request and the upstream processing time.
+
+        Args:
+            image_data: Raw image bytes
+
+        Returns:
+            types.Part with the normalized JPEG, or a PIL Image if disabled
+        """
+
+        if not settings.IMAGE_NORMALIZATION_ENABLED:
+            return self._load_input_image(image_data)
+
+        normalized = normalize_image(
+            image_data,
+            max_edge=settings.IMAGE_NORMALIZATION_MAX_EDGE,
+            quality=settings.IMAGE_NORMALIZATION_JPEG_QUALITY,
+        )
+        logger.info(
+            f"📊 Normalized image: {normalized.original_width}x{normalized.original_height} "
+            f"({normalized.original_size_bytes} bytes) → {normalized.width}x{normalized.height} "
+            f"({len(normalized.data)} bytes)"
+        )
+        metrics.observe("gemini.input_bytes", len(normalized.data))
+
+        return types.Part.from_bytes(
+            data=normalized.data, mime_type=normalized.mime_type
+        )
+
+    def _load_input_image(self, image_data: bytes) -> Image.Image:
+        """
+        Decode the uploaded image and make sure it is in RGB mode.
+
+        Args:
+            image_data: Raw image bytes
+
+        Returns:
+            PIL Image ready to be sent to Gemini
+        """
+
+        input_image = Image.open(BytesIO(image_data))
+        original_size = input_image.size
+        original_mode = input_image.mode
+
+        logger.info(
+            f"📊 Image info: {original_size[0]}x{original_size[1]} pixels, mode: {original_mode}"
+        )
+
+        # Ensure image is in RGB mode
+        if input_image.mode != "RGB":
+            logger.info(f"🔄 Converting image from {input_image.mode} to RGB")
+            input_image = input_image.convert("RGB")
+
+        return input_image
+
+    def _extract_result_image(self, response: Any) -> Tuple[bytes, str]:
+        """
+        Extract the edited image from a Gemini response as raw bytes.
+
+        The bytes are passed through untouched: Gemini already returns an encoded
+        image, so decoding and re-encoding it would only burn CPU and memory.
+        Only the header is parsed (to verify the image and log its size), and the
+        image is re-encoded only if its format is not one we can store directly.
+
+        Args:
+            response: Gemini generate_content response
+
+        Returns:
+            Tuple of (image_bytes, mime_type)
+
+        Raises:
+            ValueError: If the response has no usable image data
+        """
 
-                        # Convert to RGB if necessary
-                        if result_image.mode != "RGB":
-                            logger.info(
-                                f"🔄 Converting result from {result_image.mode} to RGB"
+        logger.info("🔍 Extracting result image from Gemini response...")
+        for part in response.candidates[0].content.parts:
+            if part.inline_data is not None:
+                try:
+                    # Get the raw image data
+                    result_image_data = part.inline_data.data
+                    logger.info(
+                        f"📦 Received image data: {len(result_image_data)} bytes"
+                    )
+
+                    # Handle different data formats
+                    mime_type = (
+                        sniff_image_mime_type(result_image_data)
+                        if isinstance(result_image_data, bytes)
+                        else None
+                    )
+                    if not mime_type:
+                        # Try base64 decoding
+                        logger.info("🔄 Attempting base64 decoding...")
+                        try:
+                            decoded_data = base64.b64decode(result_image_data)
+                            mime_type = sniff_image_mime_type(decoded_data)
+                            if mime_type:
+                                logger.info("✅ Successfully decoded base64 image")
+                                result_image_data = decoded_data
+                        except Exception as decode_error:
+                            logger.warning(
+                                f"⚠️ Base64 decode failed: {decode_error}, using original data"
                             )
-                            result_image = result_image.convert("RGB")
 
-                        # Convert to base64 for response
-                        logger.info("📤 Converting to base64 for response...")
-                        buffered = BytesIO()
-                        result_image.save(buffered, format="PNG")
-                        img_base64 = base64.b64encode(buffered.getvalue()).decode(
-                            "utf-8"
-                        )
+                    # Parses the header only, the pixels are not decoded
+                    result_image = Image.open(BytesIO(result_image_data))
+                    result_size = result_image.size
+                    logger.info(
+                        f"📊 Result image: {result_size[0]}x{result_size[1]} pixels, "
+                        f"format: {result_image.format}, mode: {result_image.mode}"
+                    )
 
-                        base64_size = len(img_base64)
+                    if not mime_type:
+                        # Unknown container: this is the only case that needs a transform
                         logger.info(
-                            f"✅ Base64 conversion complete: {base64_size} characters"
+                            f"🔄 Re-encoding {result_image.format} result to PNG"
                         )
-                        logger.info(
-                            f"🎉 Image processing successful! Total time: {duration:.2f}s"
-                        )
-
-                        return img_base64, duration
+                        buffered = BytesIO()
+                        result_image.save(buffered, format="PNG")
+                        result_image_data = buffered.getvalue()
+                        mime_type = "image/png"
 
-                    except Exception as img_error:
-                        logger.error(f"❌ Failed to process result image: {img_error}")
-                        raise ValueError(f"Failed to process result image: {img_error}")
+                    logger.info(f"✅ Result image ready ({mime_type}, passthrough)")
+                    return result_image_data, mime_type
 
-            logger.error("❌ No image data received in Gemini response")
-            raise ValueError("No image data received in response")
+                except Exception as img_error:
+                    logger.error(f"❌ Failed to process result image: {img_error}")
+                    raise ValueError(f"Failed to process result image: {img_error}")
 
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"❌ Image processing failed after {duration:.2f}s: {str(e)}")
-            raise ValueError(f"Image processing failed: {str(e)}")
+        logger.error("❌ No image data received in Gemini response")
+        raise ValueError("No image data received in response")
 
     def validate_image(self, image_data: bytes) -> bool:
         """
@@ -297,6 +512,175 @@ class ImageProcessingService:
             logger.error(f"Failed to get image info: {e}")
             return {}
 
+    async def _download_original(
+        self, image_url: str, user_id: UUID, on_progress: ProgressCallback = None
+    ) -> bytes:
+        """
+        Validate that an image URL belongs to the user and download it from Spaces.
+
+        Args:
+            image_url: URL of existing image from Spaces
+            user_id: UUID of the user editing the image
+            on_progress: Optional callback for 'original_downloaded'
+
+        Returns:
+            Raw image bytes
+
+        Raises:
+            ValueError: If the URL is invalid, not owned by the user or the download fails
+        """
+
+        logger.info(f"🔄 Re-editing existing image from URL: {image_url}")
+
+        if not self.storage_service:
+            raise ValueError("Storage service not available to load image_url")
+
+        # Validate URL and extract user_id
+        try:
+            url_user_id = self.storage_service.validate_and_extract_user_id(image_url)
+            # Verify the URL belongs to the current user
+            if url_user_id != user_id:
+                raise ValueError("Image URL does not belong to the current user")
+            logger.info("✅ URL validated and belongs to current user")
+        except Exception as e:
+            raise ValueError(f"Invalid image URL: {str(e)}")
+
+        # Download image from Spaces
+        try:
+            logger.info("📥 Downloading image from Spaces...")
+            image_data = await call_upstream(
+                SPACES,
+                self.storage_service.download_image_as_bytes,
+                image_url,
+                hedge=True,
+            )
+            logger.info(f"✅ Image downloaded: {len(image_data)} bytes")
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to download image from Spaces: {str(e)}")
+
+        await report_progress(
+            on_progress, "original_downloaded", original_image_url=image_url
+        )
+        return image_data
+
+    async def _upload_original(
+        self, image_data: bytes, user_id: UUID, on_progress: ProgressCallback = None
+    ) -> Optional[str]:
+        """
+        Upload the original drawing to Spaces.
+
+        A failed upload is logged and does not fail the edit.
+
+        Args:
+            image_data: Raw image bytes
+            user_id: UUID of the user
+            on_progress: Optional callback for 'original_uploaded'
+
+        Returns:
+            Public URL of the original image, or None if the upload failed
+        """
+
+        if not self.storage_service:
+            return None
+
+        try:
+            logger.info("📤 Uploading original image to Spaces...")
+            original_image_url = await call_upstream(
+                SPACES,
+                self.storage_service.upload_image_from_bytes,
+                image_data,
+                user_id,
+                image_type="original",
+                content_type=sniff_image_mime_type(image_data) or "image/png",
+            )
+            logger.info(f"✅ Original image uploaded: {original_image_url}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to upload original image: {e}")
+            # Continue without storing original URL
+            return None
+
+        await report_progress(
+            on_progress, "original_uploaded", original_image_url=original_image_url
+        )
+        return original_image_url
+
+    async def _save_edit_to_drawing(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        edited_images: List[str],
+        original_image_url: Optional[str],
+        tutorial_id: UUID = None,
+        drawing_id: UUID = None,
+    ) -> Drawing:
+        """
+        Save edited images: append them to an existing drawing or create a new one.
+
+        Args:
+            db: Async database session
+            user_id: UUID of the user editing the image
+            edited_images: Edited image URLs (or base64 fallbacks), saved in one write
+            original_image_url: URL of the original image
+            tutorial_id: Optional UUID of the associated tutorial
+            drawing_id: Optional UUID of existing drawing to append edit to
+
+        Returns:
+            Saved Drawing instance
+
+        Raises:
+            ValueError: If the drawing does not exist or belongs to another user
+        """
+
+        if not drawing_id:
+            # New drawing: Create a new entry
+            logger.info("📝 Creating new drawing entry")
+            return await Drawing.create(
+                db,
+                user_id=user_id,
+                tutorial_id=tutorial_id,
+                uploaded_image_url=original_image_url,
+                edited_images_urls=list(edited_images),
+            )
+
+        # Re-editing: Fetch existing drawing and append to edited_images_urls
+        logger.info(f"📝 Appending edit to existing drawing: {drawing_id}")
+
+        try:
+            # Fetch the existing drawing
+            existing_drawing = await Drawing.get_by_id(db, drawing_id)
+
+            if not existing_drawing:
+                raise ValueError(f"Drawing with ID {drawing_id} not found")
+
+            # Verify the drawing belongs to the current user
+            if existing_drawing.user_id != user_id:
+                raise ValueError("Drawing does not belong to the current user")
+
+            # Get current edited_images_urls or initialize as empty list
+            current_edits = existing_drawing.edited_images_urls or []
+
+            # Append the new edited image URLs
+            current_edits.extend(edited_images)
+
+            # Mark array as modified for PostgreSQL before updating
+            attributes.flag_modified(existing_drawing, "edited_images_urls")
+
+            # Update the drawing using the update method
+            saved_drawing = await Drawing.update(
+                db, drawing_id, {"edited_images_urls": current_edits}
+            )
+
+            logger.info(
+                f"✅ Edit appended to drawing. Total edits: {len(current_edits)}"
+            )
+            return saved_drawing
+
+        except Exception as e:
+            logger.error(f"❌ Failed to append edit to existing drawing: {str(e)}")
+            raise ValueError(f"Failed to append edit to drawing: {str(e)}")
+
     async def edit_image_with_prompt(
         self,
         db: AsyncSession,
@@ -307,12 +691,17 @@ class ImageProcessingService:
         drawing_id: UUID = None,
         image_data: bytes = None,
         image_url: str = None,
+        language: str = "en",
+        on_progress: ProgressCallback = None,
     ) -> dict:
         """
         Complete image editing flow: validate, process, and save to database and Spaces.
         Supports both file upload and existing image URL from Spaces.
         If drawing_id is provided, appends the edited image to the existing drawing's edited_images_urls.
 
+        For new uploads, the original upload to Spaces runs concurrently with the
+        Gemini edit (the two do not depend on each other).
+
         Args:
             db: Async database session
             prompt: Processing instruction
@@ -322,9 +711,12 @@ class ImageProcessingService:
             drawing_id: Optional UUID of existing drawing to append edit to
             image_data: Raw image bytes (for new uploads)
             image_url: URL of existing image from Spaces (for re-editing)
+            language: Prompt language ('en' or 'de')
+            on_progress: Optional callback receiving stage events (see src/utils/progress.py)
 
         Returns:
-            Dictionary with drawing_id, original_image_url, edited_image_url, and processing_time
+            Dictionary with drawing_id, original_image_url, edited_image_url,
+            processing_time and stage_timings
 
         Raises:
             ValueError: If image validation fails or processing fails
@@ -334,56 +726,23 @@ class ImageProcessingService:
         if not image_data and not image_url:
             raise ValueError("Either image_data or image_url must be provided")
 
-        original_image_url = None
+        timings = StageTimings()
 
         # Step 1: Handle image source (file upload or existing URL)
         if image_url:
             # Re-editing: Use existing image from Spaces
-            logger.info(f"🔄 Re-editing existing image from URL: {image_url}")
-
-            # Validate URL and extract user_id
-            if self.storage_service:
-                try:
-                    url_user_id = self.storage_service.validate_and_extract_user_id(
-                        image_url
-                    )
-                    # Verify the URL belongs to the current user
-                    if url_user_id != user_id:
-                        raise ValueError(
-                            "Image URL does not belong to the current user"
-                        )
-                    logger.info("✅ URL validated and belongs to current user")
-                except Exception as e:
-                    raise ValueError(f"Invalid image URL: {str(e)}")
-
-            # Download image from Spaces
-            if self.storage_service:
-                try:
-                    logger.info("📥 Downloading image from Spaces...")
-                    image_data = self.storage_service.download_image_as_bytes(image_url)
-                    logger.info(f"✅ Image downloaded: {len(image_data)} bytes")
-                    original_image_url = image_url  # Reuse existing URL
-                except Exception as e:
-                    raise ValueError(f"Failed to download image from Spaces: {str(e)}")
+            image_data = await timings.run(
+                "download_original",
+                self._download_original(image_url, user_id, on_progress),
+            )
+            original_image_url = image_url  # Reuse existing URL
         else:
-            # New upload: Upload original image to Spaces
+            # New upload: validate before anything is sent upstream
             logger.info("📤 Processing new image upload...")
-
-            # Validate image
             if not self.validate_image(image_data):
                 raise ValueError("Invalid image or image too large (max 2048x2048)")
 
-            # Upload original image to Spaces
-            if self.storage_service:
-                try:
-                    logger.info("📤 Uploading original image to Spaces...")
-                    original_image_url = self.storage_service.upload_image_from_bytes(
-                        image_data, user_id, image_type="original"
-                    )
-                    logger.info(f"✅ Original image uploaded: {original_image_url}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to upload original image: {e}")
-                    # Continue without storing original URL
+        await report_progress(on_progress, "validated")
 
         # Get image info for logging
         image_info = self.get_image_info(image_data)
@@ -391,78 +750,55 @@ class ImageProcessingService:
 
         logger.info(f"===== Using subject '{subject}' =====")
 
-        # Step 2: Process the image
-        result_base64, processing_time = self.process_image(image_data, prompt, subject)
-
-        # Step 3: Upload edited image to Spaces
-        edited_image_url = None
-        if self.storage_service:
-            try:
-                logger.info("📤 Uploading edited image to Spaces...")
-                edited_image_url = self.storage_service.upload_image_from_base64(
-                    result_base64, user_id, image_type="edited"
+        # Step 2-3: Process the image and upload it to Spaces (or reuse a cached edit),
+        # uploading a new original at the same time
+        async with concurrent_stages() as tg:
+            if not image_url:
+                upload_task = tg.create_task(
+                    timings.run(
+                        "upload_original",
+                        self._upload_original(image_data, user_id, on_progress),
+                    )
                 )
-                logger.info(f"✅ Edited image uploaded: {edited_image_url}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to upload edited image: {e}")
-                # Continue with base64 as fallback
-
-        # Step 4: Save drawing to database with URLs
-        if drawing_id:
-            # Re-editing: Fetch existing drawing and append to edited_images_urls
-            logger.info(f"📝 Appending edit to existing drawing: {drawing_id}")
-
-            try:
-                # Fetch the existing drawing
-                existing_drawing = await Drawing.get_by_id(db, drawing_id)
-
-                if not existing_drawing:
-                    raise ValueError(f"Drawing with ID {drawing_id} not found")
-
-                # Verify the drawing belongs to the current user
-                if existing_drawing.user_id != user_id:
-                    raise ValueError("Drawing does not belong to the current user")
-
-                # Get current edited_images_urls or initialize as empty list
-                current_edits = existing_drawing.edited_images_urls or []
-
-                # Append the new edited image URL
-                new_edited_url = edited_image_url if edited_image_url else result_base64
-                current_edits.append(new_edited_url)
-
-                # Mark array as modified for PostgreSQL before updating
-                attributes.flag_modified(existing_drawing, "edited_images_urls")
-
-                # Update the drawing using the update method
-                saved_drawing = await Drawing.update(
-                    db, drawing_id, {"edited_images_urls": current_edits}
+            edit_task = tg.create_task(
+                timings.run(
+                    "edit",
+                    self.generate_edited_image(
+                        image_data,
+                        prompt,
+                        user_id,
+                        subject=subject,
+                        language=language,
+                        on_progress=on_progress,
+                    ),
                 )
+            )
 
-                logger.info(
-                    f"✅ Edit appended to drawing. Total edits: {len(current_edits)}"
-                )
+        if not image_url:
+            original_image_url = upload_task.result()
+        edited_image_url, result_base64, processing_time = edit_task.result()
 
-            except Exception as e:
-                logger.error(f"❌ Failed to append edit to existing drawing: {str(e)}")
-                raise ValueError(f"Failed to append edit to drawing: {str(e)}")
-        else:
-            # New drawing: Create a new entry
-            logger.info("📝 Creating new drawing entry")
-            saved_drawing = await Drawing.create(
+        # Step 4: Save drawing to database with URLs
+        saved_drawing = await timings.run(
+            "save_drawing",
+            self._save_edit_to_drawing(
                 db,
-                user_id=user_id,
+                user_id,
+                [edited_image_url or result_base64],
+                original_image_url,
                 tutorial_id=tutorial_id,
-                uploaded_image_url=original_image_url,
-                edited_images_urls=(
-                    [edited_image_url] if edited_image_url else [result_base64]
-                ),
-            )
+                drawing_id=drawing_id,
+            ),
+        )
+        await report_progress(on_progress, "db_saved", drawing_id=str(saved_drawing.id))
+        story_pregenerator.schedule(user_id, saved_drawing.id, edited_image_url)
 
         return {
             "drawing_id": str(saved_drawing.id),
             "original_image_url": original_image_url,
             "edited_image_url": edited_image_url,
             "processing_time": processing_time,
+            "stage_timings": timings.as_dict(),
         }
 
     async def edit_image_with_audio(
@@ -477,12 +813,17 @@ class ImageProcessingService:
         drawing_id: UUID = None,
         image_data: bytes = None,
         image_url: str = None,
+        on_progress: ProgressCallback = None,
     ) -> dict:
         """
         Complete image editing flow with audio: transcribe, process, and save to database and Spaces.
         Supports both file upload and existing image URL from Spaces.
         If drawing_id is provided, appends the edited image to the existing drawing's edited_images_urls.
 
+        The transcription runs concurrently with the image download (re-edits) or
+        the original upload (new uploads); the Gemini edit starts as soon as both
+        the transcription and the image bytes are available.
+
         Args:
             db: Async database session
             audio_data: Raw audio bytes
@@ -494,16 +835,17 @@ class ImageProcessingService:
             drawing_id: Optional UUID of existing drawing to append edit to
             image_data: Raw image bytes (for new uploads)
             image_url: URL of existing image from Spaces (for re-editing)
+            on_progress: Optional callback receiving stage events (see src/utils/progress.py)
 
         Returns:
-            Dictionary with drawing_id, original_image_url, edited_image_url, prompt, and processing_time
+            Dictionary with drawing_id, original_image_url, edited_image_url,
+            transcribed_text, processing_time and stage_timings
 
         Raises:
             ValueError: If validation or processing fails
         """
 
-        # Initialize Audio Service
-        audio_service = AudioService()
+        audio_service = self.audio_service
 
         # Validate that either image_data or image_url is provided
         if not image_data and not image_url:
@@ -525,150 +867,289 @@ class ImageProcessingService:
                 f"Invalid audio file. Supported formats: {', '.join(supported['formats'])}. Max size: {supported['max_size_mb']}MB"
             )
 
-        original_image_url = None
-
-        # Step 1: Handle image source (file upload or existing URL)
-        if image_url:
-            # Re-editing: Use existing image from Spaces
-            logger.info(f"🔄 Re-editing existing image from URL: {image_url}")
-
-            # Validate URL and extract user_id
-            if self.storage_service:
-                try:
-                    url_user_id = self.storage_service.validate_and_extract_user_id(
-                        image_url
-                    )
-                    # Verify the URL belongs to the current user
-                    if url_user_id != user_id:
-                        raise ValueError(
-                            "Image URL does not belong to the current user"
-                        )
-                    logger.info("✅ URL validated and belongs to current user")
-                except Exception as e:
-                    raise ValueError(f"Invalid image URL: {str(e)}")
-
-            # Download image from Spaces
-            if self.storage_service:
-                try:
-                    logger.info("📥 Downloading image from Spaces...")
-                    image_data = self.storage_service.download_image_as_bytes(image_url)
-                    logger.info(f"✅ Image downloaded: {len(image_data)} bytes")
-                    original_image_url = image_url  # Reuse existing URL
-                except Exception as e:
-                    raise ValueError(f"Failed to download image from Spaces: {str(e)}")
-        else:
-            # New upload: Upload original image to Spaces
+        # Validate a new upload before anything is sent upstream
+        if not image_url:
             logger.info("📤 Processing new image upload...")
-
-            # Validate image
             if not self.validate_image(image_data):
                 raise ValueError("Invalid image or image too large (max 2048x2048)")
+            logger.info(f"Processing image: {self.get_image_info(image_data)}")
 
-            # Upload original image to Spaces
-            if self.storage_service:
-                try:
-                    logger.info("📤 Uploading original image to Spaces...")
-                    original_image_url = self.storage_service.upload_image_from_bytes(
-                        image_data, user_id, image_type="original"
-                    )
-                    logger.info(f"✅ Original image uploaded: {original_image_url}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to upload original image: {e}")
-
-        # Get file info for logging
-        image_info = self.get_image_info(image_data)
         audio_info = audio_service.get_audio_info(audio_data, audio_filename)
-        logger.info(f"Processing image: {image_info}")
         logger.info(f"Processing audio: {audio_info}")
 
-        # Step 2: Transcribe audio to text
-        transcribed_text, transcription_time = audio_service.transcribe_audio(
-            audio_data, language, audio_filename
-        )
-        logger.info(f"🎤 Transcribed Text: '{transcribed_text}'")
+        await report_progress(on_progress, "validated")
+
+        timings = StageTimings()
+
+        async def edit_when_ready():
+            # The edit needs both the image bytes and the transcription
+            source_image = await image_task if image_url else image_data
+            transcribed_text, _ = await transcribe_task
+            return await timings.run(
+                "edit",
+                self.generate_edited_image(
+                    source_image,
+                    transcribed_text,
+                    user_id,
+                    subject=subject,
+                    language=language,
+                    on_progress=on_progress,
+                ),
+            )
+
+        async def transcribe():
+            result = await timings.run(
+                "transcribe",
+                audio_service.transcribe(audio_data, language, audio_filename),
+            )
+            logger.info(f"🎤 Transcribed Text: '{result[0]}'")
+            await report_progress(
+                on_progress, "transcribed", transcribed_text=result[0]
+            )
+            return result
+
+        # Step 1-4: Load or upload the image, transcribe, edit and upload the result
+        async with concurrent_stages() as tg:
+            if image_url:
+                image_task = tg.create_task(
+                    timings.run(
+                        "download_original",
+                        self._download_original(image_url, user_id, on_progress),
+                    )
+                )
+            else:
+                upload_task = tg.create_task(
+                    timings.run(
+                        "upload_original",
+                        self._upload_original(image_data, user_id, on_progress),
+                    )
+                )
+            transcribe_task = tg.create_task(transcribe())
+            edit_task = tg.create_task(edit_when_ready())
+
+        original_image_url = image_url if image_url else upload_task.result()
+        transcribed_text, transcription_time = transcribe_task.result()
+        edited_image_url, result_base64, processing_time = edit_task.result()
 
         # Ignore enhancement step it is comletely chaging the prompt and complicating it
-        # Step 3: Enhance the transcribed text with GPT (short, preservation-focused)
         # enhanced_prompt = self.enhance_voice_prompt(transcribed_text, subject)
 
-        # Step 3: Process the image with the transcribed text
-        result_base64, processing_time = self.process_image(
-            image_data, transcribed_text, subject, language
+        # Step 5: Save drawing to database with URLs
+        saved_drawing = await timings.run(
+            "save_drawing",
+            self._save_edit_to_drawing(
+                db,
+                user_id,
+                [edited_image_url or result_base64],
+                original_image_url,
+                tutorial_id=tutorial_id,
+                drawing_id=drawing_id,
+            ),
         )
+        await report_progress(on_progress, "db_saved", drawing_id=str(saved_drawing.id))
+        story_pregenerator.schedule(user_id, saved_drawing.id, edited_image_url)
 
-        # Step 4: Upload edited image to Spaces
-        edited_image_url = None
-        if self.storage_service:
-            try:
-                logger.info("📤 Uploading edited image to Spaces...")
-                edited_image_url = self.storage_service.upload_image_from_base64(
-                    result_base64, user_id, image_type="edited"
-                )
-                logger.info(f"✅ Edited image uploaded: {edited_image_url}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to upload edited image: {e}")
+        total_time = transcription_time + processing_time
 
-        # Step 5: Save drawing to database with URLs
-        if drawing_id:
-            # Re-editing: Fetch existing drawing and append to edited_images_urls
-            logger.info(f"📝 Appending audio edit to existing drawing: {drawing_id}")
+        return {
+            "drawing_id": str(saved_drawing.id),
+            "original_image_url": original_image_url,
+            "edited_image_url": edited_image_url,
+            "transcribed_text": transcribed_text,
+            "processing_time": total_time,
+            "stage_timings": timings.as_dict(),
+        }
 
-            try:
-                # Fetch the existing drawing
-                existing_drawing = await Drawing.get_by_id(db, drawing_id)
+    async def batch_edit_with_options(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        edit_option_ids: List[UUID],
+        language: str = "en",
+        subject: str = None,
+        tutorial_id: UUID = None,
+        drawing_id: UUID = None,
+        image_data: bytes = None,
+        image_url: str = None,
+        on_progress: ProgressCallback = None,
+    ) -> dict:
+        """
+        Apply several edit options to one drawing.
 
-                if not existing_drawing:
-                    raise ValueError(f"Drawing with ID {drawing_id} not found")
+        The original is read (downloaded or validated) and stored once, then the
+        Gemini edits fan out with at most EDIT_BATCH_CONCURRENCY running at a time.
+        An option that fails does not fail the batch. All edited images are saved
+        to the drawing in a single database write.
+
+        Args:
+            db: Async database session
+            user_id: UUID of the user editing the image
+            edit_option_ids: EditOption IDs to apply (duplicates are ignored)
+            language: Prompt language ('en' or 'de')
+            subject: What the child drew (defaults to each option's tutorial subject)
+            tutorial_id: Optional UUID of the associated tutorial (new drawings)
+            drawing_id: UUID of an existing drawing to edit and append the results to
+            image_data: Raw image bytes (for new uploads)
+            image_url: URL of a specific image of the drawing to edit
+                (defaults to the drawing's original upload)
+            on_progress: Optional callback receiving stage events; each finished
+                option is reported as 'option_result'
 
-                # Verify the drawing belongs to the current user
-                if existing_drawing.user_id != user_id:
-                    raise ValueError("Drawing does not belong to the current user")
+        Returns:
+            Dictionary with drawing_id, original_image_url, results (one per option,
+            in request order), processing_time and stage_timings
 
-                # Get current edited_images_urls or initialize as empty list
-                current_edits = existing_drawing.edited_images_urls or []
+        Raises:
+            ValueError: If validation fails or every option failed
+        """
 
-                # Append the new edited image URL
-                new_edited_url = edited_image_url if edited_image_url else result_base64
-                current_edits.append(new_edited_url)
+        # Deduplicate while keeping the requested order
+        edit_option_ids = list(dict.fromkeys(edit_option_ids))
 
-                # Mark array as modified for PostgreSQL before updating
-                attributes.flag_modified(existing_drawing, "edited_images_urls")
+        if not edit_option_ids:
+            raise ValueError("At least one edit option must be provided")
+        if len(edit_option_ids) > settings.EDIT_BATCH_MAX_OPTIONS:
+            raise ValueError(
+                f"Too many edit options (max {settings.EDIT_BATCH_MAX_OPTIONS})"
+            )
+        if language not in ["en", "de"]:
+            raise ValueError("Invalid language. Please provide 'en' or 'de'.")
+        if not image_data and not drawing_id:
+            raise ValueError("Either image_data or drawing_id must be provided")
 
-                # Update the drawing using the update method
-                saved_drawing = await Drawing.update(
-                    db, drawing_id, {"edited_images_urls": current_edits}
-                )
+        options = await EditOptionRepository.find_by_ids(db, edit_option_ids)
+        options_by_id = {option.id: option for option in options}
+        missing = [str(i) for i in edit_option_ids if i not in options_by_id]
+        if missing:
+            raise ValueError(f"Edit options not found: {', '.join(missing)}")
 
-                logger.info(
-                    f"✅ Audio edit appended to drawing. Total edits: {len(current_edits)}"
-                )
+        timings = StageTimings()
+        new_upload = bool(image_data)
 
-            except Exception as e:
-                logger.error(
-                    f"❌ Failed to append audio edit to existing drawing: {str(e)}"
-                )
-                raise ValueError(f"Failed to append edit to drawing: {str(e)}")
+        # Step 1: Resolve the source image once for all options
+        if new_upload:
+            logger.info("📤 Processing new image upload...")
+            if not self.validate_image(image_data):
+                raise ValueError("Invalid image or image too large (max 2048x2048)")
         else:
-            # New drawing: Create a new entry
-            logger.info("📝 Creating new drawing entry with audio edit")
-            saved_drawing = await Drawing.create(
+            drawing = await Drawing.get_by_id(db, drawing_id)
+            if not drawing:
+                raise ValueError(f"Drawing with ID {drawing_id} not found")
+            if drawing.user_id != user_id:
+                raise ValueError("Drawing does not belong to the current user")
+
+            image_url = image_url or drawing.uploaded_image_url
+            if not image_url:
+                raise ValueError("Drawing has no stored image to edit")
+
+            image_data = await timings.run(
+                "download_original",
+                self._download_original(image_url, user_id, on_progress),
+            )
+
+        await report_progress(on_progress, "validated")
+
+        logger.info(
+            f"🎨 Batch editing with {len(edit_option_ids)} edit options "
+            f"(concurrency: {settings.EDIT_BATCH_CONCURRENCY})"
+        )
+
+        semaphore = asyncio.Semaphore(settings.EDIT_BATCH_CONCURRENCY)
+
+        async def apply_option(option) -> dict:
+            option_subject = subject or (
+                option.tutorial.subject_de
+                if language == "de"
+                else option.tutorial.subject_en
+            )
+            prompt = option.prompt_de if language == "de" else option.prompt_en
+
+            async with semaphore:
+                try:
+                    edited_image_url, result_base64, processing_time = (
+                        await self.generate_edited_image(
+                            image_data,
+                            prompt,
+                            user_id,
+                            subject=option_subject,
+                            language=language,
+                        )
+                    )
+                    result = {
+                        "edit_option_id": str(option.id),
+                        "success": True,
+                        "edited_image_url": edited_image_url,
+                        "processing_time": processing_time,
+                        "error": None,
+                    }
+                    # Only kept for the DB fallback when Spaces is unavailable
+                    saved_image = edited_image_url or result_base64
+                except Exception as e:
+                    logger.warning(f"⚠️ Edit option {option.id} failed: {e}")
+                    result = {
+                        "edit_option_id": str(option.id),
+                        "success": False,
+                        "edited_image_url": None,
+                        "processing_time": None,
+                        "error": str(e),
+                    }
+                    saved_image = None
+
+            await report_progress(on_progress, "option_result", **result)
+            return {**result, "saved_image": saved_image}
+
+        # Step 2-3: Store a new original while the edits run
+        async with concurrent_stages() as tg:
+            if new_upload:
+                upload_task = tg.create_task(
+                    timings.run(
+                        "upload_original",
+                        self._upload_original(image_data, user_id, on_progress),
+                    )
+                )
+            edits_task = tg.create_task(
+                timings.run(
+                    "edit",
+                    asyncio.gather(
+                        *(apply_option(options_by_id[i]) for i in edit_option_ids)
+                    ),
+                )
+            )
+
+        original_image_url = upload_task.result() if new_upload else image_url
+        results = edits_task.result()
+
+        saved_images = [r["saved_image"] for r in results if r["saved_image"]]
+        if not saved_images:
+            raise ValueError(f"All edits failed: {results[0]['error']}")
+
+        # Step 4: Save every edited image in a single write
+        saved_drawing = await timings.run(
+            "save_drawing",
+            self._save_edit_to_drawing(
                 db,
-                user_id=user_id,
+                user_id,
+                saved_images,
+                original_image_url,
                 tutorial_id=tutorial_id,
-                uploaded_image_url=original_image_url,
-                edited_images_urls=(
-                    [edited_image_url] if edited_image_url else [result_base64]
-                ),
-            )
+                drawing_id=drawing_id,
+            ),
+        )
+        await report_progress(on_progress, "db_saved", drawing_id=str(saved_drawing.id))
 
-        total_time = transcription_time + processing_time
+        logger.info(
+            f"✅ Batch edit finished: {len(saved_images)}/{len(results)} options succeeded"
+        )
 
+        stage_timings = timings.as_dict()
         return {
             "drawing_id": str(saved_drawing.id),
             "original_image_url": original_image_url,
-            "edited_image_url": edited_image_url,
-            "transcribed_text": transcribed_text,
-            "processing_time": total_time,
+            "results": [
+                {k: v for k, v in r.items() if k != "saved_image"} for r in results
+            ],
+            "processing_time": stage_timings["total"],
+            "stage_timings": stage_timings,
         }
 
     async def save_drawing_to_db(
@@ -704,6 +1185,10 @@ class ImageProcessingService:
         """
         Create an enhanced prompt for direct upload by combining subject and user request.
 
+        OpenAI errors are not caught here, so call_upstream can retry them and
+        count them against the breaker; the caller falls back to
+        fallback_direct_upload_prompt().
+
         Args:
             subject: What the child drew (e.g., "train", "dog", "flower")
             user_prompt: What they want to do with it (e.g., "make it fly", "add rainbow")
@@ -716,8 +1201,7 @@ class ImageProcessingService:
         )
         enhancement_start = time.time()
 
-        try:
-            enhancement_prompt = f"""A child drew a {subject} and wants you to: "{user_prompt}"
+        enhancement_prompt = f"""A child drew a {subject} and wants you to: "{user_prompt}"
 
 Generate a prompt (3-4 sentences) for an image editing AI.
 
@@ -740,29 +1224,30 @@ Child drew "car" and says "make it fly" → "Transform this child's car into a m
 Child drew "house" and says "add snow" → "Cover this child's house in beautiful white snow! Add snowflakes falling gently, icicles on the roof, and a cozy warm glow from the windows. Make it feel like a magical winter wonderland."
 """
 
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[{"role": "user", "content": enhancement_prompt}],
-                max_tokens=170,
-                temperature=0.65,
-            )
+        response = self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=[{"role": "user", "content": enhancement_prompt}],
+            max_tokens=170,
+            temperature=0.65,
+        )
 
-            enhancement_time = time.time() - enhancement_start
-            logger.info(
-                f"⚡ Direct upload prompt enhancement completed in {enhancement_time:.2f}s"
-            )
+        enhancement_time = time.time() - enhancement_start
+        logger.info(
+            f"⚡ Direct upload prompt enhancement completed in {enhancement_time:.2f}s"
+        )
 
-            if not response.choices or not response.choices[0].message.content:
-                logger.warning("⚠️ Empty response from OpenAI, using fallback")
-                return f"Transform this child's {subject} drawing: {user_prompt}. Keep the original drawing recognizable. Make it colorful and magical."
+        if not response.choices or not response.choices[0].message.content:
+            logger.warning("⚠️ Empty response from OpenAI, using fallback")
+            return self.fallback_direct_upload_prompt(subject, user_prompt)
 
-            enhanced = response.choices[0].message.content.strip()
-            logger.info(f"✅ Enhanced direct upload prompt: '{enhanced}'")
-            return enhanced
+        enhanced = response.choices[0].message.content.strip()
+        logger.info(f"✅ Enhanced direct upload prompt: '{enhanced}'")
+        return enhanced
 
-        except Exception as e:
-            logger.error(f"❌ Direct upload prompt enhancement failed: {e}")
-            return f"Transform this child's {subject} drawing: {user_prompt}. Keep the original drawing recognizable. Make it colorful and magical."
+    @staticmethod
+    def fallback_direct_upload_prompt(subject: str, user_prompt: str) -> str:
+        """Prompt used when the enhancement is unavailable or returns nothing."""
+        return f"Transform this child's {subject} drawing: {user_prompt}. Keep the original drawing recognizable. Make it colorful and magical."
 
     async def process_direct_upload(
         self,
@@ -774,6 +1259,7 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
         audio_data: bytes = None,
         audio_filename: str = None,
         language: str = "en",
+        on_progress: ProgressCallback = None,
     ) -> dict:
         """
         Process a direct upload: kid uploads any drawing with subject and prompt (text or audio).
@@ -787,9 +1273,11 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
             audio_data: Audio bytes (optional if prompt provided)
             audio_filename: Audio filename for format detection
             language: Language code for audio transcription ('en' or 'de')
+            on_progress: Optional callback receiving stage events (see src/utils/progress.py)
 
         Returns:
-            Dictionary with drawing_id, original_image_url, edited_image_url, prompt, processing_time
+            Dictionary with drawing_id, original_image_url, edited_image_url, prompt,
+            processing_time and stage_timings
 
         Raises:
             ValueError: If validation fails or processing fails
@@ -797,8 +1285,7 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
 
         logger.info(f"🎨 Processing direct upload - subject: '{subject}'")
 
-        # Initialize Audio Service
-        audio_service = AudioService()
+        audio_service = self.audio_service
 
         # Validate input: need either prompt or audio
         if not prompt and not audio_data:
@@ -813,9 +1300,7 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
         if not self.validate_image(image_data):
             raise ValueError("Invalid image or image too large (max 2048x2048)")
 
-        final_prompt = None
-
-        # Handle audio input
+        # Validate audio input
         if audio_data:
             if not audio_service:
                 raise ValueError("Audio service not available")
@@ -836,57 +1321,92 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
                     f"Invalid audio file. Supported formats: {', '.join(supported['formats'])}. Max size: {supported['max_size_mb']}MB"
                 )
 
-            # Transcribe audio
-            logger.info("🎤 Transcribing audio...")
-            transcribed_text, _ = audio_service.transcribe_audio(
-                audio_data, language, audio_filename or "audio.mp3"
-            )
-            logger.info(f"🎤 Transcribed: '{transcribed_text}'")
-            final_prompt = transcribed_text
-        else:
-            final_prompt = prompt
+        await report_progress(on_progress, "validated")
 
-        # Enhance prompt with subject context
-        enhanced_prompt = self.enhance_direct_upload_prompt(subject, final_prompt)
+        timings = StageTimings()
 
-        # Upload original image to Spaces
-        original_image_url = None
-        if self.storage_service:
+        async def resolve_prompt_and_edit():
+            # Transcribe → enhance → edit depend on each other; the original
+            # upload does not, so it runs alongside this chain
+            if audio_data:
+                logger.info("🎤 Transcribing audio...")
+                transcribed_text, _ = await timings.run(
+                    "transcribe",
+                    audio_service.transcribe(
+                        audio_data, language, audio_filename or "audio.mp3"
+                    ),
+                )
+                logger.info(f"🎤 Transcribed: '{transcribed_text}'")
+                await report_progress(
+                    on_progress, "transcribed", transcribed_text=transcribed_text
+                )
+                final_prompt = transcribed_text
+            else:
+                final_prompt = prompt
+
+            # Enhance prompt with subject context (the edit still runs without it)
             try:
-                logger.info("📤 Uploading original image to Spaces...")
-                original_image_url = self.storage_service.upload_image_from_bytes(
-                    image_data, user_id, image_type="original"
+                enhanced_prompt = await timings.run(
+                    "enhance_prompt",
+                    call_upstream(
+                        OPENAI_CHAT,
+                        self.enhance_direct_upload_prompt,
+                        subject,
+                        final_prompt,
+                    ),
+                )
+            except UpstreamUnavailableError as e:
+                logger.warning(
+                    f"⚠️ Prompt enhancement unavailable ({e}), using fallback"
+                )
+                enhanced_prompt = self.fallback_direct_upload_prompt(
+                    subject, final_prompt
                 )
-                logger.info(f"✅ Original image uploaded: {original_image_url}")
             except Exception as e:
-                logger.warning(f"⚠️ Failed to upload original image: {e}")
+                logger.error(f"❌ Direct upload prompt enhancement failed: {e}")
+                enhanced_prompt = self.fallback_direct_upload_prompt(
+                    subject, final_prompt
+                )
 
-        # Process the image
-        result_base64, processing_time = self.process_image(image_data, enhanced_prompt)
+            # Process the image and upload it to Spaces (or reuse a cached edit)
+            edit_result = await timings.run(
+                "edit",
+                self.generate_edited_image(
+                    image_data, enhanced_prompt, user_id, on_progress=on_progress
+                ),
+            )
+            return final_prompt, edit_result
 
-        # Upload edited image to Spaces
-        edited_image_url = None
-        if self.storage_service:
-            try:
-                logger.info("📤 Uploading edited image to Spaces...")
-                edited_image_url = self.storage_service.upload_image_from_base64(
-                    result_base64, user_id, image_type="edited"
+        async with concurrent_stages() as tg:
+            upload_task = tg.create_task(
+                timings.run(
+                    "upload_original",
+                    self._upload_original(image_data, user_id, on_progress),
                 )
-                logger.info(f"✅ Edited image uploaded: {edited_image_url}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to upload edited image: {e}")
+            )
+            edit_task = tg.create_task(resolve_prompt_and_edit())
+
+        original_image_url = upload_task.result()
+        final_prompt, (edited_image_url, result_base64, processing_time) = (
+            edit_task.result()
+        )
 
         # Save to database (no tutorial_id for direct uploads)
         logger.info("📝 Creating new drawing entry for direct upload")
-        saved_drawing = await Drawing.create(
-            db,
-            user_id=user_id,
-            tutorial_id=None,  # Direct upload = no tutorial
-            uploaded_image_url=original_image_url,
-            edited_images_urls=(
-                [edited_image_url] if edited_image_url else [result_base64]
+        saved_drawing = await timings.run(
+            "save_drawing",
+            Drawing.create(
+                db,
+                user_id=user_id,
+                tutorial_id=None,  # Direct upload = no tutorial
+                uploaded_image_url=original_image_url,
+                edited_images_urls=(
+                    [edited_image_url] if edited_image_url else [result_base64]
+                ),
             ),
         )
+        await report_progress(on_progress, "db_saved", drawing_id=str(saved_drawing.id))
+        story_pregenerator.schedule(user_id, saved_drawing.id, edited_image_url)
 
         return {
             "drawing_id": str(saved_drawing.id),
@@ -894,4 +1414,5 @@ Child drew "house" and says "add snow" → "Cover this child's house in beautifu
             "edited_image_url": edited_image_url,
             "prompt": final_prompt,
             "processing_time": processing_time,
+            "stage_timings": timings.as_dict(),
         }
@@ -0,0 +1,174 @@
+"""
+Process-wide registry of long-lived services.
+
+Every service owns SDK clients (OpenAI, Gemini, boto3) with their own HTTP
+connection pools. Building a service per request paid for the client setup and
+a fresh TCP + TLS handshake on the first upstream call of every request. The
+registry builds each service once per process and shares it, so pooled
+connections and TLS sessions are reused across requests:
+
+- storage: StorageService (None if Spaces is not configured), shared by the
+  services below
+- story: StoryService
+- drawing_gallery: DrawingGalleryService
+- image_processing: ImageProcessingService (owns the AudioService used for
+  voice edits)
+
+Services are created on first use, or all at once by startup() (called from the
+application lifespan, so the first request does not pay for it). close() closes
+their clients on shutdown.
+
+Endpoints get the services through the FastAPI dependencies below; code outside
+a request (WebSocket handlers, the edit job worker) uses `services` directly.
+
+Usage:
+    from src.services.registry import get_story_service
+
+    @router.post("/create-story")
+    async def create_story(story_service: StoryService = Depends(get_story_service)):
+        ...
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.services.drawing_gallery_service import DrawingGalleryService
+from src.services.image_processing_service import ImageProcessingService
+from src.services.storage_service import StorageService
+from src.services.story_service import StoryService
+
+
+class ServiceRegistry:
+    """Lazily created, process-wide service instances"""
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the instance called `name`, creating it on first use."""
+
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+                logger.info(f"🧩 Registered shared {name} service")
+            return self._instances[name]
+
+    @property
+    def storage(self) -> Optional[StorageService]:
+        """Shared StorageService, or None if Spaces is not configured."""
+
+        def create() -> Optional[StorageService]:
+            try:
+                return StorageService()
+            except Exception as e:
+                logger.warning(f"⚠️ StorageService initialization failed: {e}")
+                return None
+
+        return self._get("storage", create)
+
+    @property
+    def story(self) -> StoryService:
+        """
+        Shared StoryService.
+
+        Raises:
+            ValueError: If the OpenAI API key is not configured
+        """
+        return self._get("story", lambda: StoryService(self.storage))
+
+    @property
+    def drawing_gallery(self) -> DrawingGalleryService:
+        """Shared DrawingGalleryService."""
+        return self._get("drawing_gallery", lambda: DrawingGalleryService(self.storage))
+
+    @property
+    def image_processing(self) -> ImageProcessingService:
+        """
+        Shared ImageProcessingService.
+
+        Raises:
+            ValueError: If the Google or OpenAI API key is not configured
+        """
+        return self._get(
+            "image_processing", lambda: ImageProcessingService(self.storage)
+        )
+
+    def startup(self) -> None:
+        """Create every configured service now instead of on first use."""
+
+        self.storage
+        self.drawing_gallery
+        if settings.OPENAI_API_KEY:
+            self.story
+        if settings.GOOGLE_API_KEY and settings.OPENAI_API_KEY:
+            try:
+                self.image_processing.audio_service
+            except Exception as e:
+                logger.warning(f"Could not initialize image processing service: {e}")
+        logger.info(f"✅ Service registry ready: {', '.join(self._instances)}")
+
+    def close(self) -> None:
+        """Close the clients of all created services and forget them."""
+
+        with self._lock:
+            instances, self._instances = self._instances, {}
+
+        clients = []
+        for instance in instances.values():
+            if isinstance(instance, StorageService):
+                clients.append(instance.s3_client)
+            elif isinstance(instance, StoryService):
+                clients.append(instance.client)
+            elif isinstance(instance, ImageProcessingService):
+                clients += [instance.gemini_client, instance.openai_client]
+                if instance._audio_service is not None:
+                    clients.append(instance._audio_service.client)
+                    backend_client = getattr(
+                        instance._audio_service.stt_backend, "client", None
+                    )
+                    if backend_client is not None:
+                        clients.append(backend_client)
+
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to close {type(client).__name__}: {e}")
+        if instances:
+            logger.info(f"🧹 Closed services: {', '.join(instances)}")
+
+
+# Global service registry (one set of clients per process)
+services = ServiceRegistry()
+
+
+def get_story_service() -> StoryService:
+    """FastAPI dependency returning the shared StoryService."""
+    try:
+        return services.story
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+def get_drawing_gallery_service() -> DrawingGalleryService:
+    """FastAPI dependency returning the shared DrawingGalleryService."""
+    return services.drawing_gallery
+
+
+def get_image_processing_service() -> ImageProcessingService:
+    """FastAPI dependency returning the shared ImageProcessingService."""
+    try:
+        return services.image_processing
+    except ValueError as e:
+        logger.warning(f"Could not initialize image processing service: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Image processing service not available. Please configure both Google and OpenAI API keys.",
+        )
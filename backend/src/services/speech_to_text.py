@@ -0,0 +1,201 @@
+"""
+Speech-to-text backends used by AudioService.
+
+A backend turns audio that is already in a format it accepts (see
+AudioService.prepare_audio) into text. It is blocking and is run through
+call_upstream() on the backend's `upstream`, so it gets the same concurrency
+limit, deadline, retries and circuit breaker as any other upstream call.
+
+Backends (SPEECH_TO_TEXT_BACKEND):
+- openai: OpenAI Whisper (default)
+- scripted: deterministic offline stand-in that returns canned transcripts
+  after SPEECH_TO_TEXT_SCRIPTED_DELAY_SECONDS, for load tests and benchmarks
+
+Another engine is added by subclassing SpeechToTextBackend and registering it
+in create_speech_to_text_backend().
+
+Usage:
+    from src.services.speech_to_text import create_speech_to_text_backend
+
+    backend = create_speech_to_text_backend()
+    text = backend.transcribe(ogg_bytes, "en", "audio.ogg")
+"""
+
+import hashlib
+import io
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from openai import OpenAI
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.utils.upstream import WHISPER
+
+
+class SpeechToTextBackend(ABC):
+    """Blocking speech-to-text engine"""
+
+    # Short backend name (SPEECH_TO_TEXT_BACKEND value)
+    name: str = ""
+    # Upstream whose limiter, deadline and breaker the calls go through
+    upstream: str = WHISPER
+
+    @property
+    @abstractmethod
+    def model(self) -> str:
+        """Model identifier (part of the transcription cache key)."""
+
+    @abstractmethod
+    def transcribe(self, audio_data: bytes, language: str, filename: str) -> str:
+        """
+        Transcribe audio to text (blocking).
+
+        Args:
+            audio_data: Audio file data in a format the backend accepts
+            language: Language code ('en' or 'de')
+            filename: File name (its extension tells the backend the format)
+
+        Returns:
+            Transcribed text
+        """
+
+
+class OpenAIWhisperBackend(SpeechToTextBackend):
+    """OpenAI Whisper transcriptions API"""
+
+    name = "openai"
+    upstream = WHISPER
+
+    def __init__(self, model: str = "whisper-1"):
+        if not settings.OPENAI_API_KEY:
+            logger.error("OpenAI API key is missing")
+            raise ValueError("OpenAI API key is required for audio transcription")
+
+        # Retries are left to call_upstream (budgeted, shared with other callers)
+        self.client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.UPSTREAM_WHISPER_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
+        self._model = model
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def transcribe(self, audio_data: bytes, language: str, filename: str) -> str:
+        # Whisper gets an in-memory file; the name tells it the audio format
+        audio_file = io.BytesIO(audio_data)
+        audio_file.name = filename
+
+        # Transcribe using Whisper with language parameter for better accuracy
+        transcript = self.client.audio.transcriptions.create(
+            model=self._model,
+            file=audio_file,
+            language=language,  # 'en' or 'de' - helps Whisper understand the audio better
+            response_format="text",
+            prompt=None,  # Optional: can add context hints here if needed
+        )
+        return transcript
+
+
+class ScriptedSpeechToText(SpeechToTextBackend):
+    """
+    Offline stand-in returning canned transcripts after a fixed delay.
+
+    The transcript is picked by a hash of the audio bytes, so the same clip
+    always gets the same text and runs are reproducible.
+    """
+
+    name = "scripted"
+    upstream = WHISPER
+
+    DEFAULT_TRANSCRIPTS: Dict[str, List[str]] = {
+        "en": [
+            "make the dog fly",
+            "give it a rainbow tail",
+            "put it on the moon",
+            "add sparkles and stars",
+        ],
+        "de": [
+            "lass den Hund fliegen",
+            "gib ihm einen Regenbogenschwanz",
+            "setz es auf den Mond",
+            "füge Glitzer und Sterne hinzu",
+        ],
+    }
+
+    def __init__(
+        self,
+        transcripts: Optional[List[str]] = None,
+        delay_seconds: float = 1.0,
+    ):
+        """
+        Args:
+            transcripts: Transcripts to return for every language
+                (defaults to DEFAULT_TRANSCRIPTS per language)
+            delay_seconds: Simulated transcription latency
+        """
+
+        self.transcripts = transcripts
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+
+    @property
+    def model(self) -> str:
+        return "scripted"
+
+    def transcribe(self, audio_data: bytes, language: str, filename: str) -> str:
+        self.calls += 1
+        time.sleep(self.delay_seconds)
+
+        transcripts = self.transcripts or self.DEFAULT_TRANSCRIPTS.get(
+            language, self.DEFAULT_TRANSCRIPTS["en"]
+        )
+        index = int.from_bytes(hashlib.sha256(audio_data).digest()[:4], "big")
+        return transcripts[index % len(transcripts)]
+
+
+def create_speech_to_text_backend(
+    backend: Optional[str] = None,
+) -> SpeechToTextBackend:
+    """
+    Create the configured speech-to-text backend.
+
+    Args:
+        backend: Backend name (defaults to SPEECH_TO_TEXT_BACKEND)
+
+    Returns:
+        SpeechToTextBackend instance
+
+    Raises:
+        ValueError: If the backend is unknown or not configured
+    """
+
+    backend = (backend or settings.SPEECH_TO_TEXT_BACKEND).lower()
+
+    if backend == OpenAIWhisperBackend.name:
+        return OpenAIWhisperBackend()
+
+    if backend == ScriptedSpeechToText.name:
+        transcripts = [
+            transcript.strip()
+            for transcript in settings.SPEECH_TO_TEXT_SCRIPTED_TRANSCRIPTS.split("|")
+            if transcript.strip()
+        ]
+        return ScriptedSpeechToText(
+            transcripts=transcripts or None,
+            delay_seconds=settings.SPEECH_TO_TEXT_SCRIPTED_DELAY_SECONDS,
+        )
+
+    raise ValueError(f"Unknown speech-to-text backend: '{backend}'")
+
+
+__all__ = [
+    "OpenAIWhisperBackend",
+    "ScriptedSpeechToText",
+    "SpeechToTextBackend",
+    "create_speech_to_text_backend",
+]
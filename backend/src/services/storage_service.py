@@ -9,9 +9,11 @@ from pathlib import Path
 from datetime import datetime
 from uuid import UUID
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from src.core.config import settings
 from src.core.logger import logger
+from src.utils.image_format import image_extension
 
 
 class StorageService:
@@ -36,6 +38,12 @@ class StorageService:
             endpoint_url=settings.STORAGE_ENDPOINT_URL,
             aws_access_key_id=settings.SPACES_KEY,
             aws_secret_access_key=settings.SPACES_SECRET,
+            # Single attempt with a deadline; retries are left to call_upstream
+            config=Config(
+                connect_timeout=5,
+                read_timeout=settings.UPSTREAM_SPACES_TIMEOUT_SECONDS,
+                retries={"max_attempts": 1, "mode": "standard"},
+            ),
         )
 
         # Bucket name - using app name as bucket
@@ -65,15 +73,22 @@ class StorageService:
         return key
 
     def upload_image_from_bytes(
-        self, image_bytes: bytes, user_id: UUID, image_type: str = "edited"
+        self,
+        image_bytes: bytes,
+        user_id: UUID,
+        image_type: str = "edited",
+        content_type: str = "image/png",
     ) -> str:
         """
         Upload an image from bytes to DigitalOcean Spaces.
 
+        The bytes are stored as-is; the key extension follows content_type.
+
         Args:
             image_bytes: Raw image bytes
             user_id: UUID of the user
             image_type: Type of image ('original' or 'edited')
+            content_type: MIME type of the image (default: 'image/png')
 
         Returns:
             Public URL of the uploaded image
@@ -84,7 +99,9 @@ class StorageService:
 
         try:
             # Generate S3 key
-            key = self._generate_file_key(user_id, image_type)
+            key = self._generate_file_key(
+                user_id, image_type, image_extension(content_type)
+            )
 
             logger.info(f"📤 Uploading image to Spaces: {key}")
             logger.info(f"📊 Image size: {len(image_bytes)} bytes")
@@ -94,7 +111,7 @@ class StorageService:
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=image_bytes,
-                ContentType="image/png",
+                ContentType=content_type,
                 ACL="public-read",  # Make image publicly accessible
             )
 
@@ -0,0 +1,282 @@
+"""
+Content-addressed cache of generated stories.
+
+The same picture is often narrated more than once: the story screen is reopened
+for an image that already has a story, drawings are re-uploaded and edits are
+re-run. A story is identified by:
+- the user it was written for
+- sha256 of the image bytes sent to the model
+- the story model name
+
+Near-duplicates (the same drawing re-encoded, resized or re-photographed) are
+found through a perceptual hash: a 256-bit difference hash of the downsized,
+contrast-stretched grayscale image. Entries whose hash differs in at most
+STORY_CACHE_PHASH_MAX_DISTANCE bits count as the same picture (-1 disables it).
+
+Entries are private to their user: a story (title, names, content) is never
+handed to another child, not even for an identical or similar picture. Sparse
+line drawings on white paper are exactly where perceptual hashes collide.
+
+Two tiers:
+- Local: bounded per-process LRU (STORY_CACHE_LOCAL_MAX_ENTRIES) plus the
+  perceptual index of its entries
+- Persistent (optional, STORY_CACHE_PERSISTENT): cache_entries table shared by
+  all API and worker processes (exact hits only; entries found there join the
+  local perceptual index)
+
+Values hold the story text itself, so a hit needs neither OpenAI nor a lookup of
+the original Story row (which may have been deleted). Hits by tier, misses,
+evictions and the hit rate are recorded in src.core.metrics (story_cache.*).
+
+The persistent tier uses its own short-lived sessions, so a cache failure never
+leaves the caller's session in a failed transaction.
+"""
+
+import hashlib
+import threading
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.database import async_session
+from src.repositories import CacheEntryRepository
+from src.utils import LRUCache
+
+# Difference hash of a 17x16 grayscale thumbnail: 16x16 = 256 bits
+PHASH_SIZE = 16
+
+# Story fields kept in the cache
+STORY_FIELDS = ("title_en", "title_de", "story_text_en", "story_text_de")
+
+
+class StoryCache:
+    """Two-tier cache mapping an image fingerprint to its story"""
+
+    NAMESPACE = "story"
+
+    def __init__(self):
+        self.enabled = settings.STORY_CACHE_ENABLED
+        self.persistent = settings.STORY_CACHE_PERSISTENT
+        self.ttl_seconds = settings.STORY_CACHE_TTL_SECONDS
+        self.max_distance = settings.STORY_CACHE_PHASH_MAX_DISTANCE
+        self.local = LRUCache(
+            max_entries=settings.STORY_CACHE_LOCAL_MAX_ENTRIES,
+            ttl_seconds=self.ttl_seconds,
+            on_evict=self._on_evict,
+        )
+        # Owner and perceptual hash of every local entry (key → (user, hash))
+        self._phashes: Dict[str, Tuple[str, int]] = {}
+        self._phash_lock = threading.Lock()
+        self._hits = 0
+        self._lookups = 0
+
+    @staticmethod
+    def build_key(image_data: bytes, model: str, user_id: Any = None) -> str:
+        """
+        Build the cache key for a story.
+
+        Args:
+            image_data: Raw image bytes sent to the model
+            model: Story model name
+            user_id: User the story is written for
+
+        Returns:
+            sha256 hex digest identifying the story
+        """
+
+        image_hash = hashlib.sha256(image_data).hexdigest()
+        fingerprint = "\x1f".join([str(user_id or ""), model, image_hash])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def perceptual_hash(image_data: bytes) -> Optional[int]:
+        """
+        Compute the perceptual (difference) hash of an image.
+
+        CPU-bound (decodes the image); call it through run_blocking.
+
+        Args:
+            image_data: Raw image bytes
+
+        Returns:
+            256-bit hash as an int, or None if the image cannot be decoded
+        """
+
+        try:
+            with Image.open(BytesIO(image_data)) as image:
+                image.draft("L", (PHASH_SIZE * 8, PHASH_SIZE * 8))
+                gray = ImageOps.autocontrast(image.convert("L"))
+                thumbnail = gray.resize(
+                    (PHASH_SIZE + 1, PHASH_SIZE), Image.Resampling.BOX
+                )
+        except Exception:
+            return None
+
+        pixels = list(thumbnail.getdata())
+        value = 0
+        for row in range(PHASH_SIZE):
+            offset = row * (PHASH_SIZE + 1)
+            for column in range(PHASH_SIZE):
+                left = pixels[offset + column]
+                right = pixels[offset + column + 1]
+                value = (value << 1) | (left > right)
+        return value
+
+    async def get(
+        self, key: str, phash: Optional[int] = None, user_id: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the story of an image (exact local, near-duplicate, then persistent).
+
+        Cache failures are logged and treated as misses, never raised.
+
+        Args:
+            key: Key from build_key()
+            phash: Perceptual hash of the image (None skips near-duplicate matching)
+            user_id: User the story is for (near-duplicates of their own images only)
+
+        Returns:
+            Dictionary with title_en, title_de, story_text_en, story_text_de,
+            or None on a miss
+        """
+
+        if not self.enabled:
+            return None
+
+        story = self.local.get(key)
+        if story is not None:
+            self._record_lookup("hits.local", hit=True)
+            logger.info("♻️ Story cache hit (local)")
+            return story
+
+        match = self._find_similar(phash, user_id)
+        if match is not None:
+            similar_key, distance = match
+            story = self.local.get(similar_key)
+            if story is not None:
+                self._record_lookup("hits.perceptual", hit=True)
+                metrics.observe("story_cache.perceptual_distance", distance)
+                logger.info(f"♻️ Story cache hit (perceptual, distance {distance})")
+                return story
+            self._forget_phash(similar_key)
+
+        value = None
+        if self.persistent:
+            try:
+                async with async_session() as db:
+                    value = await CacheEntryRepository.get_value(
+                        db, self.NAMESPACE, key
+                    )
+            except Exception as e:
+                metrics.increment("story_cache.errors")
+                logger.warning(f"⚠️ Story cache lookup failed: {e}")
+
+        if value and all(value.get(field) for field in STORY_FIELDS):
+            story = {field: value[field] for field in STORY_FIELDS}
+            stored_phash = value.get("phash")
+            self._set_local(
+                key, story, int(stored_phash, 16) if stored_phash else phash, user_id
+            )
+            self._record_lookup("hits.persistent", hit=True)
+            logger.info("♻️ Story cache hit (persistent)")
+            return story
+
+        self._record_lookup("misses", hit=False)
+        return None
+
+    async def put(
+        self,
+        key: str,
+        story: Dict[str, Any],
+        phash: Optional[int] = None,
+        user_id: Any = None,
+    ) -> None:
+        """
+        Store the story of an image in both tiers.
+
+        Args:
+            key: Key from build_key()
+            story: Dictionary with title_en, title_de, story_text_en, story_text_de
+            phash: Perceptual hash of the image
+            user_id: User the story was written for
+        """
+
+        if not self.enabled:
+            return
+
+        story = {field: story[field] for field in STORY_FIELDS}
+        self._set_local(key, story, phash, user_id)
+
+        if not self.persistent:
+            return
+
+        value = dict(story)
+        if phash is not None:
+            value["phash"] = format(phash, "x")
+        try:
+            async with async_session() as db:
+                await CacheEntryRepository.set_value(
+                    db, self.NAMESPACE, key, value, ttl_seconds=self.ttl_seconds
+                )
+            metrics.increment("story_cache.stores")
+        except Exception as e:
+            metrics.increment("story_cache.errors")
+            logger.warning(f"⚠️ Failed to store story cache entry: {e}")
+
+    def _find_similar(
+        self, phash: Optional[int], user_id: Any
+    ) -> Optional[Tuple[str, int]]:
+        """Find the user's local entry with the closest perceptual hash within the threshold."""
+
+        if phash is None or self.max_distance < 0:
+            return None
+
+        owner = str(user_id or "")
+        best: Optional[Tuple[str, int]] = None
+        with self._phash_lock:
+            for key, (entry_owner, other) in self._phashes.items():
+                if entry_owner != owner:
+                    continue
+                distance = (phash ^ other).bit_count()
+                if distance <= self.max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (key, distance)
+        return best
+
+    def _forget_phash(self, key: str) -> None:
+        with self._phash_lock:
+            self._phashes.pop(key, None)
+
+    def _on_evict(self, key: str, story: Dict[str, Any]) -> None:
+        """Drop an evicted entry from the perceptual index and count it."""
+        self._forget_phash(key)
+        metrics.increment("story_cache.evictions")
+
+    def _record_lookup(self, outcome: str, hit: bool) -> None:
+        """Count a lookup and update the hit rate gauge."""
+
+        self._lookups += 1
+        if hit:
+            self._hits += 1
+        metrics.increment(f"story_cache.{outcome}")
+        metrics.set_gauge("story_cache.hit_rate", self._hits / self._lookups)
+
+    def _set_local(
+        self, key: str, story: Dict[str, Any], phash: Optional[int], user_id: Any
+    ) -> None:
+        """Store an entry in the local tier (and its owner and hash in the index)."""
+
+        if phash is not None:
+            with self._phash_lock:
+                self._phashes[key] = (str(user_id or ""), phash)
+        self.local.set(key, story)
+        metrics.set_gauge("story_cache.local_size", len(self.local))
+
+
+# Global cache instance (the local tier is shared by everything in this process)
+story_cache = StoryCache()
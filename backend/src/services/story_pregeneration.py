@@ -0,0 +1,267 @@
+"""
+Speculative background story generation for freshly edited images.
+
+Most kids open the story screen right after an edit finishes. With
+STORY_PREGENERATION_ENABLED, every edit that stores an edited image in Spaces
+(edit_image_with_prompt, edit_image_with_audio, process_direct_upload) schedules
+a low-priority task that generates the image's story and saves it through the
+usual StoryService.create_story path. GET /api/drawings/{id}/stories then
+returns the story at once, and an explicit create-story call hits the story
+cache instead of OpenAI.
+
+Pre-generation never competes with interactive work:
+- Per-user budget: at most STORY_PREGENERATION_USER_BUDGET stories per user in
+  STORY_PREGENERATION_BUDGET_WINDOW_SECONDS; further edits are skipped. Only
+  generations that actually start count against it (dropped and cancelled
+  tasks do not)
+- At most STORY_PREGENERATION_MAX_CONCURRENCY stories are generated at a time,
+  and at most STORY_PREGENERATION_MAX_PENDING wait; the rest are skipped
+- Load shedding: while the OpenAI chat upstream has queued calls, or
+  interactive calls use more than STORY_PREGENERATION_LOAD_THRESHOLD of its
+  concurrency limit, tasks wait (up to STORY_PREGENERATION_MAX_WAIT_SECONDS,
+  then they are dropped) and running tasks are cancelled
+- A create-story request for the same image cancels the task (the request
+  generates the story itself)
+
+Outcomes are recorded in src.core.metrics (story_pregeneration.*).
+"""
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.database import async_session
+from src.repositories import StoryRepository
+from src.utils.upstream import OPENAI_CHAT, get_upstream_limiter
+
+# Seconds between load checks while waiting or generating
+LOAD_CHECK_INTERVAL_SECONDS = 0.5
+
+TaskKey = Tuple[UUID, str]
+
+# Set while a pre-generation runs, so its own create_story does not cancel it
+_pregenerating = contextvars.ContextVar("story_pregenerating", default=False)
+
+
+class StoryPregenerator:
+    """Schedules and runs speculative story generation in the background"""
+
+    def __init__(self):
+        self.enabled = settings.STORY_PREGENERATION_ENABLED
+        self._tasks: Dict[TaskKey, asyncio.Task] = {}
+        self._running: Set[TaskKey] = set()
+        self._usage: Dict[UUID, Deque[float]] = {}
+        self._last_sweep = time.monotonic()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def schedule(
+        self, user_id: UUID, drawing_id: UUID, image_url: Optional[str]
+    ) -> bool:
+        """
+        Schedule the story of an edited image, if budget and capacity allow.
+
+        Must be called from the event loop. Never raises.
+
+        Args:
+            user_id: UUID of the drawing's owner
+            drawing_id: UUID of the drawing
+            image_url: Spaces URL of the edited image (None if it was not stored)
+
+        Returns:
+            True if a task was scheduled
+        """
+
+        if not self.enabled or not image_url or not drawing_id:
+            return False
+
+        key = (drawing_id, image_url)
+        if key in self._tasks:
+            return False
+        if len(self._tasks) >= settings.STORY_PREGENERATION_MAX_PENDING:
+            metrics.increment("story_pregeneration.skipped.full")
+            return False
+        if not self._has_budget(user_id):
+            metrics.increment("story_pregeneration.skipped.budget")
+            logger.info(f"⏭️ Story pre-generation budget used up for user {user_id}")
+            return False
+
+        task = asyncio.create_task(self._run(key, user_id))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._forget(key))
+        metrics.increment("story_pregeneration.scheduled")
+        metrics.set_gauge("story_pregeneration.pending", len(self._tasks))
+        return True
+
+    def cancel(self, drawing_id: Optional[UUID], image_url: Optional[str]) -> None:
+        """
+        Cancel the task of an image an interactive request is about to generate.
+
+        Args:
+            drawing_id: UUID of the drawing
+            image_url: URL of the image
+        """
+
+        if _pregenerating.get():
+            return
+        task = self._tasks.get((drawing_id, image_url))
+        if task is not None and not task.done():
+            task.cancel("interactive")
+            metrics.increment("story_pregeneration.cancelled.interactive")
+
+    async def shutdown(self) -> None:
+        """Cancel all scheduled tasks and wait for them to finish."""
+
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel("shutdown")
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"🧹 Cancelled {len(tasks)} story pre-generation task(s)")
+
+    def _forget(self, key: TaskKey) -> None:
+        self._tasks.pop(key, None)
+        metrics.set_gauge("story_pregeneration.pending", len(self._tasks))
+
+    def _has_budget(self, user_id: UUID) -> bool:
+        """Whether the user's budget allows another story in the current window."""
+
+        now = time.monotonic()
+        self._prune(now)
+        usage = self._usage.get(user_id)
+        if not usage:
+            return True
+        self._expire(usage, now)
+        if not usage:
+            del self._usage[user_id]
+            return True
+        return len(usage) < settings.STORY_PREGENERATION_USER_BUDGET
+
+    def _take_budget(self, user_id: UUID) -> bool:
+        """Count a starting story against the user's budget (False if it is used up)."""
+
+        if not self._has_budget(user_id):
+            return False
+        self._usage.setdefault(user_id, deque()).append(time.monotonic())
+        return True
+
+    def _prune(self, now: float) -> None:
+        """Drop usage outside the budget window, and users left without any."""
+
+        window = settings.STORY_PREGENERATION_BUDGET_WINDOW_SECONDS
+        # A full sweep at most once per window keeps the checks cheap
+        if now - self._last_sweep < window:
+            return
+        self._last_sweep = now
+        for user_id in list(self._usage):
+            usage = self._usage[user_id]
+            self._expire(usage, now)
+            if not usage:
+                del self._usage[user_id]
+
+    @staticmethod
+    def _expire(usage: Deque[float], now: float) -> None:
+        window = settings.STORY_PREGENERATION_BUDGET_WINDOW_SECONDS
+        while usage and now - usage[0] > window:
+            usage.popleft()
+
+    def _interactive_load_high(self) -> bool:
+        """Whether interactive OpenAI chat calls need the upstream's capacity."""
+
+        limiter = get_upstream_limiter(OPENAI_CHAT)
+        if limiter.queue_depth > 0:
+            return True
+        # Each running pre-generation holds up to two slots ('parallel' mode)
+        interactive = max(0, limiter.in_flight - 2 * len(self._running))
+        return interactive > limiter.limit * settings.STORY_PREGENERATION_LOAD_THRESHOLD
+
+    async def _wait_for_quiet(self) -> bool:
+        """Wait until interactive load is low (False if it stays high too long)."""
+
+        deadline = time.monotonic() + settings.STORY_PREGENERATION_MAX_WAIT_SECONDS
+        while self._interactive_load_high():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(LOAD_CHECK_INTERVAL_SECONDS)
+        return True
+
+    async def _run(self, key: TaskKey, user_id: UUID) -> None:
+        drawing_id, image_url = key
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                settings.STORY_PREGENERATION_MAX_CONCURRENCY
+            )
+
+        try:
+            async with self._semaphore:
+                if not await self._wait_for_quiet():
+                    metrics.increment("story_pregeneration.dropped")
+                    logger.info(f"⏭️ Dropped story pre-generation for {image_url}")
+                    return
+                if not self._take_budget(user_id):
+                    metrics.increment("story_pregeneration.skipped.budget")
+                    return
+
+                self._running.add(key)
+                generation = asyncio.create_task(
+                    self._generate(user_id, drawing_id, image_url)
+                )
+                try:
+                    # Give way as soon as interactive traffic picks up
+                    while not generation.done():
+                        await asyncio.wait(
+                            {generation}, timeout=LOAD_CHECK_INTERVAL_SECONDS
+                        )
+                        if not generation.done() and self._interactive_load_high():
+                            generation.cancel()
+                            metrics.increment("story_pregeneration.cancelled.load")
+                            logger.info(
+                                f"🛑 Story pre-generation for {image_url} cancelled "
+                                "under interactive load"
+                            )
+                            return
+                    generation.result()
+                finally:
+                    if not generation.done():
+                        generation.cancel()
+                    self._running.discard(key)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            metrics.increment("story_pregeneration.failed")
+            logger.warning(f"⚠️ Story pre-generation for {image_url} failed: {e}")
+
+    async def _generate(self, user_id: UUID, drawing_id: UUID, image_url: str) -> None:
+        # Imported here: the registry imports the services that schedule tasks
+        from src.services.registry import services
+
+        _pregenerating.set(True)
+        async with async_session() as db:
+            existing = await StoryRepository.find_by_drawing_id_and_image_url(
+                db, drawing_id, image_url
+            )
+            if existing:
+                metrics.increment("story_pregeneration.skipped.exists")
+                return
+
+            start = time.perf_counter()
+            result = await services.story.create_story(
+                db, user_id=user_id, drawing_id=drawing_id, image_url=image_url
+            )
+
+        metrics.increment("story_pregeneration.completed")
+        metrics.observe(
+            "story_pregeneration.duration_ms", (time.perf_counter() - start) * 1000
+        )
+        logger.info(
+            f"📖 Pre-generated story {result['story_id']} for drawing {drawing_id}"
+        )
+
+
+# Global pre-generator (tasks run on the event loop of this process)
+story_pregenerator = StoryPregenerator()
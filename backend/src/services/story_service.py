@@ -1,3 +1,6 @@
+import asyncio
+import re
+import threading
 import time
 import base64
 import json
@@ -11,37 +14,72 @@ from uuid import UUID
 from src.models import Story, Drawing
 from src.repositories import StoryRepository, DrawingRepository
 from src.services.storage_service import StorageService
+from src.services.story_cache import story_cache
+from src.services.story_pregeneration import story_pregenerator
 from src.core.logger import logger
+from src.core.metrics import metrics
+from src.utils.executor import get_upstream_executor, run_blocking
+from src.utils.upstream import call_upstream, OPENAI_CHAT, SPACES
+from src.utils.resilience import UpstreamTimeoutError
+from src.utils.upstream_limiter import UpstreamUnavailableError
+from src.utils.image_format import sniff_image_mime_type
+from src.utils.image_normalization import normalize_image
+from src.utils.pipeline import concurrent_stages
+from src.utils.progress import ProgressCallback, report_progress
+from src.utils.story_stream import StoryStreamParser
 from src.prompts import (
     get_story_generation_prompt,
     get_story_generation_prompt_bilingual,
+    get_story_generation_prompt_bilingual_sections,
+    get_story_translation_prompt_de,
 )
 
+# Section labels of the single-language story answers
+STORY_LABELS = {"en": ("TITLE", "STORY"), "de": ("TITEL", "GESCHICHTE")}
+
 
 class StoryService:
     """Service for generating children's stories from images using GPT-4 Vision"""
 
-    def __init__(self):
+    def __init__(self, storage_service: Optional[StorageService] = None):
+        """
+        Args:
+            storage_service: Shared StorageService (a new one is created if omitted)
+        """
+
         if not settings.OPENAI_API_KEY:
             raise ValueError("OpenAI API key is required for story generation")
 
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Retries are left to call_upstream (budgeted, shared with other callers)
+        self.client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.UPSTREAM_OPENAI_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
         self.model = "gpt-4o"  # GPT-4 with vision capabilities
 
-        # Initialize storage service for downloading images from Spaces
-        try:
-            self.storage_service = StorageService()
-            logger.info("✅ StorageService initialized for story generation")
-        except Exception as e:
-            logger.warning(f"⚠️ StorageService initialization failed: {e}")
-            self.storage_service = None
-
-    def generate_story(self, image_base64: str) -> Tuple[str, str, str, str, float]:
+        # Storage service for downloading images from Spaces
+        if storage_service is not None:
+            self.storage_service = storage_service
+        else:
+            try:
+                self.storage_service = StorageService()
+                logger.info("✅ StorageService initialized for story generation")
+            except Exception as e:
+                logger.warning(f"⚠️ StorageService initialization failed: {e}")
+                self.storage_service = None
+
+    def generate_story(
+        self, image_data: bytes, mime_type: str = "image/png"
+    ) -> Tuple[str, str, str, str, float]:
         """
         Generate a children's story from an image in both English and German.
 
+        The image is base64-encoded exactly once, into the data URL sent to OpenAI.
+
         Args:
-            image_base64: Base64 encoded image
+            image_data: Raw image bytes
+            mime_type: MIME type of the image
 
         Returns:
             Tuple of (title_en, title_de, story_text_en, story_text_de, generation_time)
@@ -54,20 +92,7 @@ class StoryService:
             story_prompt = get_story_generation_prompt_bilingual()
 
             # Prepare the message with image
-            messages = [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": story_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_base64}"
-                            },
-                        },
-                    ],
-                }
-            ]
+            messages = self._image_messages(story_prompt, image_data, mime_type)
 
             # Call OpenAI API
             response = self.client.chat.completions.create(
@@ -130,36 +155,643 @@ class StoryService:
             logger.error(f"❌ Story generation failed: {str(e)}")
             raise ValueError(f"Story generation failed: {str(e)}")
 
-    def validate_image_base64(self, image_base64: str) -> bool:
+    def generate_story_in_language(
+        self, image_data: bytes, mime_type: str, language: str
+    ) -> Tuple[str, str]:
         """
-        Validate that the base64 string is a valid image.
+        Generate a children's story from an image in one language.
+
+        OpenAI errors are not wrapped, so call_upstream can retry transient ones.
+
+        Args:
+            image_data: Raw image bytes
+            mime_type: MIME type of the image
+            language: Language code ('en' or 'de')
+
+        Returns:
+            Tuple of (title, story_text)
+
+        Raises:
+            ValueError: If the answer has no title or story
+        """
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._image_messages(
+                get_story_generation_prompt(language), image_data, mime_type
+            ),
+            max_tokens=750,  # One language only
+            temperature=0.8,  # Creative but not too random
+        )
+        return self.parse_titled_story(self._response_text(response), language)
+
+    def translate_story(self, title_en: str, story_text_en: str) -> Tuple[str, str]:
+        """
+        Translate an English story to German with the (cheaper) translation model.
+
+        Args:
+            title_en: Story title in English
+            story_text_en: Story text in English
+
+        Returns:
+            Tuple of (title_de, story_text_de)
+
+        Raises:
+            ValueError: If the answer has no title or story
+        """
+
+        response = self.client.chat.completions.create(
+            model=settings.STORY_TRANSLATION_MODEL,
+            messages=[
+                {
+                    "role": "user",
+                    "content": get_story_translation_prompt_de(title_en, story_text_en),
+                }
+            ],
+            max_tokens=750,
+            temperature=0.3,  # Faithful rather than creative
+        )
+        return self.parse_titled_story(self._response_text(response), "de")
+
+    @staticmethod
+    def _image_messages(prompt: str, image_data: bytes, mime_type: str) -> list:
+        """Chat messages sending a prompt with the image as a data URL."""
+
+        image_base64 = base64.b64encode(image_data).decode("ascii")
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{mime_type};base64,{image_base64}",
+                            "detail": settings.STORY_VISION_DETAIL,
+                        },
+                    },
+                ],
+            }
+        ]
+
+    @staticmethod
+    def prepare_vision_image(image_data: bytes, mime_type: str) -> Tuple[bytes, str]:
+        """
+        Downsize and re-encode an image for the story model.
+
+        With STORY_VISION_INPUT_ENABLED the image is capped to STORY_VISION_MAX_EDGE
+        and re-encoded as STORY_VISION_FORMAT (see src/utils/image_normalization.py).
+        A small image whose re-encoded version would be larger is sent as it is.
+        CPU-bound; call it through run_blocking.
+
+        Args:
+            image_data: Raw (validated) image bytes
+            mime_type: MIME type of the image
+
+        Returns:
+            Tuple of (image bytes, MIME type) to send
+        """
+
+        if not settings.STORY_VISION_INPUT_ENABLED:
+            return image_data, mime_type
+
+        normalized = normalize_image(
+            image_data,
+            max_edge=settings.STORY_VISION_MAX_EDGE,
+            quality=settings.STORY_VISION_QUALITY,
+            output_format=settings.STORY_VISION_FORMAT,
+        )
+        fits = (
+            max(normalized.original_width, normalized.original_height)
+            <= settings.STORY_VISION_MAX_EDGE
+        )
+        if (
+            fits
+            and len(normalized.data) >= len(image_data)
+            and mime_type != "image/gif"
+        ):
+            return image_data, mime_type
+
+        logger.info(
+            f"📊 Story image: {normalized.original_width}x{normalized.original_height} "
+            f"({len(image_data) / 1024:.1f} KB) → {normalized.width}x{normalized.height} "
+            f"{normalized.mime_type} ({len(normalized.data) / 1024:.1f} KB)"
+        )
+        return normalized.data, normalized.mime_type
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """Get the text of a chat completion, rejecting empty answers."""
+
+        if not response.choices or not response.choices[0].message.content:
+            raise ValueError("Empty response from OpenAI API")
+        return response.choices[0].message.content.strip()
+
+    @staticmethod
+    def parse_titled_story(content: str, language: str) -> Tuple[str, str]:
+        """
+        Parse a 'TITLE: ... STORY: ...' answer (TITEL/GESCHICHTE in German).
+
+        Args:
+            content: Model answer
+            language: Language code of the answer's labels ('en' or 'de')
+
+        Returns:
+            Tuple of (title, story_text)
+
+        Raises:
+            ValueError: If the title or story is missing
+        """
+
+        title_label, story_label = STORY_LABELS[language]
+        match = re.search(
+            rf"{title_label}:\s*(?P<title>.+?)\s*{story_label}:\s*(?P<story>.+)",
+            content.replace("*", ""),
+            re.DOTALL | re.IGNORECASE,
+        )
+        if not match:
+            raise ValueError(f"AI response has no {title_label}/{story_label} sections")
+
+        title = match.group("title").strip().strip('"')
+        story_text = match.group("story").strip()
+        if not title or not story_text:
+            raise ValueError("Missing story title or content")
+        return title, story_text
+
+    async def _generate_story_part(self, language: str, func, *args) -> Tuple[str, str]:
+        """
+        Run one language's generation, repeating it if its answer cannot be parsed.
+
+        Upstream errors are retried by call_upstream; only unusable answers
+        (ValueError) are repeated here, up to STORY_PART_MAX_ATTEMPTS times.
+        """
+
+        attempts = max(1, settings.STORY_PART_MAX_ATTEMPTS)
+        for attempt in range(1, attempts + 1):
+            try:
+                return await call_upstream(OPENAI_CHAT, func, *args)
+            except ValueError as e:
+                if attempt == attempts:
+                    raise ValueError(
+                        f"Story generation failed ({language.upper()}): {str(e)}"
+                    )
+                logger.warning(
+                    f"⚠️ Unusable {language.upper()} story (attempt {attempt}/{attempts}): "
+                    f"{str(e)}, generating it again"
+                )
+
+    async def generate_story_per_language(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        mode: str,
+        on_progress: ProgressCallback = None,
+    ) -> Tuple[str, str, str, str, float]:
+        """
+        Generate the English and German story in separate calls.
+
+        - 'parallel': both languages are written from the image at the same time
+          (fastest; the two versions are told independently)
+        - 'translate': the English story is written from the image, then
+          translated by STORY_TRANSLATION_MODEL (the versions match)
+
+        Each language is validated on its own and only a failed one is repeated.
+        A 'story_part_generated' progress event is sent as soon as a language is ready.
+
+        Args:
+            image_data: Raw image bytes
+            mime_type: MIME type of the image
+            mode: 'parallel' or 'translate'
+            on_progress: Optional progress callback
+
+        Returns:
+            Tuple of (title_en, title_de, story_text_en, story_text_de, generation_time)
+        """
+
+        start_time = time.time()
+
+        async def generate(language: str, func, *args) -> Tuple[str, str]:
+            title, story_text = await self._generate_story_part(language, func, *args)
+            logger.info(
+                f"✅ {language.upper()} story ready after "
+                f"{time.time() - start_time:.2f}s: '{title}' ({len(story_text)} chars)"
+            )
+            await report_progress(
+                on_progress, "story_part_generated", language=language, title=title
+            )
+            return title, story_text
+
+        logger.info(f"🎨 Generating story per language (mode: {mode})...")
+        if mode == "parallel":
+            async with concurrent_stages() as tg:
+                english = tg.create_task(
+                    generate(
+                        "en",
+                        self.generate_story_in_language,
+                        image_data,
+                        mime_type,
+                        "en",
+                    )
+                )
+                german = tg.create_task(
+                    generate(
+                        "de",
+                        self.generate_story_in_language,
+                        image_data,
+                        mime_type,
+                        "de",
+                    )
+                )
+            title_en, story_text_en = english.result()
+            title_de, story_text_de = german.result()
+        else:
+            title_en, story_text_en = await generate(
+                "en", self.generate_story_in_language, image_data, mime_type, "en"
+            )
+            title_de, story_text_de = await generate(
+                "de", self.translate_story, title_en, story_text_en
+            )
+
+        return (
+            title_en,
+            title_de,
+            story_text_en,
+            story_text_de,
+            time.time() - start_time,
+        )
+
+    async def generate_bilingual_story(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        on_progress: ProgressCallback = None,
+        mode: Optional[str] = None,
+    ) -> Tuple[str, str, str, str, float]:
+        """
+        Generate the English and German story the way STORY_GENERATION_MODE says.
+
+        Args:
+            image_data: Raw image bytes
+            mime_type: MIME type of the image
+            on_progress: Optional progress callback
+            mode: 'combined', 'parallel' or 'translate' (default: the setting)
+
+        Returns:
+            Tuple of (title_en, title_de, story_text_en, story_text_de, generation_time)
+        """
+
+        mode = mode or settings.STORY_GENERATION_MODE
+        if mode in ("parallel", "translate"):
+            # One call per language, each validated and retried on its own
+            return await self.generate_story_per_language(
+                image_data, mime_type, mode, on_progress
+            )
+
+        # Generate bilingual story (both EN and DE in one call)
+        logger.info("🎨 Generating bilingual story (EN + DE)...")
+        return await call_upstream(
+            OPENAI_CHAT, self.generate_story, image_data, mime_type
+        )
+
+    async def _stream_completion(
+        self,
+        parser: StoryStreamParser,
+        on_progress: ProgressCallback,
+        **create_kwargs,
+    ) -> None:
+        """
+        Run a streamed chat completion and feed its tokens to a story parser.
+
+        Every token is reported as a 'story_token' event, and every title and
+        paragraph as soon as the parser has completed it. Opening the stream is
+        retried like any upstream call, under its deadline and limiter slot;
+        once tokens have been forwarded, the stream is not repeated (the client
+        would see them twice). Reading the tokens holds no limiter slot and has
+        its own, longer deadline (STORY_STREAM_TIMEOUT_SECONDS).
+
+        Raises:
+            UpstreamTimeoutError: If the answer is not complete within
+                STORY_STREAM_TIMEOUT_SECONDS
+
+        Args:
+            parser: Parser receiving the answer
+            on_progress: Progress callback receiving the events
+            **create_kwargs: Arguments of chat.completions.create
+        """
+
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        stream = await call_upstream(
+            OPENAI_CHAT,
+            self.client.chat.completions.create,
+            stream=True,
+            **create_kwargs,
+        )
+
+        def read_stream() -> None:
+            try:
+                for chunk in stream:
+                    if stop.is_set():
+                        break
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        loop.call_soon_threadsafe(
+                            deltas.put_nowait, chunk.choices[0].delta.content
+                        )
+            finally:
+                stream.close()
+
+        # The upstream deadline covers time to first byte (opening the stream);
+        # a long story keeps streaming for longer than that
+        reader = asyncio.ensure_future(
+            asyncio.wait_for(
+                loop.run_in_executor(get_upstream_executor(), read_stream),
+                settings.STORY_STREAM_TIMEOUT_SECONDS,
+            )
+        )
+        reader.add_done_callback(lambda _: deltas.put_nowait(None))
+
+        try:
+            while (delta := await deltas.get()) is not None:
+                await report_progress(
+                    on_progress, "story_token", language=parser.language, text=delta
+                )
+                for event, data in parser.feed(delta):
+                    await report_progress(on_progress, event, **data)
+            await reader
+        except asyncio.TimeoutError:
+            metrics.increment(f"upstream.{OPENAI_CHAT}.stream_deadline_exceeded")
+            raise UpstreamTimeoutError(
+                OPENAI_CHAT,
+                f"story stream not complete within "
+                f"{settings.STORY_STREAM_TIMEOUT_SECONDS:g}s",
+            )
+        finally:
+            stop.set()
+            if not reader.done():
+                reader.cancel()
+
+        for event, data in parser.close():
+            await report_progress(on_progress, event, **data)
+
+    async def generate_bilingual_story_streaming(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        on_progress: ProgressCallback = None,
+        mode: Optional[str] = None,
+    ) -> Tuple[str, str, str, str, float]:
+        """
+        Generate the English and German story, reporting it while it is written.
+
+        Tokens are reported as 'story_token' events, and titles and paragraphs
+        as 'story_title' / 'story_paragraph' events as soon as they are complete
+        (see src/utils/story_stream.py).
+
+        - 'combined': one streamed answer, English first, then German
+        - 'parallel': two streamed answers (one per language) at the same time
+        - 'translate': the English story, then its streamed translation
+
+        A language missing from the streamed answer is generated again without
+        streaming, on its own.
+
+        Args:
+            image_data: Raw image bytes
+            mime_type: MIME type of the image
+            on_progress: Optional progress callback
+            mode: 'combined', 'parallel' or 'translate' (default: the setting)
+
+        Returns:
+            Tuple of (title_en, title_de, story_text_en, story_text_de, generation_time)
+        """
+
+        start_time = time.time()
+        mode = mode or settings.STORY_GENERATION_MODE
+        logger.info(f"🎨 Streaming bilingual story (mode: {mode})...")
+
+        def vision_request(prompt: str, max_tokens: int) -> dict:
+            return {
+                "model": self.model,
+                "messages": self._image_messages(prompt, image_data, mime_type),
+                "max_tokens": max_tokens,
+                "temperature": 0.8,  # Creative but not too random
+            }
+
+        parsers = {"en": StoryStreamParser(), "de": StoryStreamParser()}
+        if mode == "parallel":
+            async with concurrent_stages() as tg:
+                for language, parser in parsers.items():
+                    tg.create_task(
+                        self._stream_completion(
+                            parser,
+                            on_progress,
+                            **vision_request(
+                                get_story_generation_prompt(language), 750
+                            ),
+                        )
+                    )
+        elif mode == "translate":
+            await self._stream_completion(
+                parsers["en"],
+                on_progress,
+                **vision_request(get_story_generation_prompt("en"), 750),
+            )
+            if parsers["en"].title("en") and parsers["en"].story_text("en"):
+                await self._stream_completion(
+                    parsers["de"],
+                    on_progress,
+                    model=settings.STORY_TRANSLATION_MODEL,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": get_story_translation_prompt_de(
+                                parsers["en"].title("en"),
+                                parsers["en"].story_text("en"),
+                            ),
+                        }
+                    ],
+                    max_tokens=750,
+                    temperature=0.3,
+                )
+        else:
+            # One answer holds both languages
+            parsers["de"] = parsers["en"]
+            await self._stream_completion(
+                parsers["en"],
+                on_progress,
+                **vision_request(
+                    get_story_generation_prompt_bilingual_sections(), 1500
+                ),
+            )
+
+        stories = {}
+        for language, parser in parsers.items():
+            title, story_text = parser.title(language), parser.story_text(language)
+            if not title or not story_text:
+                logger.warning(
+                    f"⚠️ Streamed answer has no complete {language.upper()} story, "
+                    f"generating it again"
+                )
+                if language == "de" and mode == "translate":
+                    title, story_text = await self._generate_story_part(
+                        "de", self.translate_story, *stories["en"]
+                    )
+                else:
+                    title, story_text = await self._generate_story_part(
+                        language,
+                        self.generate_story_in_language,
+                        image_data,
+                        mime_type,
+                        language,
+                    )
+            stories[language] = (title, story_text)
+            await report_progress(
+                on_progress, "story_part_generated", language=language, title=title
+            )
+
+        (title_en, story_text_en), (title_de, story_text_de) = (
+            stories["en"],
+            stories["de"],
+        )
+        return (
+            title_en,
+            title_de,
+            story_text_en,
+            story_text_de,
+            time.time() - start_time,
+        )
+
+    @staticmethod
+    def decode_image_base64(image_base64: str) -> bytes:
+        """
+        Decode a base64 image (optionally a data URL) to raw bytes.
 
         Args:
             image_base64: Base64 encoded image string
 
         Returns:
-            True if valid image, False otherwise
+            Decoded image bytes
+
+        Raises:
+            ValueError: If the string is not valid base64
         """
 
+        # Remove data URL prefix if present
+        if image_base64.startswith("data:image"):
+            image_base64 = image_base64.split(",", 1)[1]
+
         try:
-            # Remove data URL prefix if present
-            if image_base64.startswith("data:image"):
-                image_base64 = image_base64.split(",")[1]
+            return base64.b64decode(image_base64)
+        except Exception:
+            raise ValueError(
+                "Invalid image data. Please provide a valid base64 encoded image."
+            )
+
+    def validate_image_bytes(self, image_data: bytes) -> Optional[str]:
+        """
+        Validate that the bytes are an image of a reasonable size.
+
+        Only the image header is parsed; the pixels are not decoded.
+
+        Args:
+            image_data: Raw image bytes
 
-            # Decode base64
-            image_data = base64.b64decode(image_base64)
+        Returns:
+            MIME type of the image if valid, None otherwise
+        """
 
+        mime_type = sniff_image_mime_type(image_data)
+        if mime_type is None:
+            return None
+
+        try:
             # Try to open with PIL
             image = Image.open(BytesIO(image_data))
 
             # Check reasonable size
             width, height = image.size
             if width > 2048 or height > 2048 or width < 50 or height < 50:
-                return False
+                return None
 
-            return True
+            return mime_type
         except Exception:
+            return None
+
+    def validate_image_base64(self, image_base64: str) -> bool:
+        """
+        Validate that the base64 string is a valid image.
+
+        Args:
+            image_base64: Base64 encoded image string
+
+        Returns:
+            True if valid image, False otherwise
+        """
+
+        try:
+            image_data = self.decode_image_base64(image_base64)
+        except ValueError:
             return False
+        return self.validate_image_bytes(image_data) is not None
+
+    @staticmethod
+    async def get_owned_drawing(
+        db: AsyncSession, drawing_id: UUID, user_id: UUID
+    ) -> Drawing:
+        """
+        Load a drawing and check that it belongs to the user.
+
+        Args:
+            db: Async database session
+            drawing_id: UUID of the drawing
+            user_id: UUID of the user
+
+        Returns:
+            The drawing
+
+        Raises:
+            ValueError: If the drawing is not found or not owned by the user
+        """
+
+        drawing = await Drawing.get_by_id(db, drawing_id)
+        if not drawing:
+            raise ValueError("Drawing not found")
+        if drawing.user_id != user_id:
+            raise ValueError("You don't have permission to access this drawing")
+        return drawing
+
+    async def resolve_drawing_image_url(
+        self,
+        db: AsyncSession,
+        drawing_id: UUID,
+        image_index: int,
+        user_id: UUID,
+    ) -> str:
+        """
+        Look up the URL of one image of a drawing.
+
+        Args:
+            db: Async database session
+            drawing_id: UUID of the drawing
+            image_index: 0 for the uploaded original, n for the n-th edit
+            user_id: UUID of the user (for ownership check)
+
+        Returns:
+            URL of the image in Spaces
+
+        Raises:
+            ValueError: If the drawing is not found, not owned by the user, or
+                has no image at that index
+        """
+
+        drawing = await self.get_owned_drawing(db, drawing_id, user_id)
+
+        images = [drawing.uploaded_image_url] + (drawing.edited_images_urls or [])
+        if image_index >= len(images) or not images[image_index]:
+            raise ValueError(f"Drawing has no image at index {image_index}")
+
+        return images[image_index]
 
     def get_story_examples(self) -> dict:
         """
@@ -185,37 +817,71 @@ class StoryService:
     async def create_story(
         self,
         db: AsyncSession,
-        image_base64: str,
-        user_id: UUID,
+        image_base64: Optional[str] = None,
+        user_id: UUID = None,
         drawing_id: UUID = None,
         image_url: str = "",
+        on_progress: ProgressCallback = None,
+        image_data: Optional[bytes] = None,
+        image_index: Optional[int] = None,
+        stream_tokens: bool = False,
+        regenerate: bool = False,
     ) -> Dict[str, Any]:
         """
         Complete story creation flow: generate bilingual story and save to database.
 
-        Supports two modes:
-        1. Direct base64 image (image_base64 provided)
-        2. Image URL from Spaces (image_url provided)
+        Supports four image sources, in this order of precedence:
+        1. Raw image bytes (image_data provided)
+        2. Base64 image (image_base64 provided, decoded once)
+        3. Image of a stored drawing (drawing_id and image_index provided)
+        4. Image URL from Spaces (image_url provided)
+
+        The image stays raw bytes until it is downsized for the story model
+        (prepare_vision_image) and encoded into the OpenAI request.
+        A story cached for the same user and the same or a near-identical image
+        (see story_cache.py) is reused without calling OpenAI (generation_time 0),
+        unless regenerate is set; the new story then replaces the cached one.
 
         Args:
             db: Async database session
-            image_base64: Base64 encoded image (optional if image_url provided)
+            image_base64: Base64 encoded image (legacy JSON requests)
             user_id: UUID of the user creating the story
             drawing_id: Optional UUID of the associated drawing
             image_url: Optional URL of the image from Spaces
+            on_progress: Optional callback receiving stage events (see src/utils/progress.py)
+            image_data: Raw image bytes (multipart or binary requests)
+            image_index: Image of the drawing to use (0 = original, n = n-th edit)
+            stream_tokens: Report the story while it is written (story_token,
+                story_title and story_paragraph events)
+            regenerate: Write a new story even if one is cached for the image
 
         Returns:
-            Dictionary with story_id, title, story_text_en, story_text_de, and generation_time
+            Dictionary with story_id, title, story_text_en, story_text_de,
+            generation_time and image_url
 
         Raises:
-            ValueError: If image validation fails or generation fails
+            ValueError: If image validation fails, generation fails or the
+                drawing does not belong to the user
         """
 
-        # Determine which image source to use
-        final_image_base64 = image_base64
+        if not image_data and image_base64:
+            image_data = self.decode_image_base64(image_base64)
+
+        if not image_data and image_index is not None:
+            if not drawing_id:
+                raise ValueError("drawing_id is required when image_index is provided")
+            image_url = await self.resolve_drawing_image_url(
+                db, drawing_id, image_index, user_id
+            )
+            logger.info(f"🔄 Using image {image_index} of drawing {drawing_id}")
+
+            # Ownership was checked on the drawing
+            image_data = await self._download_image(image_url)
+            await report_progress(
+                on_progress, "original_downloaded", original_image_url=image_url
+            )
 
-        # If image_url is provided, download and convert to base64
-        if image_url and not image_base64:
+        elif not image_data and image_url:
             logger.info(f"🔄 Re-using existing image from URL: {image_url}")
 
             # Validate URL and extract user_id
@@ -233,69 +899,121 @@ class StoryService:
                 except Exception as e:
                     raise ValueError(f"Invalid image URL: {str(e)}")
 
-            # Download image from Spaces
-            if self.storage_service:
-                try:
-                    logger.info("📥 Downloading image from Spaces...")
-                    image_bytes = self.storage_service.download_image_as_bytes(
-                        image_url
-                    )
-                    logger.info(f"✅ Image downloaded: {len(image_bytes)} bytes")
-                    # Convert to base64
-                    final_image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-                    logger.info("✅ Image converted to base64")
-                except Exception as e:
-                    raise ValueError(f"Failed to download image from Spaces: {str(e)}")
-            else:
-                raise ValueError("Storage service not available for downloading images")
+            image_data = await self._download_image(image_url)
+            await report_progress(
+                on_progress, "original_downloaded", original_image_url=image_url
+            )
 
-        elif not image_base64 and not image_url:
-            raise ValueError("Either image_base64 or image_url must be provided")
+        elif not image_data:
+            raise ValueError(
+                "Either an image, image_url or drawing_id with image_index must be provided"
+            )
+
+        # The story is saved to the drawing (and may replace one of its stories)
+        if drawing_id and image_index is None:
+            await self.get_owned_drawing(db, drawing_id, user_id)
 
         # Validate image
-        if not self.validate_image_base64(final_image_base64):
+        mime_type = self.validate_image_bytes(image_data)
+        if mime_type is None:
             raise ValueError(
-                "Invalid image data. Please provide a valid base64 encoded image."
+                "Invalid image data. Please provide a valid PNG, JPEG, WebP or GIF image."
             )
 
-        # Generate bilingual story (both EN and DE in one call)
-        logger.info("🎨 Generating bilingual story (EN + DE)...")
-        title_en, title_de, story_text_en, story_text_de, generation_time = (
-            self.generate_story(final_image_base64)
-        )
+        await report_progress(on_progress, "validated")
 
-        logger.info(
-            f"✅ Story generated successfully: EN='{title_en}', DE='{title_de}' "
-            f"(EN: {len(story_text_en)} chars, DE: {len(story_text_de)} chars)"
+        # This request generates the story; a background pre-generation of the
+        # same image would only duplicate it
+        story_pregenerator.cancel(drawing_id, image_url)
+
+        # The same (or a near-identical) picture of this user reuses its earlier story
+        cache_key = story_cache.build_key(image_data, self.model, user_id)
+        phash = (
+            await run_blocking(story_cache.perceptual_hash, image_data)
+            if story_cache.enabled
+            else None
+        )
+        cached = (
+            None if regenerate else await story_cache.get(cache_key, phash, user_id)
         )
 
-        # Check if a story already exists for this image
-        # If it does, delete it to ensure only one story per image
-        if image_url and drawing_id:
-            existing_story = await StoryRepository.find_by_drawing_id_and_image_url(
-                db, drawing_id, image_url
+        if cached:
+            title_en, title_de = cached["title_en"], cached["title_de"]
+            story_text_en, story_text_de = (
+                cached["story_text_en"],
+                cached["story_text_de"],
+            )
+            generation_time = 0.0
+            if stream_tokens:
+                await self._report_cached_story(cached, on_progress)
+        else:
+            vision_data, vision_mime_type = await run_blocking(
+                self.prepare_vision_image, image_data, mime_type
+            )
+            await report_progress(on_progress, "upstream_started")
+            generate = (
+                self.generate_bilingual_story_streaming
+                if stream_tokens
+                else self.generate_bilingual_story
+            )
+            title_en, title_de, story_text_en, story_text_de, generation_time = (
+                await generate(vision_data, vision_mime_type, on_progress)
+            )
+            await story_cache.put(
+                cache_key,
+                {
+                    "title_en": title_en,
+                    "title_de": title_de,
+                    "story_text_en": story_text_en,
+                    "story_text_de": story_text_de,
+                },
+                phash,
+                user_id,
             )
-            if existing_story:
-                logger.info(
-                    f"🗑️ Deleting existing story {existing_story.id} for image {image_url}"
-                )
-                await Story.delete(db, existing_story.id)
-                logger.info(f"✅ Existing story deleted")
 
-        # Save story to database with both languages
-        saved_story = await Story.create(
-            db,
-            user_id=user_id,
-            drawing_id=drawing_id,
+        logger.info(
+            f"✅ Story {'reused' if cached else 'generated'} successfully: "
+            f"EN='{title_en}', DE='{title_de}' "
+            f"(EN: {len(story_text_en)} chars, DE: {len(story_text_de)} chars)"
+        )
+        await report_progress(
+            on_progress,
+            "story_generated",
             title_en=title_en,
             title_de=title_de,
-            story_text_en=story_text_en,
-            story_text_de=story_text_de,
-            image_url=image_url,
-            generation_time_ms=int(generation_time * 1000),
+            cached=bool(cached),
         )
 
+        # One story per stored image of a drawing: a story the image already has
+        # is replaced in the same statement (see StoryRepository.upsert_for_image).
+        # Uploads without a URL are separate images, each with its own story.
+        if drawing_id and image_url:
+            saved_story = await StoryRepository.upsert_for_image(
+                db,
+                user_id=user_id,
+                drawing_id=drawing_id,
+                image_url=image_url,
+                title_en=title_en,
+                title_de=title_de,
+                story_text_en=story_text_en,
+                story_text_de=story_text_de,
+                generation_time_ms=int(generation_time * 1000),
+            )
+        else:
+            saved_story = await Story.create(
+                db,
+                user_id=user_id,
+                drawing_id=drawing_id,
+                title_en=title_en,
+                title_de=title_de,
+                story_text_en=story_text_en,
+                story_text_de=story_text_de,
+                image_url=image_url,
+                generation_time_ms=int(generation_time * 1000),
+            )
+
         logger.info(f"💾 Story saved to database with ID: {saved_story.id}")
+        await report_progress(on_progress, "db_saved", story_id=str(saved_story.id))
 
         return {
             "story_id": str(saved_story.id),
@@ -304,8 +1022,62 @@ class StoryService:
             "story_text_en": story_text_en,
             "story_text_de": story_text_de,
             "generation_time": generation_time,
+            "image_url": image_url,
         }
 
+    @staticmethod
+    async def _report_cached_story(
+        story: Dict[str, Any], on_progress: ProgressCallback
+    ) -> None:
+        """Send a cached story as the title/paragraph events of a streamed one."""
+
+        for language in ("en", "de"):
+            await report_progress(
+                on_progress,
+                "story_title",
+                language=language,
+                title=story[f"title_{language}"],
+            )
+            paragraphs = [
+                paragraph.strip()
+                for paragraph in story[f"story_text_{language}"].split("\n\n")
+                if paragraph.strip()
+            ]
+            for index, text in enumerate(paragraphs):
+                await report_progress(
+                    on_progress,
+                    "story_paragraph",
+                    language=language,
+                    index=index,
+                    text=text,
+                )
+
+    async def _download_image(self, image_url: str) -> bytes:
+        """
+        Download an image from Spaces.
+
+        Raises:
+            ValueError: If storage is not configured or the download fails
+        """
+
+        if not self.storage_service:
+            raise ValueError("Storage service not available for downloading images")
+
+        try:
+            logger.info("📥 Downloading image from Spaces...")
+            image_bytes = await call_upstream(
+                SPACES,
+                self.storage_service.download_image_as_bytes,
+                image_url,
+                hedge=True,
+            )
+            logger.info(f"✅ Image downloaded: {len(image_bytes)} bytes")
+            return image_bytes
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to download image from Spaces: {str(e)}")
+
     async def save_story_to_db(
         self,
         db: AsyncSession,
@@ -0,0 +1,278 @@
+"""
+Incremental transcription of a recording that is still in progress.
+
+The app streams the child's voice prompt as raw PCM (16-bit little-endian mono)
+while recording. Instead of waiting for the whole clip, the audio is cut into
+segments at pauses and each segment is transcribed as soon as it is complete:
+
+- A segment is cut once it is at least STREAMING_TRANSCRIPTION_MIN_SEGMENT_SECONDS
+  long and a 100 ms window quieter than AUDIO_SILENCE_THRESHOLD_DB follows
+  (a pause between words); at STREAMING_TRANSCRIPTION_MAX_SEGMENT_SECONDS it is
+  cut at its quietest window regardless
+- Segments are transcribed concurrently through AudioService (pre-processing,
+  speech-to-text backend, upstream limits); silent segments are skipped
+- Every time the transcript grows, the text so far is reported as a
+  'partial_transcript' progress event
+
+When recording stops only the last segment is left to transcribe, so the final
+prompt is ready about one short transcription after the child stops speaking.
+
+Usage:
+    transcription = StreamingTranscription(audio_service, "en", on_progress=...)
+    for chunk in chunks:
+        transcription.feed(chunk)
+    text = await transcription.finish()
+"""
+
+import array
+import asyncio
+import io
+import math
+import sys
+import wave
+from typing import Dict, List, Optional
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.services.audio_service import AudioService
+from src.utils.progress import ProgressCallback, report_progress
+
+# Length of the windows whose level decides where a segment is cut
+WINDOW_SECONDS = 0.1
+
+
+def _window_level_db(pcm: bytes) -> float:
+    """RMS level of 16-bit little-endian PCM in dBFS (-inf for digital silence)."""
+
+    samples = array.array("h", pcm)
+    if sys.byteorder != "little":
+        samples.byteswap()
+    if not samples:
+        return float("-inf")
+    mean_square = sum(sample * sample for sample in samples) / len(samples)
+    if mean_square == 0:
+        return float("-inf")
+    return 10 * math.log10(mean_square / (32768 * 32768))
+
+
+def _pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap 16-bit mono PCM in a WAV container."""
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class StreamingTranscription:
+    """Segments a PCM stream at pauses and transcribes the segments as they complete"""
+
+    def __init__(
+        self,
+        audio_service: AudioService,
+        language: str = "en",
+        sample_rate: int = 16000,
+        on_progress: ProgressCallback = None,
+    ):
+        """
+        Args:
+            audio_service: AudioService used to transcribe the segments
+            language: Language code ('en' or 'de')
+            sample_rate: Sample rate of the PCM stream (8000-48000 Hz)
+            on_progress: Optional callback receiving 'partial_transcript' events
+
+        Raises:
+            ValueError: If the language or sample rate is not supported
+        """
+
+        if language not in ["en", "de"]:
+            raise ValueError("Invalid language. Please provide 'en' or 'de'.")
+        if not 8000 <= sample_rate <= 48000:
+            raise ValueError("Sample rate must be between 8000 and 48000 Hz")
+
+        self.audio_service = audio_service
+        self.language = language
+        self.sample_rate = sample_rate
+        self.on_progress = on_progress
+
+        self._bytes_per_second = sample_rate * 2
+        self._window_bytes = int(sample_rate * WINDOW_SECONDS) * 2
+        self._min_segment_bytes = int(
+            settings.STREAMING_TRANSCRIPTION_MIN_SEGMENT_SECONDS
+            * self._bytes_per_second
+        )
+        self._max_segment_bytes = int(
+            settings.STREAMING_TRANSCRIPTION_MAX_SEGMENT_SECONDS
+            * self._bytes_per_second
+        )
+        self._max_total_bytes = int(
+            settings.STREAMING_TRANSCRIPTION_MAX_SECONDS * self._bytes_per_second
+        )
+
+        # Audio not yet part of a segment, and the level of each complete window
+        self._pending = bytearray()
+        self._window_levels: List[float] = []
+        self._total_bytes = 0
+
+        self._tasks: List[asyncio.Task] = []
+        self._texts: Dict[int, str] = {}
+        self._reported_segments = 0
+        self._finished = False
+
+    @property
+    def seconds_received(self) -> float:
+        """Length of the audio fed so far."""
+        return self._total_bytes / self._bytes_per_second
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Add recorded audio and start transcribing any segment it completes.
+
+        Args:
+            chunk: 16-bit little-endian mono PCM (any length)
+
+        Raises:
+            ValueError: If the recording exceeds STREAMING_TRANSCRIPTION_MAX_SECONDS
+                or audio is fed after finish()
+        """
+
+        if self._finished:
+            raise ValueError("Recording already finished")
+
+        self._total_bytes += len(chunk)
+        if self._total_bytes > self._max_total_bytes:
+            raise ValueError(
+                f"Recording too long "
+                f"(max {settings.STREAMING_TRANSCRIPTION_MAX_SECONDS:g}s)"
+            )
+
+        self._pending.extend(chunk)
+        measured = len(self._window_levels) * self._window_bytes
+        while len(self._pending) - measured >= self._window_bytes:
+            window = bytes(self._pending[measured : measured + self._window_bytes])
+            self._window_levels.append(_window_level_db(window))
+            measured += self._window_bytes
+
+        cut = self._find_cut()
+        while cut is not None:
+            self._start_segment(bytes(self._pending[:cut]))
+            del self._pending[:cut]
+            del self._window_levels[: cut // self._window_bytes]
+            cut = self._find_cut()
+
+    async def finish(self) -> str:
+        """
+        Transcribe the rest of the recording and return the full transcript.
+
+        Returns:
+            Transcribed text of all segments, in order
+
+        Raises:
+            ValueError: If nothing was recorded or a segment failed to transcribe
+        """
+
+        self._finished = True
+        if self._pending:
+            self._start_segment(bytes(self._pending))
+            self._pending.clear()
+            self._window_levels.clear()
+
+        if not self._tasks:
+            raise ValueError("No audio received")
+
+        try:
+            await asyncio.gather(*self._tasks)
+        except BaseException:
+            self.cancel()
+            raise
+
+        text = self._text_of(len(self._tasks))
+        if not text:
+            raise ValueError("No speech detected in the recording")
+        return text
+
+    def cancel(self) -> None:
+        """Stop all segment transcriptions (the client went away)."""
+
+        self._finished = True
+        for task in self._tasks:
+            task.cancel()
+
+    def _find_cut(self) -> Optional[int]:
+        """Byte offset at which the pending audio should be cut, if any."""
+
+        if len(self._pending) < self._min_segment_bytes:
+            return None
+
+        # Only windows that end after the minimum segment length are candidates
+        first = self._min_segment_bytes // self._window_bytes
+        last = min(
+            len(self._window_levels), self._max_segment_bytes // self._window_bytes
+        )
+        threshold = settings.AUDIO_SILENCE_THRESHOLD_DB
+
+        for index in range(first, last):
+            if self._window_levels[index] < threshold:
+                return (index + 1) * self._window_bytes
+
+        if len(self._pending) < self._max_segment_bytes or last <= first:
+            return None
+
+        # No pause: cut at the quietest window so a word is less likely split
+        quietest = min(range(first, last), key=lambda i: self._window_levels[i])
+        return (quietest + 1) * self._window_bytes
+
+    def _start_segment(self, pcm: bytes) -> None:
+        index = len(self._tasks)
+        self._tasks.append(asyncio.create_task(self._transcribe_segment(index, pcm)))
+
+    async def _transcribe_segment(self, index: int, pcm: bytes) -> None:
+        """Transcribe one segment and report the transcript if it grew."""
+
+        seconds = len(pcm) / self._bytes_per_second
+        loudest = max(
+            (
+                _window_level_db(pcm[start : start + self._window_bytes])
+                for start in range(0, len(pcm), self._window_bytes)
+            ),
+            default=float("-inf"),
+        )
+
+        if loudest < settings.AUDIO_SILENCE_THRESHOLD_DB:
+            # Whisper tends to invent words for silence
+            logger.info(f"🔇 Segment {index} ({seconds:.1f}s) is silent, skipped")
+            text = ""
+        else:
+            # Segments are unique, so they are not worth a cache entry each
+            text, duration = await self.audio_service.transcribe(
+                _pcm_to_wav(pcm, self.sample_rate),
+                self.language,
+                f"segment-{index}.wav",
+                use_cache=False,
+            )
+            logger.info(
+                f"🎙️ Segment {index} ({seconds:.1f}s) transcribed in {duration:.2f}s"
+            )
+
+        self._texts[index] = text.strip()
+
+        # Report the transcript up to the first segment still in flight
+        ready = self._reported_segments
+        while ready in self._texts:
+            ready += 1
+        if ready > self._reported_segments:
+            self._reported_segments = ready
+            await report_progress(
+                self.on_progress,
+                "partial_transcript",
+                text=self._text_of(ready),
+                segments=ready,
+            )
+
+    def _text_of(self, segments: int) -> str:
+        return " ".join(
+            self._texts[i] for i in range(segments) if self._texts.get(i)
+        ).strip()
@@ -0,0 +1,218 @@
+"""
+Content-addressed cache of Whisper transcriptions.
+
+Voice prompts are often sent twice: the app retries on timeout, and the same
+recording may be reused to edit another drawing. A transcription is identified by:
+- sha256 of the uploaded audio bytes (before any ffmpeg conversion)
+- the language hint and the speech-to-text model name
+
+Two tiers:
+- Local: bounded per-process LRU (TRANSCRIPTION_CACHE_LOCAL_MAX_ENTRIES)
+- Persistent (optional, TRANSCRIPTION_CACHE_PERSISTENT): cache_entries table
+  shared by all API and worker processes
+
+Concurrent requests for the same clip share one Whisper call. Hits, misses and
+the hit rate are recorded in src.core.metrics (transcription_cache.*).
+
+The persistent tier uses its own short-lived sessions, so a cache failure never
+leaves the caller's session in a failed transaction.
+"""
+
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, Optional
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.database import async_session
+from src.repositories import CacheEntryRepository
+from src.utils import LRUCache
+
+
+class TranscriptionCache:
+    """Two-tier cache mapping an audio fingerprint to its transcription"""
+
+    NAMESPACE = "whisper_transcription"
+
+    def __init__(self):
+        self.enabled = settings.TRANSCRIPTION_CACHE_ENABLED
+        self.persistent = settings.TRANSCRIPTION_CACHE_PERSISTENT
+        self.ttl_seconds = settings.TRANSCRIPTION_CACHE_TTL_SECONDS
+        # Transcriptions never change, so local entries only expire with the TTL
+        self.local = LRUCache(
+            max_entries=settings.TRANSCRIPTION_CACHE_LOCAL_MAX_ENTRIES,
+            ttl_seconds=self.ttl_seconds,
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._lookups = 0
+
+    @staticmethod
+    def build_key(audio_data: bytes, language: str, model: str) -> str:
+        """
+        Build the cache key for a transcription.
+
+        Args:
+            audio_data: Raw uploaded audio bytes
+            language: Language hint sent to Whisper ('en' or 'de')
+            model: Speech-to-text model name
+
+        Returns:
+            sha256 hex digest identifying the transcription
+        """
+
+        audio_hash = hashlib.sha256(audio_data).hexdigest()
+        fingerprint = "\x1f".join([model, language, audio_hash])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    async def get_or_transcribe(
+        self, key: str, transcribe: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Return the cached transcription, or transcribe once and cache it.
+
+        Callers asking for a key that is already being transcribed wait for that
+        call instead of starting another one.
+
+        Args:
+            key: Key from build_key()
+            transcribe: Coroutine function producing the transcription on a miss
+
+        Returns:
+            Transcribed text
+        """
+
+        if not self.enabled:
+            return await transcribe()
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record_lookup("hits.coalesced", hit=True)
+            logger.info("♻️ Transcription cache hit (in flight)")
+            return await asyncio.shield(inflight)
+
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        # Re-check: another request may have started while we were in the DB
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        # The transcription runs as its own task, owned by no caller: a caller
+        # that is cancelled (client gone, sibling stage failed) stops waiting
+        # without cancelling it for the requests coalesced onto it
+        task = asyncio.create_task(self._transcribe_and_store(key, transcribe))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        return await asyncio.shield(task)
+
+    async def _transcribe_and_store(
+        self, key: str, transcribe: Callable[[], Awaitable[str]]
+    ) -> str:
+        text = await transcribe()
+        await self.put(key, text)
+        return text
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished transcription task (and retrieve its error)."""
+
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Waiters re-raise it; mark it retrieved for the no-waiter case
+            task.exception()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a transcription (local tier first).
+
+        Cache failures are logged and treated as misses, never raised.
+
+        Args:
+            key: Key from build_key()
+
+        Returns:
+            Transcribed text or None on a miss
+        """
+
+        if not self.enabled:
+            return None
+
+        text = self.local.get(key)
+        if text is not None:
+            self._record_lookup("hits.local", hit=True)
+            logger.info("♻️ Transcription cache hit (local)")
+            return text
+
+        if self.persistent:
+            try:
+                async with async_session() as db:
+                    value = await CacheEntryRepository.get_value(
+                        db, self.NAMESPACE, key
+                    )
+            except Exception as e:
+                metrics.increment("transcription_cache.errors")
+                logger.warning(f"⚠️ Transcription cache lookup failed: {e}")
+                value = None
+
+            if value and value.get("text") is not None:
+                text = value["text"]
+                self._set_local(key, text)
+                self._record_lookup("hits.persistent", hit=True)
+                logger.info("♻️ Transcription cache hit (persistent)")
+                return text
+
+        self._record_lookup("misses", hit=False)
+        return None
+
+    async def put(self, key: str, text: str) -> None:
+        """
+        Store a transcription in both tiers.
+
+        Args:
+            key: Key from build_key()
+            text: Transcribed text
+        """
+
+        if not self.enabled:
+            return
+
+        self._set_local(key, text)
+
+        if not self.persistent:
+            return
+
+        try:
+            async with async_session() as db:
+                await CacheEntryRepository.set_value(
+                    db,
+                    self.NAMESPACE,
+                    key,
+                    {"text": text},
+                    ttl_seconds=self.ttl_seconds,
+                )
+            metrics.increment("transcription_cache.stores")
+        except Exception as e:
+            metrics.increment("transcription_cache.errors")
+            logger.warning(f"⚠️ Failed to store transcription cache entry: {e}")
+
+    def _record_lookup(self, outcome: str, hit: bool) -> None:
+        """Count a lookup and update the hit rate gauge."""
+
+        self._lookups += 1
+        if hit:
+            self._hits += 1
+        metrics.increment(f"transcription_cache.{outcome}")
+        metrics.set_gauge("transcription_cache.hit_rate", self._hits / self._lookups)
+
+    def _set_local(self, key: str, text: str) -> None:
+        """Store an entry in the local tier and update its size gauge."""
+        self.local.set(key, text)
+        metrics.set_gauge("transcription_cache.local_size", len(self.local))
+
+
+# Global cache instance (the local tier is shared by everything in this process)
+transcription_cache = TranscriptionCache()
@@ -43,6 +43,67 @@ from .password import (
     validate_password_strength,
 )
 
+# Async execution
+from .executor import (
+    run_blocking,
+    shutdown_upstream_executor,
+)
+
+# Upstream concurrency limits and resilience
+from .upstream_limiter import (
+    AdaptiveLimiter,
+    UpstreamOverloadedError,
+    UpstreamUnavailableError,
+)
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    UpstreamTimeoutError,
+)
+from .upstream import (
+    call_upstream,
+    get_circuit_breaker,
+    get_retry_budget,
+    get_upstream_limiter,
+    is_overload_error,
+    is_transient_error,
+)
+
+# Pipelines
+from .pipeline import StageTimings, concurrent_stages
+
+# Progress streaming
+from .progress import ProgressCallback, report_progress
+from .sse import format_sse_event, stream_progress, terminal_event
+
+# Caching
+from .lru_cache import LRUCache
+
+# Image normalization
+from .image_normalization import NormalizedImage, normalize_image
+from .image_format import sniff_image_mime_type, image_extension
+
+# Audio transcoding
+from .audio_transcode import (
+    PreprocessedAudio,
+    get_ffmpeg_path,
+    preprocess_speech,
+    transcode_to_mp3,
+)
+
+# Upload ingestion
+from .upload_ingest import (
+    IngestedUpload,
+    UploadSizeLimitMiddleware,
+    ingest_upload,
+    read_body,
+    sniff_audio_format,
+)
+
+# Streamed stories
+from .story_stream import StoryStreamParser
+
 # File operations
 from .file_operations import (
     sanitize_filename,
@@ -75,6 +136,52 @@ __all__ = [
     "hash_password",
     "verify_password",
     "validate_password_strength",
+    # Async execution
+    "run_blocking",
+    "shutdown_upstream_executor",
+    # Upstream concurrency limits and resilience
+    "AdaptiveLimiter",
+    "UpstreamOverloadedError",
+    "UpstreamUnavailableError",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryBudget",
+    "UpstreamTimeoutError",
+    "call_upstream",
+    "get_circuit_breaker",
+    "get_retry_budget",
+    "get_upstream_limiter",
+    "is_overload_error",
+    "is_transient_error",
+    # Pipelines
+    "StageTimings",
+    "concurrent_stages",
+    # Progress streaming
+    "ProgressCallback",
+    "report_progress",
+    "format_sse_event",
+    "stream_progress",
+    "terminal_event",
+    # Caching
+    "LRUCache",
+    # Image normalization
+    "NormalizedImage",
+    "normalize_image",
+    "sniff_image_mime_type",
+    "image_extension",
+    # Audio transcoding
+    "PreprocessedAudio",
+    "get_ffmpeg_path",
+    "preprocess_speech",
+    "transcode_to_mp3",
+    # Upload ingestion
+    "IngestedUpload",
+    "UploadSizeLimitMiddleware",
+    "ingest_upload",
+    "read_body",
+    "sniff_audio_format",
+    # Streamed stories
+    "StoryStreamParser",
     # File operations
     "sanitize_filename",
     "create_session_folder",
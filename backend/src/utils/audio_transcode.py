@@ -0,0 +1,286 @@
+"""
+In-memory audio transcoding with ffmpeg.
+
+Voice prompts are prepared for Whisper by streaming the upload through ffmpeg's
+stdin and reading the result from its stdout:
+- preprocess_speech(): mono 16 kHz, leading/trailing silence trimmed, Opus in
+  Ogg at a speech bitrate (a fraction of the upload and of Whisper's work)
+- transcode_to_mp3(): plain MP3 conversion for formats Whisper does not accept
+  (the app records ADTS AAC), used when pre-processing is disabled or fails
+
+Both run ffmpeg the same way:
+- No temporary files: the audio never touches the disk
+- asyncio subprocess: waiting for ffmpeg blocks neither the event loop nor an
+  upstream executor thread
+- At most AUDIO_TRANSCODE_MAX_CONCURRENCY ffmpeg processes run per worker; a
+  conversion taking longer than AUDIO_TRANSCODE_TIMEOUT_SECONDS is killed
+
+Input is read from a pipe, so containers that need seeking (MP4/3GP with the
+index at the end) cannot be converted; Whisper accepts those directly anyway.
+
+Usage:
+    from src.utils.audio_transcode import preprocess_speech
+
+    speech = await preprocess_speech(aac_bytes)
+    print(speech.bytes_saved, speech.seconds_saved)
+"""
+
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.core.config import settings
+from src.core.logger import logger
+
+# Whisper resamples everything to 16 kHz mono, so more is never sent
+SPEECH_SAMPLE_RATE = 16000
+# Silence kept before the first and after the last word
+SILENCE_PADDING_SECONDS = 0.25
+# Shorter trimmed clips are treated as "no speech found"
+MIN_SPEECH_SECONDS = 0.2
+
+_transcode_semaphore: asyncio.Semaphore = None
+
+
+@dataclass
+class PreprocessedAudio:
+    """Result of preprocess_speech()."""
+
+    data: bytes
+    input_bytes: int
+    output_bytes: int
+    input_seconds: float
+    output_seconds: float
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.input_bytes - self.output_bytes
+
+    @property
+    def seconds_saved(self) -> float:
+        return max(0.0, self.input_seconds - self.output_seconds)
+
+
+@functools.lru_cache(maxsize=1)
+def get_ffmpeg_path() -> str:
+    """
+    Resolve the ffmpeg binary bundled with imageio-ffmpeg (once per process).
+
+    Returns:
+        Absolute path of the ffmpeg executable
+    """
+
+    import imageio_ffmpeg
+
+    ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
+    logger.info(f"📦 Using ffmpeg from: {ffmpeg_path}")
+    return ffmpeg_path
+
+
+def _get_transcode_semaphore() -> asyncio.Semaphore:
+    global _transcode_semaphore
+
+    if _transcode_semaphore is None:
+        _transcode_semaphore = asyncio.Semaphore(
+            settings.AUDIO_TRANSCODE_MAX_CONCURRENCY
+        )
+    return _transcode_semaphore
+
+
+async def _run_ffmpeg(arguments: List[str], input_data: bytes) -> bytes:
+    """
+    Pipe bytes through one ffmpeg process and return its stdout.
+
+    Args:
+        arguments: ffmpeg arguments (input from pipe:0, output to pipe:1)
+        input_data: Bytes written to ffmpeg's stdin
+
+    Returns:
+        ffmpeg's output
+
+    Raises:
+        ValueError: If ffmpeg fails, produces no output or times out
+    """
+
+    command = [get_ffmpeg_path(), "-hide_banner", "-loglevel", "error", *arguments]
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        # communicate() feeds stdin and drains stdout/stderr concurrently,
+        # so large inputs cannot deadlock on full pipe buffers
+        output, stderr = await asyncio.wait_for(
+            process.communicate(input=input_data),
+            timeout=settings.AUDIO_TRANSCODE_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise ValueError(
+            f"ffmpeg conversion timed out after "
+            f"{settings.AUDIO_TRANSCODE_TIMEOUT_SECONDS:g}s"
+        )
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+
+    if process.returncode != 0 or not output:
+        error = stderr.decode("utf-8", errors="replace").strip()
+        logger.error(f"❌ ffmpeg error: {error}")
+        raise ValueError(f"ffmpeg conversion failed: {error or 'no output'}")
+
+    return output
+
+
+async def transcode_to_mp3(audio_data: bytes) -> bytes:
+    """
+    Convert audio to MP3 by piping it through ffmpeg.
+
+    Args:
+        audio_data: Audio file bytes in any streamable format ffmpeg can probe
+
+    Returns:
+        MP3 bytes
+
+    Raises:
+        ValueError: If ffmpeg fails, produces no output or times out
+    """
+
+    arguments = [
+        "-i",
+        "pipe:0",
+        "-vn",  # No video
+        "-ar",
+        "44100",  # Audio sample rate
+        "-ac",
+        "2",  # Audio channels
+        "-b:a",
+        "128k",  # Audio bitrate
+        "-f",
+        "mp3",  # Output format
+        "pipe:1",
+    ]
+
+    async with _get_transcode_semaphore():
+        return await _run_ffmpeg(arguments, audio_data)
+
+
+def _silence_trim_filter(threshold_db: float) -> str:
+    """
+    ffmpeg filter removing leading and trailing silence, keeping pauses in speech.
+
+    silenceremove only trims reliably at the start, so the clip is reversed to
+    trim its end the same way.
+    """
+
+    trim_start = (
+        f"silenceremove=start_periods=1:start_threshold={threshold_db}dB:"
+        f"start_silence={SILENCE_PADDING_SECONDS}"
+    )
+    return f"{trim_start},areverse,{trim_start},areverse"
+
+
+def _ogg_opus_duration(ogg_data: bytes) -> float:
+    """
+    Duration of an Ogg Opus stream from its last page's granule position.
+
+    Returns:
+        Duration in seconds (0.0 if the stream cannot be parsed)
+    """
+
+    last_page = ogg_data.rfind(b"OggS")
+    head = ogg_data.find(b"OpusHead")
+    if last_page < 0 or head < 0 or len(ogg_data) < last_page + 14:
+        return 0.0
+
+    granule = int.from_bytes(ogg_data[last_page + 6 : last_page + 14], "little")
+    pre_skip = int.from_bytes(ogg_data[head + 10 : head + 12], "little")
+    return max(0.0, (granule - pre_skip) / 48000)
+
+
+async def preprocess_speech(
+    audio_data: bytes,
+    threshold_db: float = -45.0,
+    bitrate_kbps: int = 24,
+) -> PreprocessedAudio:
+    """
+    Turn a voice recording into compact speech audio for Whisper.
+
+    1. Decode, downmix to mono and resample to 16 kHz (Whisper's own input rate)
+    2. Trim leading and trailing silence (quieter than `threshold_db`)
+    3. Encode as Opus in Ogg at `bitrate_kbps` (VoIP tuning)
+
+    A clip that is silent throughout is encoded untrimmed, so Whisper still
+    gets to decide what is in it.
+
+    Args:
+        audio_data: Audio file bytes in any streamable format ffmpeg can probe
+        threshold_db: Level below which audio counts as silence
+        bitrate_kbps: Opus bitrate
+
+    Returns:
+        PreprocessedAudio with the Ogg Opus bytes and the size/duration savings
+
+    Raises:
+        ValueError: If ffmpeg cannot decode or encode the audio
+    """
+
+    decode_arguments = [
+        "-i",
+        "pipe:0",
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(SPEECH_SAMPLE_RATE),
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+
+    def encode_arguments(audio_filter: Optional[str]) -> List[str]:
+        arguments = ["-f", "s16le", "-ar", str(SPEECH_SAMPLE_RATE), "-ac", "1"]
+        arguments += ["-i", "pipe:0"]
+        if audio_filter:
+            arguments += ["-af", audio_filter]
+        arguments += ["-c:a", "libopus", "-b:a", f"{bitrate_kbps}k"]
+        arguments += ["-application", "voip", "-f", "ogg", "pipe:1"]
+        return arguments
+
+    async with _get_transcode_semaphore():
+        pcm = await _run_ffmpeg(decode_arguments, audio_data)
+        input_seconds = len(pcm) / (SPEECH_SAMPLE_RATE * 2)
+
+        try:
+            speech = await _run_ffmpeg(
+                encode_arguments(_silence_trim_filter(threshold_db)), pcm
+            )
+            output_seconds = _ogg_opus_duration(speech)
+        except ValueError:
+            # Nothing above the threshold: the trimmed stream is empty
+            output_seconds = 0.0
+
+        if output_seconds < MIN_SPEECH_SECONDS:
+            speech = await _run_ffmpeg(encode_arguments(None), pcm)
+            output_seconds = _ogg_opus_duration(speech)
+
+    return PreprocessedAudio(
+        data=speech,
+        input_bytes=len(audio_data),
+        output_bytes=len(speech),
+        input_seconds=input_seconds,
+        output_seconds=output_seconds,
+    )
+
+
+__all__ = [
+    "PreprocessedAudio",
+    "get_ffmpeg_path",
+    "preprocess_speech",
+    "transcode_to_mp3",
+]
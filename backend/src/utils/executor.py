@@ -0,0 +1,87 @@
+"""
+Bounded thread pool for blocking upstream SDK calls.
+
+The Gemini, OpenAI and boto3 clients used by the services are synchronous.
+Calling them directly from an ``async def`` flow freezes the uvicorn event loop
+for the whole duration of the call, so no other request on that worker (not even
+``/health``) makes progress while an edit is running.
+
+All blocking upstream work is funnelled through one dedicated, bounded executor
+instead of Starlette's shared default thread pool, so long-running edits can never
+starve the threads used by sync endpoints and file handling.
+
+Usage:
+    from src.utils.executor import run_blocking
+
+    response = await run_blocking(
+        client.models.generate_content, model=model, contents=contents
+    )
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.core.config import settings
+from src.core.logger import logger
+
+T = TypeVar("T")
+
+# Created lazily so importing this module never spawns threads
+_upstream_executor: ThreadPoolExecutor = None
+
+
+def get_upstream_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor used for blocking upstream calls.
+
+    Returns:
+        The shared ThreadPoolExecutor (created on first use)
+    """
+
+    global _upstream_executor
+
+    if _upstream_executor is None:
+        _upstream_executor = ThreadPoolExecutor(
+            max_workers=settings.UPSTREAM_EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="upstream",
+        )
+        logger.info(
+            f"🧵 Upstream executor started with {settings.UPSTREAM_EXECUTOR_MAX_WORKERS} workers"
+        )
+
+    return _upstream_executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function in the upstream executor without blocking the event loop.
+
+    Args:
+        func: Synchronous callable (e.g. an SDK method)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns (exceptions are re-raised in the caller)
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_upstream_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_upstream_executor() -> None:
+    """Shut down the upstream executor (waits for in-flight calls to finish)."""
+
+    global _upstream_executor
+
+    if _upstream_executor is not None:
+        _upstream_executor.shutdown(wait=True)
+        _upstream_executor = None
+        logger.info("🧵 Upstream executor shut down")
+
+
+__all__ = ["get_upstream_executor", "run_blocking", "shutdown_upstream_executor"]
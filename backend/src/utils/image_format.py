@@ -0,0 +1,52 @@
+"""
+Image format detection from magic bytes.
+
+Lets the pipeline carry raw image bytes end to end (Gemini result → Spaces) and
+only decode an image when a transform is actually needed.
+"""
+
+from typing import Optional
+
+# MIME type → file extension used for Spaces keys
+IMAGE_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+}
+
+
+def sniff_image_mime_type(data: bytes) -> Optional[str]:
+    """
+    Detect the image format from the first bytes of the data.
+
+    Args:
+        data: Raw (possibly image) bytes
+
+    Returns:
+        MIME type ('image/png', 'image/jpeg', 'image/webp', 'image/gif') or None
+    """
+
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return None
+
+
+def image_extension(mime_type: str) -> str:
+    """
+    Get the file extension for an image MIME type.
+
+    Args:
+        mime_type: Image MIME type
+
+    Returns:
+        File extension without dot (defaults to 'png')
+    """
+
+    return IMAGE_EXTENSIONS.get(mime_type, "png")
@@ -0,0 +1,109 @@
+"""
+Input normalization for images sent to upstream vision models.
+
+Phone photos of paper drawings are several MB and often larger than the model
+needs. Before an image is sent upstream it is:
+1. Decoded with Pillow's JPEG draft mode (DCT scaling, so a 12 MP photo is never
+   fully decoded when only ~1 MP is kept)
+2. Rotated according to its EXIF orientation
+3. Flattened onto white if it has transparency, converted to RGB
+4. Downsized so the longest edge is at most `max_edge`
+5. Re-encoded as JPEG (or WebP) at `quality` without any metadata (EXIF, GPS, ICC)
+"""
+
+import math
+from dataclasses import dataclass
+from io import BytesIO
+from PIL import Image, ImageOps
+
+# Output format → MIME type
+OUTPUT_MIME_TYPES = {"JPEG": "image/jpeg", "WEBP": "image/webp"}
+
+
+@dataclass
+class NormalizedImage:
+    """Result of normalize_image()."""
+
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    original_width: int
+    original_height: int
+    original_size_bytes: int
+
+
+def normalize_image(
+    image_data: bytes,
+    max_edge: int = 1024,
+    quality: int = 85,
+    output_format: str = "JPEG",
+) -> NormalizedImage:
+    """
+    Downsize and re-encode an image for an upstream model.
+
+    Args:
+        image_data: Raw image bytes (any format Pillow can read)
+        max_edge: Maximum length of the longest edge in pixels
+        quality: JPEG/WebP quality of the re-encoded image (1-95)
+        output_format: 'JPEG' or 'WEBP'
+
+    Returns:
+        NormalizedImage with the re-encoded bytes and before/after dimensions
+
+    Raises:
+        PIL.UnidentifiedImageError: If the bytes are not a readable image
+        ValueError: If output_format is not supported
+    """
+
+    output_format = output_format.upper()
+    if output_format not in OUTPUT_MIME_TYPES:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    image = Image.open(BytesIO(image_data))
+    original_width, original_height = image.size
+
+    # JPEG draft mode: let libjpeg decode at 1/2, 1/4 or 1/8 scale directly,
+    # keeping the result at least as large as the final size
+    if image.format == "JPEG":
+        scale = min(1.0, max_edge / max(original_width, original_height))
+        image.draft(
+            "RGB",
+            (
+                math.ceil(original_width * scale),
+                math.ceil(original_height * scale),
+            ),
+        )
+
+    image = ImageOps.exif_transpose(image)
+
+    # Transparent areas of exported drawings become white paper, not black
+    if image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    ):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    if max(image.size) > max_edge:
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    # Saving without exif/icc_profile strips all metadata
+    buffer = BytesIO()
+    if output_format == "WEBP":
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    else:
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+
+    return NormalizedImage(
+        data=buffer.getvalue(),
+        mime_type=OUTPUT_MIME_TYPES[output_format],
+        width=image.size[0],
+        height=image.size[1],
+        original_width=original_width,
+        original_height=original_height,
+        original_size_bytes=len(image_data),
+    )
@@ -0,0 +1,90 @@
+"""
+Bounded in-memory LRU cache with optional per-entry expiry.
+
+Used as the local (per-process) tier in front of persistent caches, so the hottest
+entries are served without a database round trip. Thread-safe, because it is also
+touched from the upstream executor threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+
+class LRUCache:
+    """
+    Least-recently-used cache holding at most `max_entries` items.
+
+    Args:
+        max_entries: Maximum number of entries before the oldest is evicted
+        ttl_seconds: Entry lifetime in seconds (None = never expires)
+        on_evict: Called with (key, value) for every entry evicted to make room
+
+    Example:
+        cache = LRUCache(max_entries=1024, ttl_seconds=600)
+        cache.set("key", {"url": "..."})
+        value = cache.get("key")
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it recently used) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, (evicted_value, _) = self._entries.popitem(last=False)
+                if self.on_evict is not None:
+                    self.on_evict(evicted_key, evicted_value)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove an entry and return its value (None if missing)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[0] if entry else None
+
+    def remove_where(self, predicate: Callable[[Any], bool]) -> List[Hashable]:
+        """Remove every entry whose value matches `predicate`; return their keys."""
+        with self._lock:
+            keys = [
+                key for key, (value, _) in self._entries.items() if predicate(value)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return keys
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
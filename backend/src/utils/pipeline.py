@@ -0,0 +1,96 @@
+"""
+Helpers for multi-stage request pipelines (edit and story flows).
+
+- StageTimings records how long each named stage took, so responses can report
+  where the time went and end-to-end latency can be compared with the critical path
+- concurrent_stages() runs independent stages as tasks of an asyncio.TaskGroup:
+  if one stage fails, its siblings are cancelled and the original exception is
+  re-raised (not an ExceptionGroup), so the usual ValueError → 400 mapping still works
+
+Usage:
+    timings = StageTimings()
+    async with concurrent_stages() as tg:
+        upload = tg.create_task(timings.run("upload_original", upload_coro))
+        edit = tg.create_task(timings.run("edit", edit_coro))
+    original_url, result = upload.result(), edit.result()
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Dict, Optional
+
+
+class StageTimings:
+    """Wall-clock durations of named pipeline stages (seconds)"""
+
+    def __init__(self):
+        self._started_at = time.perf_counter()
+        self._timings: Dict[str, float] = {}
+
+    async def run(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        """
+        Await a stage and record its duration (also when it fails).
+
+        Args:
+            name: Stage name (e.g. 'upload_original', 'transcribe', 'edit')
+            awaitable: Coroutine or task performing the stage
+
+        Returns:
+            Result of the stage
+        """
+
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._timings[name] = round(time.perf_counter() - start, 3)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration measured elsewhere."""
+        self._timings[name] = round(seconds, 3)
+
+    def as_dict(self, include_total: bool = True) -> Dict[str, float]:
+        """
+        Get all stage durations.
+
+        Args:
+            include_total: Add 'total' (time since the StageTimings was created)
+
+        Returns:
+            Dictionary of stage name → seconds
+        """
+
+        timings = dict(self._timings)
+        if include_total:
+            timings["total"] = round(time.perf_counter() - self._started_at, 3)
+        return timings
+
+
+def _first_error(group: BaseExceptionGroup) -> Optional[BaseException]:
+    """Return the first non-cancellation exception of a (nested) group."""
+    for exc in group.exceptions:
+        if isinstance(exc, BaseExceptionGroup):
+            exc = _first_error(exc)
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            return exc
+    return None
+
+
+@asynccontextmanager
+async def concurrent_stages():
+    """
+    TaskGroup for independent pipeline stages that re-raises the first failure.
+
+    Yields:
+        asyncio.TaskGroup to create the stage tasks on
+    """
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            yield tg
+    except BaseExceptionGroup as group:
+        error = _first_error(group)
+        if error is None:
+            raise
+        raise error from None
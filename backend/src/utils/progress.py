@@ -0,0 +1,45 @@
+"""
+Progress reporting for long-running pipelines (edits and stories).
+
+Services accept an optional `on_progress` callback and report each finished
+stage through report_progress(). Without a callback (the regular JSON endpoints,
+the edit worker) reporting is a no-op, so the pipelines behave exactly as before.
+
+Stages reported by the edit and story pipelines:
+- validated: inputs were checked, upstream work is about to start
+- original_uploaded / original_downloaded: original image stored / loaded (original_image_url)
+- partial_transcript: transcript so far of a live recording (text, segments)
+- transcribed: voice instruction transcribed (transcribed_text)
+- upstream_started: the Gemini edit / story generation request was sent
+- result_stored: edited image available in Spaces (edited_image_url, cached)
+- option_result: one edit option of a batch edit finished (edit_option_id, success, ...)
+- story_token / story_title / story_paragraph: streamed story text, see
+  src/utils/story_stream.py (create-story/stream only)
+- story_part_generated: the story in one language is ready (language, title)
+- story_generated: story text is ready (title_en, title_de, cached)
+- db_saved: result saved to the database (drawing_id / story_id)
+
+Usage:
+    await report_progress(on_progress, "transcribed", transcribed_text=text)
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Receives the stage name and its JSON-serializable data
+ProgressCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+async def report_progress(
+    on_progress: Optional[ProgressCallback], stage: str, **data: Any
+) -> None:
+    """
+    Report a finished pipeline stage to the caller, if it is listening.
+
+    Args:
+        on_progress: Progress callback or None
+        stage: Stage name (e.g. 'validated', 'transcribed')
+        **data: JSON-serializable stage data
+    """
+
+    if on_progress is not None:
+        await on_progress(stage, data)
@@ -0,0 +1,244 @@
+"""
+Circuit breakers and retry budgets for upstream APIs (Gemini, OpenAI, Whisper, Spaces).
+
+Both are used by src.utils.upstream.call_upstream, one of each per upstream:
+
+- CircuitBreaker: tracks the outcome of the last `window` calls. When at least
+  `min_calls` were made and `failure_rate` of them failed with a transient error
+  (timeout, 429, 5xx, connection error), the breaker opens and calls fail fast
+  with CircuitOpenError for `open_seconds`. Afterwards a single probe call is let
+  through (half-open): success closes the breaker, failure opens it again.
+- RetryBudget: retries (and hedged requests) are paid from a token bucket that
+  every first attempt tops up by `ratio`, plus a small time-based refill. Retries
+  therefore stay below ~`ratio` of the traffic, so a degraded upstream never sees
+  its load multiplied by the retry count.
+
+Metrics (per upstream, see GET /metrics):
+- upstream.<name>.circuit_state (gauge: 0 closed, 1 half-open, 2 open)
+- upstream.<name>.circuit_opened / short_circuited (counters)
+- upstream.<name>.retry_budget_exhausted (counter)
+
+Usage (services go through src.utils.upstream.call_upstream instead):
+    breaker = CircuitBreaker("gemini")
+    breaker.before_call()            # raises CircuitOpenError while open
+    ...
+    breaker.record("failure")        # or "success" / "ignored"
+"""
+
+import random
+import time
+from collections import deque
+from typing import Deque
+
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.utils.upstream_limiter import UpstreamUnavailableError
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised when a call is rejected because the upstream's breaker is open."""
+
+
+class UpstreamTimeoutError(UpstreamUnavailableError):
+    """Raised when an upstream call did not finish within its deadline."""
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker with a single half-open probe for one upstream"""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    _STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: int = 20,
+        open_seconds: float = 30.0,
+    ):
+        """
+        Create a closed breaker.
+
+        Args:
+            name: Upstream name (used in metrics and errors)
+            failure_rate: Share of failed calls in the window that opens the breaker
+            min_calls: Calls needed in the window before the breaker may open
+            window: Number of recent calls considered
+            open_seconds: Time the breaker stays open before a probe is allowed
+        """
+
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+
+        self._state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self._publish_state()
+
+    @property
+    def state(self) -> str:
+        """Current state ('closed', 'half_open' or 'open')."""
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be made now.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or its probe is still running)
+        """
+
+        if self._state == self.OPEN:
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                metrics.increment(f"upstream.{self.name}.short_circuited")
+                raise CircuitOpenError(
+                    self.name, f"circuit open, retry in {remaining:.0f}s"
+                )
+            self._set_state(self.HALF_OPEN)
+
+        if self._state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                metrics.increment(f"upstream.{self.name}.short_circuited")
+                raise CircuitOpenError(self.name, "circuit half-open, probe running")
+            self._probe_in_flight = True
+
+    def record(self, outcome: str) -> None:
+        """
+        Record the outcome of a call allowed by before_call().
+
+        Args:
+            outcome: 'success' (includes non-transient errors such as a 400, since
+                the upstream did answer), 'failure' (transient error) or 'ignored'
+                (the call never reached the upstream or was abandoned)
+        """
+
+        if self._state == self.HALF_OPEN:
+            if not self._probe_in_flight:
+                return
+            self._probe_in_flight = False
+            if outcome == "success":
+                self._outcomes.clear()
+                self._set_state(self.CLOSED)
+            elif outcome == "failure":
+                self._open()
+            return
+
+        if self._state == self.OPEN or outcome == "ignored":
+            return
+
+        self._outcomes.append(outcome == "failure")
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and sum(self._outcomes) >= self.failure_rate * calls:
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        metrics.increment(f"upstream.{self.name}.circuit_opened")
+        self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state == self._state:
+            return
+        if state == self.OPEN:
+            logger.warning(
+                f"⛔ Upstream '{self.name}' circuit opened for {self.open_seconds:.0f}s"
+            )
+        else:
+            logger.info(f"🔌 Upstream '{self.name}' circuit {state.replace('_', '-')}")
+        self._state = state
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        metrics.set_gauge(
+            f"upstream.{self.name}.circuit_state", self._STATE_GAUGE[self._state]
+        )
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a share of an upstream's traffic"""
+
+    def __init__(
+        self,
+        name: str,
+        ratio: float = 0.1,
+        min_per_second: float = 0.2,
+        max_tokens: float = 10.0,
+    ):
+        """
+        Create a full budget.
+
+        Args:
+            name: Upstream name (used in metrics)
+            ratio: Retry tokens earned by every first attempt
+            min_per_second: Tokens added per second regardless of traffic, so a
+                quiet upstream can still retry the odd failure
+            max_tokens: Most tokens the bucket holds (bounds a retry burst)
+        """
+
+        self.name = name
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+
+        self._tokens = max_tokens
+        self._refilled_at = time.monotonic()
+
+    def deposit(self) -> None:
+        """Earn retry tokens for a first attempt."""
+        self._refill(self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Spend one token for a retry or hedged request.
+
+        Returns:
+            True if the retry may be made, False if the budget is exhausted
+        """
+
+        self._refill(0.0)
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        metrics.increment(f"upstream.{self.name}.retry_budget_exhausted")
+        return False
+
+    def _refill(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._refilled_at) * self.min_per_second
+        self._refilled_at = now
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Delay before a retry (exponential backoff with full jitter).
+
+    Args:
+        attempt: Number of the attempt that just failed (1 for the first call)
+        base: Delay scale in seconds
+        cap: Longest delay in seconds
+
+    Returns:
+        Random delay between 0 and min(cap, base * 2 ** (attempt - 1))
+    """
+
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryBudget",
+    "UpstreamTimeoutError",
+    "backoff_delay",
+]
@@ -0,0 +1,151 @@
+"""
+Server-Sent Events responses for pipelines that report progress.
+
+stream_progress() runs a pipeline in a background task and streams every stage
+it reports (see src/utils/progress.py) as an SSE event named after the stage.
+The stream ends with exactly one terminal event:
+- result: the same JSON body the regular endpoint returns
+- error: {"status_code": ..., "detail": ...} with the status the regular endpoint would use
+
+If the client disconnects, the pipeline task is cancelled, so no further upstream
+calls, uploads or database writes are made for a client that has given up.
+
+Usage:
+    return stream_progress(
+        request,
+        run_edit,  # async def run_edit(on_progress) -> ImageProcessResponse
+        error_prefix="Failed to edit image",
+    )
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.core.logger import logger
+from src.utils.progress import ProgressCallback
+from src.utils.upstream_limiter import UpstreamUnavailableError
+
+# Comment lines keep proxies from closing the connection during long stages
+KEEPALIVE_INTERVAL_SECONDS = 10.0
+
+_DONE = object()
+
+
+def format_sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    Format one Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable event data
+
+    Returns:
+        SSE wire format ('event: ...\\ndata: ...\\n\\n')
+    """
+
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def stream_progress(
+    request: Request,
+    run: Callable[[ProgressCallback], Awaitable[Any]],
+    error_prefix: str,
+) -> StreamingResponse:
+    """
+    Run a pipeline and stream its progress as Server-Sent Events.
+
+    Args:
+        request: Incoming request (used to detect client disconnects)
+        run: Starts the pipeline with the given progress callback and returns
+            the final response model (or a JSON-serializable dict)
+        error_prefix: Prefix of the detail for unexpected (500) errors
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+
+    async def events():
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def on_progress(stage: str, data: Dict[str, Any]) -> None:
+            await queue.put((stage, data))
+
+        task = asyncio.create_task(run(on_progress))
+        task.add_done_callback(lambda _: queue.put_nowait(_DONE))
+
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), KEEPALIVE_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    item = None
+
+                if item is _DONE:
+                    break
+
+                if await request.is_disconnected():
+                    logger.info("🔌 Client disconnected, cancelling pipeline")
+                    return
+
+                if item is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    stage, data = item
+                    yield format_sse_event(stage, data)
+
+            yield _terminal_event(task, error_prefix)
+        finally:
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _terminal_event(task: asyncio.Task, error_prefix: str) -> str:
+    """Build the result or error event of a finished pipeline task."""
+    return format_sse_event(*terminal_event(task, error_prefix))
+
+
+def terminal_event(task: asyncio.Task, error_prefix: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Name and data of the event that ends a pipeline's progress stream.
+
+    Errors get the status code the regular endpoint would respond with.
+
+    Args:
+        task: Finished pipeline task
+        error_prefix: Prefix of the detail for unexpected (500) errors
+
+    Returns:
+        ('result', response body) or ('error', {"status_code": ..., "detail": ...})
+    """
+
+    status_code: Optional[int] = None
+    try:
+        payload = task.result()
+    except HTTPException as e:
+        status_code, detail = e.status_code, e.detail
+    except UpstreamUnavailableError as e:
+        status_code, detail = 503, str(e)
+    except ValueError as e:
+        status_code, detail = 400, str(e)
+    except Exception as e:
+        logger.error(f"{error_prefix}: {str(e)}")
+        status_code, detail = 500, f"{error_prefix}: {str(e)}"
+
+    if status_code is not None:
+        return "error", {"status_code": status_code, "detail": detail}
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    return "result", payload
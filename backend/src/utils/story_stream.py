@@ -0,0 +1,154 @@
+"""
+Incremental parser for streamed story answers.
+
+Story answers use labelled sections, in English and/or German:
+
+    TITLE: Bella and the Tiny Door
+
+    STORY:
+    First paragraph...
+
+    Second paragraph...
+
+    TITEL: Bella und die kleine Tür
+
+    GESCHICHTE:
+    Erster Absatz...
+
+StoryStreamParser is fed the answer token by token and returns an event as soon
+as a part is complete: the title when its line ends, a paragraph when the blank
+line after it (or the next section, or the end of the answer) arrives.
+
+Events:
+- story_title: {"language", "title"}
+- story_paragraph: {"language", "index", "text"}
+
+Usage:
+    parser = StoryStreamParser()
+    for delta in deltas:
+        for event, data in parser.feed(delta):
+            await report_progress(on_progress, event, **data)
+    events = parser.close()
+    title_en, story_text_en = parser.title("en"), parser.story_text("en")
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Section label → (language, section)
+SECTION_LABELS = {
+    "TITLE": ("en", "title"),
+    "STORY": ("en", "story"),
+    "TITEL": ("de", "title"),
+    "GESCHICHTE": ("de", "story"),
+}
+
+_LABEL_PATTERN = re.compile(
+    r"^(?P<label>TITLE|STORY|TITEL|GESCHICHTE)\s*:\s*(?P<rest>.*)$", re.IGNORECASE
+)
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class StoryStreamParser:
+    """Turns a streamed TITLE/STORY (TITEL/GESCHICHTE) answer into events"""
+
+    def __init__(self):
+        self._buffer = ""
+        self._language: Optional[str] = None
+        self._section: Optional[str] = None
+        self._paragraph: List[str] = []
+        self._titles: Dict[str, str] = {}
+        self._paragraphs: Dict[str, List[str]] = {"en": [], "de": []}
+
+    @property
+    def language(self) -> Optional[str]:
+        """Language of the section currently being written (None before the first label)."""
+        return self._language
+
+    def feed(self, text: str) -> List[Event]:
+        """
+        Add the next piece of the answer.
+
+        Args:
+            text: Streamed text (any length, may split lines or words)
+
+        Returns:
+            Events for the parts completed by this text
+        """
+
+        self._buffer += text
+        events: List[Event] = []
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            events += self._process_line(line)
+        return events
+
+    def close(self) -> List[Event]:
+        """
+        Finish the answer (the last line and paragraph have no terminator).
+
+        Returns:
+            Events for the remaining parts
+        """
+
+        events: List[Event] = []
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            events += self._process_line(line)
+        events += self._flush_paragraph()
+        return events
+
+    def title(self, language: str) -> str:
+        """Title parsed so far for a language ('' if none)."""
+        return self._titles.get(language, "")
+
+    def story_text(self, language: str) -> str:
+        """Paragraphs parsed so far for a language, separated by blank lines."""
+        return "\n\n".join(self._paragraphs[language])
+
+    def _process_line(self, line: str) -> List[Event]:
+        # Models sometimes decorate the labels (**TITLE:**, ## STORY:)
+        cleaned = line.strip().replace("*", "").lstrip("#").strip()
+
+        match = _LABEL_PATTERN.match(cleaned)
+        if match:
+            events = self._flush_paragraph()
+            self._language, self._section = SECTION_LABELS[match.group("label").upper()]
+            rest = match.group("rest").strip()
+            if rest:
+                events += self._process_content(rest)
+            return events
+
+        if not cleaned:
+            return self._flush_paragraph() if self._section == "story" else []
+
+        return self._process_content(line.strip())
+
+    def _process_content(self, text: str) -> List[Event]:
+        if self._section == "title" and self._language not in self._titles:
+            title = text.strip().strip('"')
+            self._titles[self._language] = title
+            return [("story_title", {"language": self._language, "title": title})]
+        if self._section == "story":
+            self._paragraph.append(text)
+        return []
+
+    def _flush_paragraph(self) -> List[Event]:
+        if not self._paragraph:
+            return []
+
+        text = " ".join(self._paragraph)
+        self._paragraph = []
+        paragraphs = self._paragraphs[self._language]
+        paragraphs.append(text)
+        return [
+            (
+                "story_paragraph",
+                {
+                    "language": self._language,
+                    "index": len(paragraphs) - 1,
+                    "text": text,
+                },
+            )
+        ]
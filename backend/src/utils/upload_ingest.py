@@ -0,0 +1,280 @@
+"""
+Bounded-memory ingestion of multipart uploads.
+
+Two layers keep an upload from being buffered before it is known to be valid:
+- UploadSizeLimitMiddleware: rejects multipart requests larger than
+  UPLOAD_MAX_REQUEST_BYTES with 413, from Content-Length before anything is
+  read, or as soon as a streamed (chunked) body goes over the limit. While the
+  form is parsed, Starlette spools every file part above 1 MB to a temporary
+  file, so an accepted body never sits in memory as a whole.
+- ingest_upload(): reads one UploadFile in UPLOAD_CHUNK_BYTES chunks. The magic
+  number is checked on the first chunk (400), the byte limit while reading (413)
+  and, for images, the pixel size as soon as the header has been read (400).
+  The sha256 is computed on the way. Only an upload that passed all checks is
+  read into memory, once.
+- read_body(): the same checks for a request whose body is the file itself
+  (e.g. Content-Type: image/png), applied while the body is received.
+
+Usage:
+    upload = await ingest_upload(image, "image")
+    image_data = await upload.read()
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException, Request, UploadFile
+from PIL import ImageFile
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.utils.image_format import sniff_image_mime_type
+
+# Same limit as ImageProcessingService.validate_image
+MAX_IMAGE_DIMENSION = 2048
+
+
+def sniff_audio_format(data: bytes) -> Optional[str]:
+    """
+    Detect the audio container from the first bytes of the data.
+
+    Args:
+        data: Raw (possibly audio) bytes
+
+    Returns:
+        'aac' (ADTS), 'mp3', 'wav', 'flac', 'ogg', 'mp4' (m4a) or 'webm', or None
+    """
+
+    if len(data) >= 2 and data[0] == 0xFF and (data[1] & 0xE0) == 0xE0:
+        # Frame sync: ADTS has layer bits 00, MPEG audio layers 01-11
+        return "aac" if (data[1] & 0x06) == 0 else "mp3"
+    if data.startswith(b"ID3"):
+        return "mp3"
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        return "wav"
+    if data.startswith(b"fLaC"):
+        return "flac"
+    if data.startswith(b"OggS"):
+        return "ogg"
+    if data[4:8] == b"ftyp":
+        return "mp4"
+    if data.startswith(b"\x1a\x45\xdf\xa3"):
+        return "webm"
+    return None
+
+
+@dataclass
+class IngestedUpload:
+    """An upload that passed ingest_upload()'s checks."""
+
+    upload: UploadFile
+    size: int
+    sha256: str
+    format: str
+
+    async def read(self) -> bytes:
+        """Read the whole (validated) upload."""
+        await self.upload.seek(0)
+        return await self.upload.read()
+
+
+class _ChunkValidator:
+    """Checks an image or audio file chunk by chunk (shared by uploads and raw bodies)."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        if kind == "image":
+            self.max_bytes = settings.UPLOAD_MAX_IMAGE_BYTES
+            self.sniff = sniff_image_mime_type
+            self.wrong_type = "File must be an image (PNG, JPEG, WebP or GIF)"
+        else:
+            self.max_bytes = settings.UPLOAD_MAX_AUDIO_BYTES
+            self.sniff = sniff_audio_format
+            self.wrong_type = (
+                "Invalid audio file. Supported formats: "
+                "mp3, wav, m4a, aac, webm, ogg, flac"
+            )
+
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.detected = None
+        # Fed until the image header (and so its size) is known
+        self.header_parser = ImageFile.Parser() if kind == "image" else None
+
+    def feed(self, chunk: bytes) -> None:
+        """Check the next chunk; raises HTTPException (400/413) on the first problem."""
+
+        if self.detected is None:
+            self.detected = self.sniff(chunk)
+            if self.detected is None:
+                raise HTTPException(status_code=400, detail=self.wrong_type)
+
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"{self.kind.capitalize()} too large "
+                f"(max {self.max_bytes / (1024 * 1024):g}MB)",
+            )
+
+        if self.header_parser is not None:
+            try:
+                self.header_parser.feed(chunk)
+            except Exception:
+                raise HTTPException(status_code=400, detail=self.wrong_type)
+            if self.header_parser.image is not None:
+                width, height = self.header_parser.image.size
+                if width > MAX_IMAGE_DIMENSION or height > MAX_IMAGE_DIMENSION:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Invalid image or image too large (max 2048x2048)",
+                    )
+                self.header_parser = None
+
+        self.digest.update(chunk)
+
+    def finish(self) -> None:
+        """Reject an empty file."""
+
+        if self.detected is None:
+            raise HTTPException(status_code=400, detail=f"Empty {self.kind} file")
+
+
+async def ingest_upload(upload: UploadFile, kind: str) -> IngestedUpload:
+    """
+    Validate an uploaded file while reading it in chunks.
+
+    Args:
+        upload: Uploaded file
+        kind: 'image' or 'audio'
+
+    Returns:
+        IngestedUpload with the size, sha256 and detected format
+
+    Raises:
+        HTTPException: 400 if the content is not an image/audio file (or the
+            image is larger than 2048x2048), 413 if it exceeds the size limit
+    """
+
+    validator = _ChunkValidator(kind)
+
+    await upload.seek(0)
+    while True:
+        chunk = await upload.read(settings.UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        validator.feed(chunk)
+    validator.finish()
+
+    ingested = IngestedUpload(
+        upload=upload,
+        size=validator.size,
+        sha256=validator.digest.hexdigest(),
+        format=validator.detected,
+    )
+    logger.info(
+        f"📥 Ingested {kind} '{upload.filename}': {validator.detected}, "
+        f"{validator.size} bytes, sha256 {ingested.sha256[:12]}"
+    )
+    return ingested
+
+
+async def read_body(request: Request, kind: str) -> bytes:
+    """
+    Read a raw (non-multipart) request body holding one image or audio file.
+
+    The body is checked as it is received, with the same rules as
+    ingest_upload(), so an invalid or oversized body is rejected early.
+
+    Args:
+        request: Request whose body is the file itself
+        kind: 'image' or 'audio'
+
+    Returns:
+        The body bytes
+
+    Raises:
+        HTTPException: 400 if the content is not an image/audio file (or the
+            image is larger than 2048x2048), 413 if it exceeds the size limit
+    """
+
+    validator = _ChunkValidator(kind)
+    body = bytearray()
+
+    async for chunk in request.stream():
+        if not chunk:
+            continue
+        validator.feed(chunk)
+        body += chunk
+    validator.finish()
+
+    logger.info(
+        f"📥 Read {kind} body: {validator.detected}, {validator.size} bytes, "
+        f"sha256 {validator.digest.hexdigest()[:12]}"
+    )
+    return bytes(body)
+
+
+class UploadSizeLimitMiddleware:
+    """ASGI middleware rejecting multipart bodies over UPLOAD_MAX_REQUEST_BYTES"""
+
+    def __init__(self, app, max_bytes: Optional[int] = None):
+        self.app = app
+        self.max_bytes = max_bytes or settings.UPLOAD_MAX_REQUEST_BYTES
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._is_multipart(scope):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = self._header(scope, b"content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                await self._reject(send)
+                return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised inside form parsing; FastAPI turns it into the response
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Request too large (max {self.max_bytes / (1024 * 1024):g}MB)"
+
+    async def _reject(self, send) -> None:
+        logger.warning(f"⚠️ Rejected upload: {self._detail()}")
+        body = json.dumps({"detail": self._detail()}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _header(scope, name: bytes) -> Optional[str]:
+        for key, value in scope.get("headers", []):
+            if key.lower() == name:
+                return value.decode("latin-1")
+        return None
+
+    def _is_multipart(self, scope) -> bool:
+        content_type = self._header(scope, b"content-type") or ""
+        return content_type.lower().startswith("multipart/form-data")
@@ -0,0 +1,463 @@
+"""
+Rate-limited, fault-tolerant calls to the external APIs the services depend on.
+
+Every blocking upstream call (Gemini edits, OpenAI chat, Whisper, Spaces) goes
+through call_upstream(), which per attempt:
+1. Fails fast with CircuitOpenError while the upstream's circuit breaker is open
+2. Takes a slot from the upstream's AdaptiveLimiter (see upstream_limiter.py)
+3. Runs the call in the upstream executor under a per-upstream deadline
+
+Transient failures are retried with jittered backoff, paid from a per-upstream
+retry budget (see resilience.py), and slow idempotent calls can be hedged.
+Each upstream has its own limiter, breaker and budget, so a burst of 429s from
+Gemini affects only Gemini while uploads and transcriptions keep working.
+
+Usage:
+    from src.utils.upstream import call_upstream, GEMINI
+
+    response = await call_upstream(
+        GEMINI, client.models.generate_content, model=model, contents=contents
+    )
+    image_bytes = await call_upstream(SPACES, storage.download, url, hedge=True)
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+import httpx
+import openai
+from botocore import exceptions as botocore_exceptions
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.metrics import metrics
+from src.utils.executor import get_upstream_executor
+from src.utils.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    UpstreamTimeoutError,
+    backoff_delay,
+)
+from src.utils.upstream_limiter import AdaptiveLimiter, UpstreamUnavailableError
+
+T = TypeVar("T")
+
+# Upstream names (also used as metric prefixes: upstream.<name>.*)
+GEMINI = "gemini"
+OPENAI_CHAT = "openai_chat"
+WHISPER = "whisper"
+SPACES = "spaces"
+
+# Status codes / error codes that mean "slow down", as used by the
+# OpenAI (status_code), google-genai (code/status) and botocore (Error.Code) clients
+_OVERLOAD_STATUS_CODES = {429, 503}
+_OVERLOAD_ERROR_CODES = {
+    "RESOURCE_EXHAUSTED",
+    "UNAVAILABLE",
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequests",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ServiceUnavailable",
+    "503",
+}
+
+# Additional codes that are worth a retry (server errors, timeouts)
+_TRANSIENT_STATUS_CODES = _OVERLOAD_STATUS_CODES | {408, 500, 502, 504}
+_TRANSIENT_ERROR_CODES = _OVERLOAD_ERROR_CODES | {
+    "INTERNAL",
+    "DEADLINE_EXCEEDED",
+    "InternalError",
+    "RequestTimeout",
+    "500",
+    "502",
+    "504",
+}
+
+# Network-level failures of the OpenAI (httpx), google-genai (httpx) and boto3 clients
+_TRANSIENT_EXCEPTIONS = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    openai.APIConnectionError,
+    botocore_exceptions.ConnectionError,
+    botocore_exceptions.HTTPClientError,
+)
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_budgets: Dict[str, RetryBudget] = {}
+
+
+def _timeouts() -> Dict[str, float]:
+    """Deadline of one attempt per upstream, in seconds."""
+
+    return {
+        GEMINI: settings.UPSTREAM_GEMINI_TIMEOUT_SECONDS,
+        OPENAI_CHAT: settings.UPSTREAM_OPENAI_TIMEOUT_SECONDS,
+        WHISPER: settings.UPSTREAM_WHISPER_TIMEOUT_SECONDS,
+        SPACES: settings.UPSTREAM_SPACES_TIMEOUT_SECONDS,
+    }
+
+
+def get_upstream_limiter(upstream: str) -> AdaptiveLimiter:
+    """
+    Get (or create) the limiter of an upstream.
+
+    Args:
+        upstream: One of GEMINI, OPENAI_CHAT, WHISPER, SPACES
+
+    Returns:
+        The process-wide AdaptiveLimiter for the upstream
+    """
+
+    limiter = _limiters.get(upstream)
+    if limiter is None:
+        max_limits = {
+            GEMINI: settings.UPSTREAM_GEMINI_MAX_CONCURRENCY,
+            OPENAI_CHAT: settings.UPSTREAM_OPENAI_MAX_CONCURRENCY,
+            WHISPER: settings.UPSTREAM_WHISPER_MAX_CONCURRENCY,
+            SPACES: settings.UPSTREAM_SPACES_MAX_CONCURRENCY,
+        }
+        limiter = AdaptiveLimiter(
+            upstream,
+            max_limit=max_limits.get(upstream, settings.UPSTREAM_EXECUTOR_MAX_WORKERS),
+            max_queue=settings.UPSTREAM_QUEUE_MAX,
+            queue_timeout=settings.UPSTREAM_QUEUE_TIMEOUT_SECONDS,
+        )
+        _limiters[upstream] = limiter
+    return limiter
+
+
+def get_circuit_breaker(upstream: str) -> CircuitBreaker:
+    """
+    Get (or create) the circuit breaker of an upstream.
+
+    Args:
+        upstream: One of GEMINI, OPENAI_CHAT, WHISPER, SPACES
+
+    Returns:
+        The process-wide CircuitBreaker for the upstream
+    """
+
+    breaker = _breakers.get(upstream)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            upstream,
+            failure_rate=settings.UPSTREAM_BREAKER_FAILURE_RATE,
+            min_calls=settings.UPSTREAM_BREAKER_MIN_CALLS,
+            open_seconds=settings.UPSTREAM_BREAKER_OPEN_SECONDS,
+        )
+        _breakers[upstream] = breaker
+    return breaker
+
+
+def get_retry_budget(upstream: str) -> RetryBudget:
+    """
+    Get (or create) the retry budget of an upstream.
+
+    Args:
+        upstream: One of GEMINI, OPENAI_CHAT, WHISPER, SPACES
+
+    Returns:
+        The process-wide RetryBudget for the upstream
+    """
+
+    budget = _budgets.get(upstream)
+    if budget is None:
+        budget = RetryBudget(upstream, ratio=settings.UPSTREAM_RETRY_BUDGET_RATIO)
+        _budgets[upstream] = budget
+    return budget
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception (or one it was raised from) is a rate-limit/overload error.
+
+    The services often wrap SDK errors in ValueError, so the chain of
+    __cause__/__context__ exceptions is inspected as well.
+
+    Args:
+        exc: Exception raised by an upstream call
+
+    Returns:
+        True if the upstream asked us to slow down
+    """
+
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+
+        for attr in ("status_code", "code"):
+            if getattr(exc, attr, None) in _OVERLOAD_STATUS_CODES:
+                return True
+        if getattr(exc, "status", None) in _OVERLOAD_ERROR_CODES:
+            return True
+
+        response = getattr(exc, "response", None)
+        if isinstance(response, dict):
+            error_code = response.get("Error", {}).get("Code")
+            if error_code in _OVERLOAD_ERROR_CODES:
+                return True
+
+        exc = exc.__cause__ or exc.__context__
+
+    return False
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception (or one it was raised from) is worth retrying.
+
+    Transient errors are rate limits/overload, 5xx responses, timeouts and
+    connection errors. Anything else (bad request, invalid image, parse errors)
+    would fail the same way again.
+
+    Args:
+        exc: Exception raised by an upstream call
+
+    Returns:
+        True if a retry may succeed
+    """
+
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+
+        if isinstance(exc, (UpstreamTimeoutError,) + _TRANSIENT_EXCEPTIONS):
+            return True
+        if is_overload_error(exc):
+            return True
+        for attr in ("status_code", "code"):
+            if getattr(exc, attr, None) in _TRANSIENT_STATUS_CODES:
+                return True
+        if getattr(exc, "status", None) in _TRANSIENT_ERROR_CODES:
+            return True
+
+        response = getattr(exc, "response", None)
+        if isinstance(response, dict):
+            error_code = response.get("Error", {}).get("Code")
+            if error_code in _TRANSIENT_ERROR_CODES:
+                return True
+
+        exc = exc.__cause__ or exc.__context__
+
+    return False
+
+
+def _outcome(future: asyncio.Future) -> str:
+    """Classify a finished upstream call for the limiter."""
+
+    if future.cancelled():
+        return "failed"
+    exc = future.exception()
+    if exc is None:
+        return "success"
+    return "overloaded" if is_overload_error(exc) else "failed"
+
+
+async def _run_attempt(upstream: str, call: Callable[[], T], timeout: float) -> T:
+    """
+    Make one call: breaker check, limiter slot, executor thread, deadline.
+
+    If the caller is cancelled or the deadline passes, the limiter slot is held
+    until the thread actually finishes, because the upstream is still working
+    on the request.
+    """
+
+    breaker = get_circuit_breaker(upstream)
+    breaker.before_call()
+
+    limiter = None
+    if settings.UPSTREAM_LIMITER_ENABLED:
+        limiter = get_upstream_limiter(upstream)
+        try:
+            await limiter.acquire()
+        except BaseException:
+            breaker.record("ignored")
+            raise
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    future = loop.run_in_executor(get_upstream_executor(), call)
+
+    def on_done(f: asyncio.Future) -> None:
+        # Also retrieves the exception of calls nobody awaits anymore
+        outcome = _outcome(f)
+        if limiter is not None:
+            limiter.release(time.perf_counter() - started, outcome)
+
+    future.add_done_callback(on_done)
+
+    try:
+        result = await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        metrics.increment(f"upstream.{upstream}.deadline_exceeded")
+        breaker.record("failure")
+        raise UpstreamTimeoutError(upstream, f"no response within {timeout:g}s")
+    except asyncio.CancelledError:
+        breaker.record("ignored")
+        raise
+    except Exception as e:
+        breaker.record("failure" if is_transient_error(e) else "success")
+        raise
+
+    breaker.record("success")
+    return result
+
+
+async def _run_hedged(upstream: str, call: Callable[[], T], timeout: float) -> T:
+    """
+    Make one call and, if it is slower than the hedge delay, a second identical one.
+
+    The hedge is only sent while the breaker is closed, the limiter has a free
+    slot and the retry budget pays for it, so hedging backs off by itself when
+    the upstream is struggling. The first successful answer wins.
+    """
+
+    primary = asyncio.ensure_future(_run_attempt(upstream, call, timeout))
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(
+            {primary}, timeout=settings.UPSTREAM_HEDGE_DELAY_SECONDS
+        )
+        if done:
+            return primary.result()
+
+        limiter = get_upstream_limiter(upstream)
+        if (
+            get_circuit_breaker(upstream).state != CircuitBreaker.CLOSED
+            or (settings.UPSTREAM_LIMITER_ENABLED and not limiter.has_capacity)
+            or not get_retry_budget(upstream).try_withdraw()
+        ):
+            return await primary
+
+        metrics.increment(f"upstream.{upstream}.hedged")
+        hedge = asyncio.ensure_future(_run_attempt(upstream, call, timeout))
+        tasks.append(hedge)
+
+        pending = set(tasks)
+        error: BaseException = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        metrics.increment(f"upstream.{upstream}.hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # The loser (or both, if the caller went away) is abandoned
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def _describe_failure(exc: BaseException) -> str:
+    """Short, client-safe reason for a transient failure."""
+
+    if isinstance(exc, UpstreamTimeoutError):
+        return exc.reason
+    if is_overload_error(exc):
+        return "rate limited"
+    return f"transient error: {type(exc).__name__}"
+
+
+async def call_upstream(
+    upstream: str,
+    func: Callable[..., T],
+    *args: Any,
+    retry: bool = True,
+    hedge: bool = False,
+    **kwargs: Any,
+) -> T:
+    """
+    Call a blocking upstream function with a deadline, retries and a circuit breaker.
+
+    Each attempt waits for a slot of the upstream's adaptive concurrency limit
+    and runs in the upstream executor. Transient failures (timeouts, 429, 5xx,
+    connection errors) are retried with jittered exponential backoff while the
+    upstream's retry budget allows; other errors are re-raised unchanged.
+
+    Note: `retry` and `hedge` are consumed here and never passed to func.
+
+    Args:
+        upstream: One of GEMINI, OPENAI_CHAT, WHISPER, SPACES
+        func: Synchronous callable (e.g. an SDK method)
+        *args: Positional arguments for func
+        retry: Retry transient failures (disable for calls that must not repeat)
+        hedge: Send a second request if the first is slow (cheap idempotent
+            calls only, e.g. downloads)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        UpstreamUnavailableError: If the breaker is open, no limiter slot became
+            available, or the call still failed transiently after its retries
+    """
+
+    call = functools.partial(func, *args, **kwargs)
+    timeout = _timeouts().get(upstream, settings.UPSTREAM_DEFAULT_TIMEOUT_SECONDS)
+    budget = get_retry_budget(upstream)
+    budget.deposit()
+
+    attempt = 1
+    while True:
+        try:
+            if hedge and settings.UPSTREAM_HEDGE_DELAY_SECONDS > 0:
+                return await _run_hedged(upstream, call, timeout)
+            return await _run_attempt(upstream, call, timeout)
+        except Exception as e:
+            if isinstance(e, UpstreamUnavailableError) and not isinstance(
+                e, UpstreamTimeoutError
+            ):
+                # Open breaker / full queue: retrying would only add load
+                raise
+            if not is_transient_error(e):
+                raise
+
+            if (
+                not retry
+                or attempt >= settings.UPSTREAM_RETRY_MAX_ATTEMPTS
+                or not budget.try_withdraw()
+            ):
+                reason = f"{_describe_failure(e)} after {attempt} attempt(s)"
+                if isinstance(e, UpstreamTimeoutError):
+                    raise UpstreamTimeoutError(upstream, reason) from e
+                raise UpstreamUnavailableError(upstream, reason) from e
+
+            delay = backoff_delay(
+                attempt,
+                settings.UPSTREAM_RETRY_BASE_DELAY_SECONDS,
+                settings.UPSTREAM_RETRY_MAX_DELAY_SECONDS,
+            )
+            metrics.increment(f"upstream.{upstream}.retries")
+            logger.warning(
+                f"🔁 Upstream '{upstream}' {_describe_failure(e)}, retry "
+                f"{attempt}/{settings.UPSTREAM_RETRY_MAX_ATTEMPTS - 1} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+__all__ = [
+    "GEMINI",
+    "OPENAI_CHAT",
+    "WHISPER",
+    "SPACES",
+    "call_upstream",
+    "get_circuit_breaker",
+    "get_retry_budget",
+    "get_upstream_limiter",
+    "is_overload_error",
+    "is_transient_error",
+]
@@ -0,0 +1,258 @@
+"""
+Adaptive concurrency limiter for one upstream API (Gemini, OpenAI, Whisper, Spaces).
+
+Each upstream gets an AdaptiveLimiter whose concurrency limit follows what the
+upstream can currently take (AIMD):
+- Additive increase: every successful call that ran while the limit was fully
+  used adds 1/limit, so the limit grows by about one per round trip
+- Multiplicative decrease: a rate-limit/overload error (429, 503, RESOURCE_EXHAUSTED,
+  SlowDown) multiplies the limit by `backoff`
+- Latency gradient: a success slower than `latency_tolerance` times the best
+  recent latency means the upstream is queueing, so the limit shrinks gently
+
+Decreases happen at most once per smoothed round trip, so one burst of failing
+in-flight calls does not collapse the limit to its minimum.
+
+Callers that do not get a slot wait in a bounded FIFO queue. When the queue is
+full, or a caller waited longer than `queue_timeout` seconds, UpstreamOverloadedError
+is raised right away instead of piling more work onto a struggling upstream.
+
+Metrics (per upstream, see GET /metrics):
+- upstream.<name>.limit / in_flight / queue_depth (gauges)
+- upstream.<name>.wait_seconds / latency_seconds (observations)
+- upstream.<name>.throttled / rejected / timeouts (counters)
+
+Usage (services go through src.utils.upstream.call_upstream instead):
+    limiter = AdaptiveLimiter("gemini", max_limit=16)
+    await limiter.acquire()
+    ...
+    limiter.release(latency, "success")  # or "overloaded" on a 429, "failed"
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from src.core.logger import logger
+from src.core.metrics import metrics
+
+
+class UpstreamUnavailableError(Exception):
+    """Raised when an upstream cannot serve a call right now (surfaced as 503)."""
+
+    state = "unavailable"
+
+    def __init__(self, upstream: str, reason: str):
+        self.upstream = upstream
+        self.reason = reason
+        super().__init__(f"Upstream '{upstream}' is {self.state} ({reason})")
+
+
+class UpstreamOverloadedError(UpstreamUnavailableError):
+    """Raised when an upstream's wait queue is full or a caller waited too long."""
+
+    state = "overloaded"
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with a bounded FIFO wait queue for one upstream"""
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        initial_limit: int = None,
+        min_limit: int = 1,
+        max_queue: int = 64,
+        queue_timeout: float = 30.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_window: int = 100,
+    ):
+        """
+        Create a limiter.
+
+        Args:
+            name: Upstream name (used in metrics and errors)
+            max_limit: Highest concurrency the limit may grow to
+            initial_limit: Starting limit (default: half of max_limit)
+            min_limit: Lowest concurrency the limit may shrink to
+            max_queue: Callers allowed to wait for a slot; more are rejected
+            queue_timeout: Seconds a caller may wait for a slot
+            backoff: Factor applied to the limit on a rate-limit/overload error
+            latency_tolerance: Latency (relative to the best recent latency) above
+                which a successful call counts as a congestion signal
+            latency_window: Calls after which the best recent latency is re-learned
+        """
+
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_window = latency_window
+
+        start = initial_limit if initial_limit else self.max_limit // 2
+        self._limit = float(min(self.max_limit, max(self.min_limit, start)))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self._smoothed_latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._samples_since_reset = 0
+        self._last_decrease = 0.0
+
+        self._publish_gauges()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers currently waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def has_capacity(self) -> bool:
+        """True if acquire() would get a slot without waiting."""
+        return not self._waiters and self._in_flight < self.limit
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot (FIFO).
+
+        Raises:
+            UpstreamOverloadedError: If the queue is full or the wait timed out
+        """
+
+        if self.has_capacity:
+            self._in_flight += 1
+            metrics.observe(f"upstream.{self.name}.wait_seconds", 0.0)
+            self._publish_gauges()
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            metrics.increment(f"upstream.{self.name}.rejected")
+            raise UpstreamOverloadedError(self.name, "wait queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._publish_gauges()
+        wait_start = time.perf_counter()
+
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        finally:
+            metrics.observe(
+                f"upstream.{self.name}.wait_seconds", time.perf_counter() - wait_start
+            )
+
+        if not done:
+            self._abandon(waiter)
+            metrics.increment(f"upstream.{self.name}.timeouts")
+            raise UpstreamOverloadedError(
+                self.name, f"no slot within {self.queue_timeout:.0f}s"
+            )
+
+    def release(self, latency: float, outcome: str) -> None:
+        """
+        Return a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Duration of the call in seconds
+            outcome: 'success', 'overloaded' or 'failed' (no limit change)
+        """
+
+        was_saturated = self._in_flight >= self.limit
+        self._in_flight -= 1
+
+        if outcome == "success":
+            self._on_success(latency, was_saturated)
+        elif outcome == "overloaded":
+            metrics.increment(f"upstream.{self.name}.throttled")
+            self._decrease(self.backoff, "rate limited")
+
+        self._wake_waiters()
+        self._publish_gauges()
+
+    def _on_success(self, latency: float, was_saturated: bool) -> None:
+        """Update latency statistics and grow (or gently shrink) the limit."""
+
+        metrics.observe(f"upstream.{self.name}.latency_seconds", latency)
+
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency = 0.8 * self._smoothed_latency + 0.2 * latency
+
+        # Re-learn the best latency regularly so a permanently slower upstream
+        # (bigger images, other model) does not look congested forever
+        self._samples_since_reset += 1
+        if self._samples_since_reset >= self.latency_window:
+            self._best_latency = self._smoothed_latency
+            self._samples_since_reset = 0
+        elif self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+
+        if latency > self.latency_tolerance * self._best_latency:
+            self._decrease(0.9, f"latency {latency:.2f}s")
+        elif was_saturated and self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        """Shrink the limit, at most once per smoothed round trip."""
+
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed_latency or 0.0):
+            return
+
+        self._last_decrease = now
+        old_limit = self.limit
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        if self.limit != old_limit:
+            logger.warning(
+                f"🚦 Upstream '{self.name}' limit {old_limit} → {self.limit} ({reason})"
+            )
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiting callers in FIFO order."""
+
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """Give up waiting; pass the slot on if it was granted meanwhile."""
+
+        if waiter.done() and not waiter.cancelled():
+            # The slot was handed over just as the caller gave up
+            self._in_flight -= 1
+            self._wake_waiters()
+        else:
+            waiter.cancel()
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+        self._publish_gauges()
+
+    def _publish_gauges(self) -> None:
+        metrics.set_gauge(f"upstream.{self.name}.limit", self.limit)
+        metrics.set_gauge(f"upstream.{self.name}.in_flight", self._in_flight)
+        metrics.set_gauge(f"upstream.{self.name}.queue_depth", len(self._waiters))
@@ -0,0 +1,68 @@
+"""
+Edit job worker for Nova Draw AI.
+
+Claims image edits queued by the edit endpoints in async mode (edit_jobs table)
+and runs them with the same ImageProcessingService pipeline as the synchronous
+endpoints. Run as many worker processes as needed; jobs are claimed with
+SELECT ... FOR UPDATE SKIP LOCKED so workers never pick up the same job.
+
+Usage:
+    python worker.py
+    python worker.py --concurrency 8 --poll-interval 0.5
+"""
+
+import argparse
+import asyncio
+import signal
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.services.edit_job_service import EditJobWorker
+from src.services.registry import services
+from src.services.story_pregeneration import story_pregenerator
+from src.utils.executor import shutdown_upstream_executor
+
+
+async def main(args: argparse.Namespace):
+    worker = EditJobWorker(
+        image_processing_service=services.image_processing,
+        worker_id=args.worker_id,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+    )
+
+    # Stop claiming new jobs on SIGINT/SIGTERM, but finish the ones in flight
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    try:
+        await worker.run(stop_event)
+    finally:
+        await story_pregenerator.shutdown()
+        shutdown_upstream_executor()
+        services.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the edit job worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.EDIT_JOB_WORKER_CONCURRENCY,
+        help="Jobs processed at the same time by this process",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.EDIT_JOB_POLL_INTERVAL_SECONDS,
+        help="Seconds to wait between polls when the queue is empty",
+    )
+    parser.add_argument(
+        "--worker-id", default=None, help="Worker name (default: hostname-pid)"
+    )
+    args = parser.parse_args()
+
+    logger.info("🚀 Starting edit job worker")
+    asyncio.run(main(args))
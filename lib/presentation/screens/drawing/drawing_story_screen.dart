@@ -305,7 +305,7 @@ class _DrawingStoryScreenState extends State<DrawingStoryScreen>
     }
   }
 
-  void _generateStory() async {
+  void _generateStory({bool regenerate = false}) async {
     // Check if we have an image URL or image data to generate story from
     if (widget.imageUrl == null && widget.drawingImage == null) {
       if (mounted) {
@@ -327,6 +327,7 @@ class _DrawingStoryScreenState extends State<DrawingStoryScreen>
         imageData: widget.drawingImage,
         imageUrl: widget.imageUrl,
         drawingId: widget.dbDrawingId,
+        regenerate: regenerate,
       );
 
       if (mounted) {
@@ -392,7 +393,7 @@ class _DrawingStoryScreenState extends State<DrawingStoryScreen>
       _errorMessage = null;
     });
     _slideController.reset();
-    _generateStory();
+    _generateStory(regenerate: true);
   }
 
   void _readStoryAloud() async {
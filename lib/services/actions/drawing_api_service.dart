@@ -296,6 +296,7 @@ class DrawingApiService {
     String?
     imageUrl, // URL of image from Spaces (optional if imageData provided)
     String? drawingId, // Optional drawing ID for linking story to drawing
+    bool regenerate = false, // Write a new story instead of a cached one
   }) async {
     return await BaseApiService.handleApiCall<ApiStoryResponse>(() async {
       print('📖 Starting story creation (bilingual EN + DE)...');
@@ -339,6 +340,10 @@ class DrawingApiService {
         body['drawing_id'] = drawingId;
       }
 
+      if (regenerate) {
+        body['regenerate'] = true;
+      }
+
       print('📤 Sending story creation request...');
 
       final response = await BaseApiService.post(